@@ -0,0 +1,195 @@
+import csv
+import io
+import logging
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterator, List, Optional, Set, TextIO
+
+
+DEFAULT_MAX_ERROR_RATE = 0.01
+# Records read before the error rate may abort a pass, so one early bad line is not 100%
+MIN_ERROR_RATE_ROWS = 1000
+# Good records joined into one piece of text handed to the parser
+RECORDS_PER_BLOCK = 1024
+REJECT_FILE_COLUMNS = ('line', 'fields', 'expected_fields', 'record')
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RejectSummary:
+    """Counts of malformed records set aside while reading, kept with the profile."""
+
+    rejected: int
+    rows_checked: int
+    reject_file: Optional[str] = None
+
+    @property
+    def error_rate(self) -> float:
+        return self.rejected / self.rows_checked if self.rows_checked else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    def describe(self) -> str:
+        """Render the counts as a one-line SQL comment."""
+        text = (f"-- Rejected rows: {self.rejected:,} of {self.rows_checked:,} "
+                f"({self.error_rate:.3%}) had the wrong number of fields")
+        if self.reject_file:
+            text += f"; written to {self.reject_file}"
+        return text
+
+
+class RejectLog:
+    """
+    Quarantine for CSV records with more fields than the header.
+
+    ``validate()`` wraps the text pandas would read and drops such records
+    before the parser sees them, so one malformed line no longer aborts a
+    read. Each is appended to ``path`` (a CSV of line number, field counts,
+    and the raw record) the first time it is seen; later passes over the
+    same file only count it. A pass stops with ``ValueError`` once more than
+    ``max_error_rate`` of its records were rejected (checked after
+    ``MIN_ERROR_RATE_ROWS`` records and again at the end of the file).
+    """
+
+    def __init__(self, path: Optional[str] = None, max_error_rate: float = DEFAULT_MAX_ERROR_RATE):
+        if not 0 <= max_error_rate <= 1:
+            raise ValueError("max_error_rate must be between 0 and 1")
+        self.path = path
+        self.max_error_rate = max_error_rate
+        self.rows_checked = 0
+        self._lines: Set[int] = set()
+        self._handle: Optional[TextIO] = None
+        self._writer = None
+
+    @property
+    def rejected(self) -> int:
+        return len(self._lines)
+
+    def summary(self) -> RejectSummary:
+        return RejectSummary(self.rejected, self.rows_checked, self.path if self._lines else None)
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+            self._writer = None
+
+    def validate(self, text: TextIO, read_options: Dict[str, Any]) -> TextIO:
+        """
+        Return a text stream of the records in ``text`` that ``pd.read_csv`` can parse.
+
+        ``read_options`` are the options the stream will be parsed with;
+        skipped lines and the header pass through unchanged, and the header
+        (or ``names``) sets the expected field count.
+        """
+        return _ValidatedText(self._good_blocks(text, read_options))
+
+    def _good_blocks(self, text: TextIO, read_options: Dict[str, Any]) -> Iterator[str]:
+        skip_rows = read_options.get('skiprows') or 0
+        passthrough = [text.readline() for _ in range(skip_rows)]
+        consumed = skip_rows
+
+        pending: List[str] = []
+
+        def lines() -> Iterator[str]:
+            for line in text:
+                pending.append(line)
+                yield line
+
+        reader = csv.reader(lines(),
+                            delimiter=read_options['delimiter'],
+                            quotechar=read_options['quotechar'],
+                            escapechar=read_options['escapechar'],
+                            doublequote=read_options['doublequote'])
+        expected = len(read_options['names']) if read_options.get('names') else None
+        if read_options.get('header', 'infer') is not None:
+            for fields in reader:
+                if fields:
+                    expected = len(fields)
+                    break
+            passthrough.extend(pending)
+            consumed += len(pending)
+            pending.clear()
+        yield ''.join(passthrough)
+        if expected is None:
+            return
+
+        good: List[str] = []
+        records = 0
+        rejected = 0
+        for fields in reader:
+            record = ''.join(pending)
+            line = consumed + 1
+            consumed += len(pending)
+            pending.clear()
+            if not fields:
+                good.append(record)  # blank lines are skipped by the parser
+                continue
+            if len(fields) <= expected:
+                good.append(record)
+            else:
+                rejected += 1
+                self._reject(line, len(fields), expected, record)
+            records += 1
+            if records >= MIN_ERROR_RATE_ROWS:
+                self._check_rate(rejected, records)
+            if len(good) >= RECORDS_PER_BLOCK:
+                self.rows_checked = max(self.rows_checked, records)
+                yield ''.join(good)
+                good.clear()
+        self.rows_checked = max(self.rows_checked, records)
+        self._check_rate(rejected, records)
+        if good:
+            yield ''.join(good)
+
+    def _reject(self, line: int, fields: int, expected: int, record: str) -> None:
+        if line in self._lines:
+            return
+        self._lines.add(line)
+        logger.debug("Rejected line %s: expected %s fields, saw %s", line, expected, fields)
+        if self.path is None:
+            return
+        if self._writer is None:
+            self._handle = open(self.path, 'w', encoding='utf-8', newline='')
+            self._writer = csv.writer(self._handle)
+            self._writer.writerow(REJECT_FILE_COLUMNS)
+        self._writer.writerow((line, fields, expected, record.rstrip('\r\n')))
+
+    def _check_rate(self, rejected: int, records: int) -> None:
+        if records and rejected / records > self.max_error_rate:
+            raise ValueError(
+                f"{rejected} of {records} rows had the wrong number of fields "
+                f"({rejected / records:.2%}), more than the allowed {self.max_error_rate:.2%}"
+            )
+
+
+class _ValidatedText(io.TextIOBase):
+    """Read-only text stream over blocks of text produced by a generator."""
+
+    def __init__(self, blocks: Iterator[str]):
+        self._blocks = blocks
+        self._buffer = ''
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: Optional[int] = -1) -> str:
+        parts = [self._buffer]
+        available = len(self._buffer)
+        while size is None or size < 0 or available < size:
+            block = next(self._blocks, None)
+            if block is None:
+                break
+            parts.append(block)
+            available += len(block)
+        text = ''.join(parts)
+        if size is None or size < 0:
+            self._buffer = ''
+            return text
+        self._buffer = text[size:]
+        return text[:size]
+
+    def close(self) -> None:
+        self._blocks.close()
+        super().close()
@@ -0,0 +1,404 @@
+import base64
+import logging
+import math
+import warnings
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+
+import numpy as np
+import pandas as pd
+
+
+HLL_PRECISION = 12
+EXACT_DISTINCT_LIMIT = 4096
+MIN_KEY_SAMPLE_ROWS = 100
+LOW_CARDINALITY_MAX_DISTINCT = 256
+LOW_CARDINALITY_RATIO = 0.05
+KEY_TYPES = ('integer', 'string')
+ORDERED_TYPES = ('integer', 'date')
+# Chunks inferred as these are hashed as text without a search for numbers
+TEXT_TYPES = ('string', 'date', 'json')
+_LEADING_ZERO = r'\s*[-+]?0\d'
+
+logger = logging.getLogger(__name__)
+
+
+class HyperLogLog:
+    """
+    Fixed-memory distinct-count sketch.
+
+    Values are hashed once, vectorised, with ``pd.util.hash_array`` /
+    ``hash_pandas_object`` by ``_canonical_hashes``, which hashes numbers by
+    value so chunks of a column read with different dtypes still merge.
+    Until ``EXACT_DISTINCT_LIMIT`` distinct hashes have been seen they are
+    also kept exactly, so typical samples get exact counts; past that only
+    the ``2 ** precision`` one-byte registers remain. Saved sketches keep
+    the registers and, while exact, the count alone (``exact_count``).
+    """
+
+    def __init__(self, precision: int = HLL_PRECISION):
+        if not 4 <= precision <= 16:
+            raise ValueError("precision must be between 4 and 16")
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+        self.exact_hashes: Optional[Set[int]] = set()
+        # Exact distinct count of a loaded sketch whose hashes were not saved
+        self.exact_count: Optional[int] = None
+
+    def add_series(self, series: pd.Series, numeric_text: bool = True) -> None:
+        """
+        Add every value of a (null-free) series to the sketch.
+
+        With ``numeric_text`` False, text is hashed as text without looking
+        for numbers in it, which is cheaper for columns known not to be numeric.
+        """
+        if len(series) == 0:
+            return
+        self.add_hashes(_canonical_hashes(series, numeric_text))
+
+    def add_hashes(self, hashes: np.ndarray) -> None:
+        p = self.precision
+        index = (hashes >> np.uint64(64 - p)).astype(np.intp)
+        remainder = hashes & np.uint64((1 << (64 - p)) - 1)
+        # frexp gives the exact bit length for values below 2**53, which the
+        # (64 - p)-bit remainder always is.
+        _, bit_length = np.frexp(remainder.astype(np.float64))
+        rank = ((64 - p) - bit_length + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+        self.exact_count = None
+        if self.exact_hashes is not None:
+            self.exact_hashes.update(np.unique(hashes).tolist())
+            if len(self.exact_hashes) > EXACT_DISTINCT_LIMIT:
+                self.exact_hashes = None
+
+    def merge(self, other: 'HyperLogLog') -> None:
+        """Fold another sketch of the same precision into this one."""
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge sketches with different precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        self.exact_count = None
+        if self.exact_hashes is not None and other.exact_hashes is not None:
+            self.exact_hashes |= other.exact_hashes
+            if len(self.exact_hashes) > EXACT_DISTINCT_LIMIT:
+                self.exact_hashes = None
+        else:
+            self.exact_hashes = None
+
+    @property
+    def relative_error(self) -> float:
+        """Standard error of the HyperLogLog estimate, relative to the true count."""
+        return 1.04 / math.sqrt(len(self.registers))
+
+    @property
+    def is_exact(self) -> bool:
+        return self.exact_hashes is not None or self.exact_count is not None
+
+    def estimate(self) -> float:
+        """Return the estimated number of distinct values added."""
+        if self.exact_hashes is not None:
+            return float(len(self.exact_hashes))
+        if self.exact_count is not None:
+            return float(self.exact_count)
+
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / float(np.sum(np.ldexp(1.0, -self.registers.astype(np.int64))))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            # Small-range correction (linear counting)
+            return m * math.log(m / zeros)
+        return raw
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialise the sketch to JSON-compatible values."""
+        return {
+            'precision': self.precision,
+            'registers': base64.b64encode(self.registers.tobytes()).decode('ascii'),
+            'exact_count': int(self.estimate()) if self.is_exact else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'HyperLogLog':
+        sketch = cls(data['precision'])
+        registers = np.frombuffer(base64.b64decode(data['registers']), dtype=np.uint8)
+        if len(registers) != len(sketch.registers):
+            raise ValueError("Sketch register count does not match its precision")
+        sketch.registers = registers.copy()
+        # Hashes are not restored; profiles written before exact_count list them
+        sketch.exact_hashes = None
+        exact_hashes = data.get('exact_hashes')
+        sketch.exact_count = len(exact_hashes) if exact_hashes is not None else data.get('exact_count')
+        return sketch
+
+
+@dataclass
+class ColumnStats:
+    """Mergeable per-column statistics gathered while reading."""
+
+    row_count: int = 0
+    null_count: int = 0
+    sketch: HyperLogLog = field(default_factory=HyperLogLog)
+    # Ordering is only tracked for integer/date columns (see ORDERED_TYPES)
+    non_decreasing: Optional[bool] = None
+    non_increasing: Optional[bool] = None
+    first_ordered: Optional[float] = None
+    last_ordered: Optional[float] = None
+
+    def update(self, series: pd.Series, inferred_type: Optional[str] = None) -> None:
+        non_null = series.dropna()
+        self.row_count += len(series)
+        self.null_count += len(series) - len(non_null)
+        self.sketch.add_series(non_null, numeric_text=inferred_type not in TEXT_TYPES)
+        if inferred_type in ORDERED_TYPES:
+            self._update_order(_ordering_values(non_null, inferred_type))
+
+    def merge(self, other: 'ColumnStats') -> None:
+        """Fold in statistics for rows that follow this chunk."""
+        self.row_count += other.row_count
+        self.null_count += other.null_count
+        self.sketch.merge(other.sketch)
+        if other.first_ordered is not None:
+            self._extend_order(other.first_ordered, other.last_ordered,
+                               bool(other.non_decreasing), bool(other.non_increasing))
+
+    def _update_order(self, values: np.ndarray) -> None:
+        if len(values) == 0:
+            return
+        self._extend_order(float(values[0]), float(values[-1]),
+                           bool(np.all(values[1:] >= values[:-1])),
+                           bool(np.all(values[1:] <= values[:-1])))
+
+    def _extend_order(self, first: float, last: float,
+                      non_decreasing: bool, non_increasing: bool) -> None:
+        """Append an ordered run summarised by its endpoints and direction."""
+        if self.first_ordered is None:
+            self.first_ordered = first
+            self.non_decreasing = non_decreasing
+            self.non_increasing = non_increasing
+        else:
+            self.non_decreasing = (
+                bool(self.non_decreasing) and non_decreasing and self.last_ordered <= first
+            )
+            self.non_increasing = (
+                bool(self.non_increasing) and non_increasing and self.last_ordered >= first
+            )
+        self.last_ordered = last
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialise the statistics to JSON-compatible values."""
+        return {
+            'row_count': self.row_count,
+            'null_count': self.null_count,
+            'sketch': self.sketch.to_dict(),
+            'non_decreasing': self.non_decreasing,
+            'non_increasing': self.non_increasing,
+            'first_ordered': self.first_ordered,
+            'last_ordered': self.last_ordered,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ColumnStats':
+        return cls(
+            row_count=data['row_count'],
+            null_count=data['null_count'],
+            sketch=HyperLogLog.from_dict(data['sketch']),
+            non_decreasing=data.get('non_decreasing'),
+            non_increasing=data.get('non_increasing'),
+            first_ordered=data.get('first_ordered'),
+            last_ordered=data.get('last_ordered'),
+        )
+
+    @property
+    def is_monotonic(self) -> bool:
+        """True when ordered values only ever rose, or only ever fell."""
+        if self.first_ordered is None or self.first_ordered == self.last_ordered:
+            return False
+        return bool(self.non_decreasing or self.non_increasing)
+
+    @property
+    def non_null_count(self) -> int:
+        return self.row_count - self.null_count
+
+    @property
+    def null_ratio(self) -> float:
+        return self.null_count / self.row_count if self.row_count else 0.0
+
+    @property
+    def distinct_estimate(self) -> int:
+        return min(int(round(self.sketch.estimate())), self.non_null_count)
+
+    @property
+    def is_exact(self) -> bool:
+        return self.sketch.is_exact
+
+    @property
+    def is_key_candidate(self) -> bool:
+        """
+        True when every observed value is present and distinct.
+
+        Past ``EXACT_DISTINCT_LIMIT`` distinct values this is an estimate: the
+        sketch must count all rows to within twice its relative error.
+        """
+        if self.row_count < MIN_KEY_SAMPLE_ROWS or self.null_count:
+            return False
+        if self.is_exact:
+            return self.distinct_estimate == self.row_count
+        return self.distinct_estimate >= self.row_count * (1 - 2 * self.sketch.relative_error)
+
+    @property
+    def is_low_cardinality(self) -> bool:
+        distinct = self.distinct_estimate
+        return (
+            self.non_null_count >= MIN_KEY_SAMPLE_ROWS
+            and distinct <= LOW_CARDINALITY_MAX_DISTINCT
+            and distinct <= self.non_null_count * LOW_CARDINALITY_RATIO
+        )
+
+
+def _canonical_hashes(series: pd.Series, numeric_text: bool = True) -> np.ndarray:
+    """
+    64-bit hashes of the values that do not depend on the dtype they were read with.
+
+    Numbers hash by value, integral ones as int64, so ``5``, ``5.0`` and
+    (with ``numeric_text``) the text ``'5'`` collide as they should; text
+    with a leading zero (``'007'``) stays text.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        categories = _canonical_hashes(pd.Series(series.cat.categories), numeric_text)
+        return categories[series.cat.codes.to_numpy()]
+    if pd.api.types.is_bool_dtype(series.dtype) or pd.api.types.is_integer_dtype(series.dtype):
+        return pd.util.hash_array(series.to_numpy(dtype=np.int64))
+    if pd.api.types.is_float_dtype(series.dtype):
+        return _number_hashes(series.to_numpy(dtype=np.float64))
+
+    text = series if pd.api.types.infer_dtype(series, skipna=True) == 'string' else series.astype(str)
+    hashes = pd.util.hash_pandas_object(text, index=False).to_numpy(dtype=np.uint64, copy=True)
+    if not numeric_text:
+        return hashes
+    numbers = pd.to_numeric(text, errors='coerce')
+    numeric = (numbers.notna() & ~text.str.match(_LEADING_ZERO)).to_numpy(dtype=bool)
+    if numeric.any():
+        values = numbers.to_numpy()[numeric]
+        if pd.api.types.is_integer_dtype(values.dtype):
+            hashes[numeric] = pd.util.hash_array(values.astype(np.int64))
+        else:
+            hashes[numeric] = _number_hashes(values.astype(np.float64))
+    return hashes
+
+
+def _number_hashes(values: np.ndarray) -> np.ndarray:
+    """Hash floats, with integral values hashed as the int64 they equal."""
+    hashes = pd.util.hash_array(values)
+    with np.errstate(invalid='ignore'):
+        integral = np.isfinite(values) & (values == np.round(values)) & (np.abs(values) < 2 ** 63)
+    if integral.any():
+        hashes[integral] = pd.util.hash_array(values[integral].astype(np.int64))
+    return hashes
+
+
+class ColumnProfiler:
+    """Accumulates ``ColumnStats`` for every column across one or more chunks."""
+
+    def __init__(self, precision: int = HLL_PRECISION):
+        self.precision = precision
+        self.stats: Dict[str, ColumnStats] = {}
+
+    def update(self,
+               df: pd.DataFrame,
+               type_info: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
+        """
+        Fold a chunk of rows into the running statistics.
+
+        When ``type_info`` is given, integer and date columns also track
+        whether their values arrive in sorted order.
+        """
+        type_info = type_info or {}
+        for col in df.columns:
+            if col not in self.stats:
+                self.stats[col] = ColumnStats(sketch=HyperLogLog(self.precision))
+            inferred_type = type_info.get(col, {}).get('inferred_type')
+            self.stats[col].update(df[col], inferred_type)
+
+    def merge(self, other: 'ColumnProfiler') -> None:
+        for col, stats in other.stats.items():
+            if col in self.stats:
+                self.stats[col].merge(stats)
+            else:
+                self.stats[col] = stats
+
+
+def _ordering_values(series: pd.Series, inferred_type: str) -> np.ndarray:
+    """Convert an integer or date column to comparable floats, dropping unparsable values."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Convert each category once, then expand by code
+        categories = _ordering_floats(pd.Series(series.cat.categories), inferred_type)
+        values = categories[series.cat.codes.to_numpy()]
+    else:
+        values = _ordering_floats(series, inferred_type)
+    return values[~np.isnan(values)]
+
+
+def _ordering_floats(series: pd.Series, inferred_type: str) -> np.ndarray:
+    """Convert values to floats, with NaN where a value does not parse."""
+    if inferred_type == 'date':
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            converted = pd.to_datetime(series, errors='coerce')
+        values = np.full(len(converted), np.nan)
+        parsed = converted.notna().to_numpy()
+        values[parsed] = converted[parsed].astype('int64').to_numpy(dtype=np.float64)
+        return values
+    return pd.to_numeric(series, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def suggest_constraints(stats: Dict[str, ColumnStats],
+                        type_info: Dict[str, Dict[str, Any]]) -> Dict[str, List[str]]:
+    """
+    Derive column constraints from observed statistics.
+
+    The first key-candidate integer or string column becomes the
+    ``PRIMARY KEY``; later key candidates get ``UNIQUE``; other fully
+    populated columns get ``NOT NULL``.
+
+    Returns:
+        Dict of column name -> list of constraint clauses
+    """
+    constraints: Dict[str, List[str]] = {}
+    primary_key = None
+    for col, col_stats in stats.items():
+        if col_stats.row_count == 0:
+            continue
+        inferred_type = type_info.get(col, {}).get('inferred_type')
+        if col_stats.is_key_candidate and inferred_type in KEY_TYPES:
+            if primary_key is None:
+                primary_key = col
+                constraints[col] = ['PRIMARY KEY']
+            else:
+                constraints[col] = ['NOT NULL', 'UNIQUE']
+        elif col_stats.null_count == 0:
+            constraints[col] = ['NOT NULL']
+    logger.debug("Primary key candidate: %s", primary_key)
+    return constraints
+
+
+def format_stats_report(stats: Dict[str, ColumnStats]) -> str:
+    """Render column statistics as a SQL comment block."""
+    lines = [
+        "-- Column statistics (distinct counts are estimates unless marked exact)",
+        "-- column | rows | nulls | null_ratio | distinct | flags",
+    ]
+    for col, col_stats in stats.items():
+        flags = []
+        if col_stats.is_key_candidate:
+            flags.append('key_candidate' if col_stats.is_exact else 'key_candidate~')
+        if col_stats.is_low_cardinality:
+            flags.append('low_cardinality')
+        if col_stats.is_monotonic:
+            flags.append('monotonic')
+        distinct = f"{col_stats.distinct_estimate}{'' if col_stats.is_exact else '~'}"
+        lines.append(
+            f"-- {col} | {col_stats.row_count} | {col_stats.null_count} | "
+            f"{col_stats.null_ratio:.3f} | {distinct} | {', '.join(flags) or '-'}"
+        )
+    return "\n".join(lines)
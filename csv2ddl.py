@@ -3,80 +3,318 @@
 CSV/Excel to SQL DDL Converter
 
 Converts CSV and Excel files to SQL DDL statements for various databases.
+``profile`` saves the inferred types and column statistics to a JSON
+artifact and ``render`` turns that artifact into DDL without re-reading
+the source; with neither subcommand both steps run in one go. ``unify``
+profiles many partitions of one table and renders a single union DDL, and
+``index`` builds the record-offset index used for row ranges and splits.
 """
 
 import argparse
+import json
 import logging
+import os
 import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from pathlib import Path
+from typing import Any, Dict, List, Optional
 
-from file_reader import FileReader
-from type_inference import TypeInferrer
+from bad_rows import DEFAULT_MAX_ERROR_RATE, RejectLog
+from column_stats import ColumnProfiler, format_stats_report, suggest_constraints
+from csv_sniffer import SNIFF_BYTES, CsvDialect
+from file_reader import (DEFAULT_CHUNK_ROWS, STDIN_PATH, WIDE_TABLE_COLUMNS, ColumnFilter, FileReader, FileSource,
+                         StreamSource)
+from fixed_width import FixedWidthLayout
+from layout_advisor import LayoutAdvisor
+from memory_budget import format_bytes, parse_byte_size, peak_memory_bytes
+from pipeline import DEFAULT_PIPELINE_DEPTH, run_pipeline
+from record_index import INDEX_SUFFIX, RecordIndex, RecordSelection, parse_row_range
+from progress import NULL_PROGRESS, PROGRESS_MODES, Progress, ProgressReporter
+from profile_artifact import TableProfile, dumps_profile, load_profile, save_profile
+from schema_drift import DRIFT_EXIT_CODE, DriftReport, SchemaBaseline
+from schema_union import format_partial_columns, union_profiles
+from type_inference import (AMBIGUITY_MARGIN, COLUMN_TIME_BUDGET, FALLBACK_PARAMETERS, MAX_PARSE_LENGTH,
+                            PARALLEL_BACKENDS, TypeInferrer, format_budget_exceeded)
 from dialect_mapper import DialectMapper
 from ddl_generator import DDLGenerator
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Convert CSV/Excel files to SQL DDL",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  python csv2ddl.py data.csv
-  python csv2ddl.py --dialect sqlite data.xlsx --sheet-name Sheet1
-  python csv2ddl.py --output schema.sql --table-name my_table data.csv
-        """
+DEFAULT_SAMPLE_SIZE = 1000
+# Drift checks read small chunks so a widened column stops the read early
+DRIFT_CHUNK_ROWS = 5000
+COMMANDS = ('profile', 'render', 'unify', 'index')
+PROFILE_SUFFIX = '.json'
+
+logger = logging.getLogger(__name__)
+
+
+def _source_size(source, selection: Optional[RecordSelection] = None) -> Optional[int]:
+    """Bytes of a CSV file on disk (or of its selected rows) to read; None for streams and workbooks."""
+    if isinstance(source, StreamSource) or FileReader.detect_file_type(source) != 'csv':
+        return None
+    return selection.nbytes if selection is not None else os.path.getsize(source)
+
+
+def scan_full_file(args, source, inferrer: TypeInferrer, profiler, chunk_rows: int,
+                   dialect: Optional[CsvDialect] = None,
+                   usecols: Optional[List[str]] = None,
+                   nrows: Optional[int] = None,
+                   progress: Progress = NULL_PROGRESS,
+                   stage: str = 'scan',
+                   rejects: Optional[RejectLog] = None,
+                   selection: Optional[RecordSelection] = None):
+    """
+    Infer types from every row, reading chunk N+1 while chunk N is profiled.
+
+    ``usecols`` and ``nrows`` restrict the scan to some columns and leading
+    rows, and ``selection`` to a range of rows found through the record index.
+
+    Returns:
+        Tuple of (merged type info, rows scanned)
+    """
+    type_info = {}
+    rows = 0
+
+    def profile_chunk(chunk):
+        nonlocal type_info, rows
+        chunk_types = inferrer.infer_types(chunk)
+        type_info = TypeInferrer.merge_types(type_info, chunk_types)
+        if profiler is not None:
+            profiler.update(chunk, chunk_types)
+        rows += len(chunk)
+        progress.advance(rows=len(chunk))
+
+    progress.start(stage, None if nrows else _source_size(source, selection))
+    chunks = FileReader.iter_chunks(
+        source,
+        chunk_rows=chunk_rows,
+        delimiter=args.delimiter,
+        encoding=args.encoding,
+        sheet_name=args.sheet_name,
+        max_columns=args.max_columns,
+        dialect=dialect,
+        usecols=usecols,
+        nrows=nrows,
+        progress=progress,
+        rejects=rejects,
+        selection=selection
     )
+    stats = run_pipeline(chunks, profile_chunk, depth=args.pipeline_depth)
+    logger.info(
+        "Scanned %s rows in %s chunks (%.1fs; read %.1fs, profile %.1fs)",
+        rows,
+        stats.chunks,
+        stats.wall_seconds,
+        stats.producer_seconds,
+        stats.consumer_seconds
+    )
+    return type_info, rows
+
+
+def rescan_ambiguous(args, source, inferrer: TypeInferrer, type_info, chunk_rows: int,
+                     dialect: Optional[CsvDialect] = None,
+                     progress: Progress = NULL_PROGRESS,
+                     rejects: Optional[RejectLog] = None,
+                     selection: Optional[RecordSelection] = None):
+    """
+    Re-read only the columns whose sampled evidence sat near a threshold.
+
+    The projected read covers ``--rescan-rows`` rows (default: all), and the
+    chunk results replace the sampled ones for those columns.
+    """
+    ambiguous = [col for col, info in type_info.items() if TypeInferrer.is_ambiguous(info)]
+    if not ambiguous:
+        logger.debug("No ambiguous columns to re-scan")
+        return type_info
+    if isinstance(source, StreamSource):
+        logger.warning("Cannot re-scan %s ambiguous columns: stream input is read once",
+                       len(ambiguous))
+        return type_info
+
+    logger.info("Re-scanning %s of %s columns with borderline evidence: %s",
+                len(ambiguous), len(type_info), ", ".join(map(str, ambiguous)))
+    rescanned, rows = scan_full_file(args, source, inferrer, None, chunk_rows, dialect,
+                                     usecols=ambiguous, nrows=args.rescan_rows,
+                                     progress=progress, stage='rescan', rejects=rejects,
+                                     selection=selection)
+    changed = 0
+    merged = dict(type_info)
+    for col in ambiguous:
+        info = {**rescanned[col], 'rescanned': True}
+        if info['snowflake_type'] != type_info[col]['snowflake_type']:
+            changed += 1
+            logger.debug("Column %s: %s -> %s after re-scan",
+                         col, type_info[col]['snowflake_type'], info['snowflake_type'])
+        merged[col] = info
+    logger.info("Re-scan of %s rows changed %s column types", rows, changed)
+    return merged
+
+
+def _add_input_arguments(parser: argparse.ArgumentParser, multiple: bool = False) -> None:
+    """Arguments that control how the source file (or files) is read and profiled."""
+    if multiple:
+        parser.add_argument(
+            'file_paths',
+            nargs='+',
+            help='CSV, Excel, or fixed-width files of one table, or profiles saved by csv2ddl profile'
+        )
+    else:
+        parser.add_argument(
+            'file_path',
+            help="Path to CSV, Excel, or fixed-width (.fwf, .dat) file, a named pipe, "
+                 "or '-' to read CSV from stdin"
+        )
 
     parser.add_argument(
-        'file_path',
-        help='Path to CSV or Excel file'
+        '--sample-size',
+        type=int,
+        help='Number of rows to sample for type inference '
+             '(default: 1000, or as many as --memory-budget allows)'
     )
 
     parser.add_argument(
-        '--dialect',
-        choices=DialectMapper.get_supported_dialects(),
-        default='snowflake',
-        help='SQL dialect (default: snowflake)'
+        '--memory-budget',
+        type=parse_byte_size,
+        help='Memory budget such as 512MB; sizes sample and chunk limits from a probe read '
+             'instead of the fixed 50,000-row cap'
     )
 
     parser.add_argument(
-        '--sample-size',
-        type=int,
-        default=1000,
-        help='Number of rows to sample for type inference (default: 1000)'
+        '--delimiter',
+        help=f'CSV delimiter (default: sniffed with quoting, header, and leading junk rows '
+             f'from the first {SNIFF_BYTES // 1024}KB)'
     )
 
+    _add_header_arguments(parser)
+
     parser.add_argument(
-        '--output',
-        help='Output file path (prints to stdout if not specified)'
+        '--encoding',
+        help='File encoding (auto-detected if not specified)'
     )
 
     parser.add_argument(
-        '--allow-outside-output',
+        '--sheet-name',
+        help='Excel sheet name (uses first sheet if not specified)'
+    )
+
+    parser.add_argument(
+        '--reject-file',
+        metavar='PATH',
+        help='Write CSV rows with more fields than the header to this file (with their line '
+             'numbers) and keep going, instead of failing on the first one'
+    )
+
+    parser.add_argument(
+        '--max-error-rate',
+        type=float,
+        default=DEFAULT_MAX_ERROR_RATE,
+        metavar='RATE',
+        help='With --reject-file, stop once more than this fraction of rows is rejected '
+             f'(default: {DEFAULT_MAX_ERROR_RATE})'
+    )
+
+    parser.add_argument(
+        '--index',
         action='store_true',
-        help='Permit writing output files outside the current working directory'
+        help=f'Build (or reuse while the file is unchanged) a sidecar index of record offsets, '
+             f'<file>{INDEX_SUFFIX}, so row ranges and random samples are read by seeking'
     )
 
     parser.add_argument(
-        '--table-name',
-        help='Custom table name (uses filename if not specified)'
+        '--row-range',
+        type=parse_row_range,
+        metavar='START:END',
+        help='Only read data rows START to END-1 (0-based; END may be omitted); uses --index'
     )
 
     parser.add_argument(
-        '--delimiter',
-        default=',',
-        help='CSV delimiter (default: ,)'
+        '--random-sample',
+        action='store_true',
+        help='Sample --sample-size rows uniformly from the whole file (or --row-range) '
+             'instead of its first rows; uses --index'
     )
 
     parser.add_argument(
-        '--encoding',
-        help='File encoding (auto-detected if not specified)'
+        '--fixed-width-layout',
+        metavar='PATH',
+        help='JSON field layout for a fixed-width file (any extension); without it, .fwf and '
+             '.dat files get boundaries inferred from blank columns'
     )
 
     parser.add_argument(
-        '--sheet-name',
-        help='Excel sheet name (uses first sheet if not specified)'
+        '--columns',
+        action='append',
+        metavar='PATTERNS',
+        help='Only read these columns: comma-separated names or regular expressions '
+             '(repeatable); other columns are never parsed'
+    )
+
+    parser.add_argument(
+        '--exclude-columns',
+        action='append',
+        metavar='PATTERNS',
+        help='Skip these columns when reading: comma-separated names or regular expressions '
+             '(repeatable)'
+    )
+
+    parser.add_argument(
+        '--excluded-type',
+        choices=list(FALLBACK_PARAMETERS),
+        help='Emit columns left out by --columns/--exclude-columns with this fixed type '
+             'instead of dropping them from the DDL'
+    )
+
+    parser.add_argument(
+        '--full-scan',
+        action='store_true',
+        help='Infer types from every row, streaming the file in chunks'
+    )
+
+    parser.add_argument(
+        '--chunk-rows',
+        type=int,
+        help=f'Rows per chunk for --full-scan (default: {DEFAULT_CHUNK_ROWS}, '
+             f'or sized by --memory-budget) and --baseline (default: {DRIFT_CHUNK_ROWS})'
+    )
+
+    parser.add_argument(
+        '--pipeline-depth',
+        type=int,
+        default=DEFAULT_PIPELINE_DEPTH,
+        help='Chunks read ahead while the previous chunk is profiled; '
+             f'0 disables overlap (default: {DEFAULT_PIPELINE_DEPTH})'
+    )
+
+    parser.add_argument(
+        '--rescan-ambiguous',
+        action='store_true',
+        help='After sampling, re-read only columns whose numeric/date evidence was '
+             f'within {AMBIGUITY_MARGIN * 100:.0f}%% of the decision threshold'
+    )
+
+    parser.add_argument(
+        '--rescan-rows',
+        type=int,
+        help='Rows read by --rescan-ambiguous (default: the whole file)'
+    )
+
+    parser.add_argument(
+        '--max-parse-length',
+        type=int,
+        default=MAX_PARSE_LENGTH,
+        metavar='CHARS',
+        help='Longer values are not tried as numbers or dates and count against those types '
+             f'(default: {MAX_PARSE_LENGTH})'
+    )
+
+    parser.add_argument(
+        '--column-time-budget',
+        type=float,
+        default=COLUMN_TIME_BUDGET,
+        metavar='SECONDS',
+        help='CPU seconds each column may spend on numeric, JSON, and date tests before it is '
+             f'typed as string and flagged; 0 disables the limit (default: {COLUMN_TIME_BUDGET})'
     )
 
     parser.add_argument(
@@ -85,87 +323,698 @@ Examples:
         help='Maximum allowed columns before aborting (default: 512)'
     )
 
+    parser.add_argument(
+        '--progress',
+        choices=PROGRESS_MODES,
+        help='Report bytes, rows, throughput, and ETA on stderr: a progress bar, log lines, '
+             'JSON lines, or auto (bar on a terminal, log lines otherwise)'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='Number of workers used to infer column types in parallel (default: 1, or one '
+             f'process per CPU for files with {WIDE_TABLE_COLUMNS}+ columns)'
+    )
+
+    parser.add_argument(
+        '--parallel-backend',
+        choices=PARALLEL_BACKENDS,
+        default='thread',
+        help='Worker pool used when --workers > 1 (default: thread; threads share the GIL, '
+             'so only I/O-bound sources gain from them)'
+    )
+
+
+def _add_header_arguments(parser: argparse.ArgumentParser) -> None:
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument(
+        '--header',
+        dest='header',
+        action='store_const',
+        const=True,
+        help='The first CSV row (after skipped rows) is a header (default: sniffed)'
+    )
+    group.add_argument(
+        '--no-header',
+        dest='header',
+        action='store_const',
+        const=False,
+        help='The CSV has no header row; columns are named column_1, column_2, ...'
+    )
+
+
+def _csv_dialect(args, path: FileSource) -> Optional[CsvDialect]:
+    """The sniffed or explicit CSV dialect of ``path`` with ``--header``/``--no-header`` applied."""
+    dialect = None
+    if args.delimiter is None:
+        dialect = FileReader.sniff_dialect(path, args.encoding)
+    elif args.header is not None:
+        dialect = CsvDialect(delimiter=args.delimiter)
+    if dialect is not None and args.header is not None:
+        dialect = replace(dialect, has_header=args.header)
+    return dialect
+
+
+def _add_render_arguments(parser: argparse.ArgumentParser) -> None:
+    """Arguments that only affect the rendered DDL."""
+    parser.add_argument(
+        '--dialect',
+        choices=DialectMapper.get_supported_dialects(),
+        default='snowflake',
+        help='SQL dialect (default: snowflake)'
+    )
+
+    parser.add_argument(
+        '--emit-constraints',
+        action='store_true',
+        help='Emit PRIMARY KEY / UNIQUE / NOT NULL based on observed column statistics'
+    )
+
+    parser.add_argument(
+        '--stats-report',
+        action='store_true',
+        help='Prepend estimated null ratios and distinct counts as SQL comments'
+    )
+
+    parser.add_argument(
+        '--layout-hints',
+        action='store_true',
+        help='Emit clustering, partitioning, or index suggestions for the dialect'
+    )
+
+
+def _add_output_arguments(parser: argparse.ArgumentParser, table_name_help: str) -> None:
+    parser.add_argument(
+        '--output', '-o',
+        help='Output file path (prints to stdout if not specified)'
+    )
+
+    parser.add_argument(
+        '--allow-outside-output',
+        action='store_true',
+        help='Permit writing output files outside the current working directory'
+    )
+
+    parser.add_argument(
+        '--table-name',
+        help=table_name_help
+    )
+
     parser.add_argument(
         '--verbose',
         action='store_true',
         help='Enable debug logging output for troubleshooting'
     )
 
-    args = parser.parse_args()
 
-    log_level = logging.DEBUG if args.verbose else logging.INFO
-    logging.basicConfig(
-        level=log_level,
-        format='%(levelname)s: %(message)s',
-        force=True
+def build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """Build the parser for a subcommand, or for the combined default mode."""
+    if command == 'profile':
+        parser = argparse.ArgumentParser(
+            prog='csv2ddl profile',
+            description="Infer column types and statistics and save them as a JSON profile"
+        )
+        _add_input_arguments(parser)
+        _add_output_arguments(parser, 'Table name stored in the profile (uses filename if not specified)')
+        return parser
+
+    if command == 'render':
+        parser = argparse.ArgumentParser(
+            prog='csv2ddl render',
+            description="Render SQL DDL from a saved profile without reading the source file"
+        )
+        parser.add_argument('profile_path', help='Profile written by csv2ddl profile')
+        _add_render_arguments(parser)
+        _add_output_arguments(parser, 'Table name (uses the name stored in the profile if not specified)')
+        return parser
+
+    if command == 'unify':
+        parser = argparse.ArgumentParser(
+            prog='csv2ddl unify',
+            description="Profile many files of one table and render a single union DDL"
+        )
+        _add_input_arguments(parser, multiple=True)
+        parser.add_argument(
+            '--file-workers',
+            type=int,
+            default=1,
+            help='Number of files profiled at once on the --parallel-backend pool (default: 1)'
+        )
+        _add_render_arguments(parser)
+        _add_output_arguments(parser, 'Table name for the union DDL (required)')
+        return parser
+
+    if command == 'index':
+        parser = argparse.ArgumentParser(
+            prog='csv2ddl index',
+            description="Build or refresh the record-offset index of a CSV file and print "
+                        "record-aligned splits for parallel readers"
+        )
+        parser.add_argument('file_path', help='Path to a CSV file')
+        parser.add_argument(
+            '--splits',
+            type=int,
+            default=1,
+            help='Number of row ranges of about equal size to print (default: 1)'
+        )
+        parser.add_argument(
+            '--rebuild',
+            action='store_true',
+            help='Rebuild the index even if it is current'
+        )
+        parser.add_argument('--delimiter', help='CSV delimiter (default: sniffed)')
+        _add_header_arguments(parser)
+        parser.add_argument('--encoding', help='File encoding (auto-detected if not specified)')
+        parser.add_argument('--verbose', action='store_true', help='Enable debug logging output')
+        return parser
+
+    parser = argparse.ArgumentParser(
+        description="Convert CSV/Excel files to SQL DDL",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python csv2ddl.py data.csv
+  python csv2ddl.py --dialect sqlite data.xlsx --sheet-name Sheet1
+  python csv2ddl.py --output schema.sql --table-name my_table data.csv
+  gunzip -c data.csv.gz | python csv2ddl.py --table-name my_table -
+  python csv2ddl.py profile data.csv -o data.profile.json
+  python csv2ddl.py render data.profile.json --dialect postgres
+  python csv2ddl.py --baseline last_week.profile.json this_week.csv
+  python csv2ddl.py unify --table-name events --file-workers 4 events/*.csv
+  python csv2ddl.py index big.csv --splits 8
+        """
+    )
+    _add_input_arguments(parser)
+    _add_render_arguments(parser)
+    parser.add_argument(
+        '--baseline',
+        help='Previous profile (JSON) or DDL for --dialect to check the file against instead '
+             f'of generating DDL; exits with status {DRIFT_EXIT_CODE} when columns were added, '
+             'removed, or widened'
     )
-    logger = logging.getLogger(__name__)
+    _add_output_arguments(parser, 'Custom table name (uses filename if not specified)')
+    return parser
 
-    try:
-        target_path = Path(args.file_path).expanduser()
 
-        # Validate file exists
-        if not target_path.exists():
-            logger.error("File '%s' not found", target_path)
-            sys.exit(1)
+@dataclass
+class InputSource:
+    """The source file or stream, and how it will be parsed."""
 
-        # Determine table name
-        if args.table_name:
-            table_name = args.table_name
-        else:
-            # Use filename without extension
-            table_name = target_path.stem
+    source: FileSource
+    table_name: Optional[str]
+    dialect: Optional[CsvDialect] = None
+    usecols: Optional[List[str]] = None
+    all_columns: Optional[List[str]] = None
+    # Rows the whole run reads (--row-range), and the rows sampled from them (--random-sample)
+    rows: Optional[RecordSelection] = None
+    sample: Optional[RecordSelection] = None
+
+
+def open_source(args) -> InputSource:
+    """Resolve the input path, sniff the CSV dialect or fixed-width layout, and apply column filters."""
+    target_path = Path(args.file_path).expanduser()
 
-        # Read file
-        logger.info("Reading file: %s", target_path)
-        df = FileReader.read_file(
-            file_path=str(target_path),
+    # Validate file exists
+    if args.file_path != STDIN_PATH and not target_path.exists():
+        raise FileNotFoundError(f"File '{target_path}' not found")
+
+    # Determine table name
+    if args.table_name:
+        table_name = args.table_name
+    elif args.file_path == STDIN_PATH:
+        table_name = None
+    else:
+        # Use filename without extension
+        table_name = target_path.stem
+
+    # Streams are opened once and read front to back; files are reopened by path
+    if FileReader.is_stream_path(args.file_path):
+        source = FileReader.open_stream(
+            args.file_path if args.file_path == STDIN_PATH else str(target_path)
+        )
+    else:
+        source = str(target_path)
+
+    if args.fixed_width_layout or FileReader.detect_file_type(source) == 'fixed_width':
+        if isinstance(source, StreamSource):
+            raise ValueError("Fixed-width input must be a file, not a stream")
+        layout = FixedWidthLayout.load(args.fixed_width_layout) if args.fixed_width_layout else None
+        source = FileReader.open_fixed_width(source, layout, args.encoding)
+        logger.info("%s fixed-width layout: %s",
+                    'Using' if args.fixed_width_layout else 'Inferred', source.layout.describe())
+
+    dialect = None
+    if FileReader.detect_file_type(source) == 'csv':
+        dialect = _csv_dialect(args, source)
+        if args.delimiter is None:
+            logger.info("Detected %s", dialect.describe().lstrip('- '))
+
+    # Projection is pushed into the parser so filtered-out columns are never materialised
+    usecols = None
+    all_columns = None
+    column_filter = ColumnFilter.from_args(args.columns, args.exclude_columns)
+    if column_filter:
+        all_columns = FileReader.read_columns(
+            source,
             delimiter=args.delimiter,
             encoding=args.encoding,
             sheet_name=args.sheet_name,
-            sample_size=args.sample_size,
-            max_columns=args.max_columns
+            dialect=dialect
         )
+        usecols = column_filter.select(all_columns)
+        if not usecols:
+            raise ValueError("No columns match --columns/--exclude-columns")
+        logger.info("Reading %s of %s columns", len(usecols), len(all_columns))
+
+    rows = sample = None
+    if args.index or args.row_range or args.random_sample:
+        if isinstance(source, StreamSource) or FileReader.detect_file_type(source) != 'csv':
+            raise ValueError("--index, --row-range and --random-sample need a CSV file on disk")
+        index = RecordIndex.open(source, dialect or CsvDialect(delimiter=args.delimiter))
+        start, end = args.row_range or (0, None)
+        if args.row_range:
+            rows = index.row_range(start, end)
+            logger.info("Reading rows %s to %s of %s", start, start + rows.rows, index.rows)
+        if args.random_sample:
+            sample = index.sample(args.sample_size or DEFAULT_SAMPLE_SIZE, start, end)
+            logger.info("Sampling %s rows at random", sample.rows)
+
+    return InputSource(source, table_name, dialect, usecols, all_columns, rows, sample)
 
-        if df.empty:
-            logger.error("File is empty or no data found")
-            sys.exit(1)
 
-        logger.info("Loaded %s rows, %s columns", len(df), len(df.columns))
+def check_drift(args, rejects: Optional[RejectLog] = None) -> DriftReport:
+    """
+    Compare the input against ``--baseline``, stopping at the first widened column.
+
+    Added and removed columns come from the header alone. Types are then
+    inferred chunk by chunk (the sample, or every row with ``--full-scan``)
+    and widened together, so reading stops as soon as one column outgrows
+    its baseline type.
+    """
+    baseline = SchemaBaseline.load(str(Path(args.baseline).expanduser()), args.dialect)
+    opened = open_source(args)
+    columns = opened.usecols or FileReader.read_columns(
+        opened.source,
+        delimiter=args.delimiter,
+        encoding=args.encoding,
+        sheet_name=args.sheet_name,
+        dialect=opened.dialect
+    )
+    report = DriftReport()
+    baseline.compare_columns(columns, report)
+
+    type_info = {}
+    chunk_rows = args.chunk_rows or DRIFT_CHUNK_ROWS
+    nrows = None if args.full_scan else (args.sample_size or DEFAULT_SAMPLE_SIZE)
+    chunks = FileReader.iter_chunks(
+        opened.source,
+        chunk_rows=chunk_rows,
+        delimiter=args.delimiter,
+        encoding=args.encoding,
+        sheet_name=args.sheet_name,
+        max_columns=args.max_columns,
+        dialect=opened.dialect,
+        usecols=opened.usecols,
+        nrows=nrows,
+        rejects=rejects,
+        selection=opened.rows if args.full_scan else (opened.sample or opened.rows)
+    )
+    with _create_inferrer(args) as inferrer:
+        for chunk in chunks:
+            type_info = TypeInferrer.merge_types(type_info, inferrer.infer_types(chunk))
+            report.rows_checked += len(chunk)
+            baseline.compare_types(type_info, report)
+            if report.widened:
+                # A short chunk, or one that reached the row limit, was the last
+                if len(chunk) == chunk_rows and (nrows is None or report.rows_checked < nrows):
+                    report.stopped_early = next(chunks, None) is not None
+                chunks.close()
+                break
+    return report
+
+
+def _create_inferrer(args) -> TypeInferrer:
+    return TypeInferrer(
+        workers=args.workers,
+        backend=args.parallel_backend,
+        max_parse_length=args.max_parse_length,
+        column_time_budget=args.column_time_budget or None,
+        full_scan=args.full_scan
+    )
+
 
-        # Infer types
-        logger.debug("Inferring data types")
-        inferrer = TypeInferrer()
-        type_info = inferrer.infer_types(df)
+def profile_source(args, collect_stats: bool, rejects: Optional[RejectLog] = None) -> TableProfile:
+    """
+    Read the source described by ``args`` and infer its column types.
+
+    With ``rejects``, CSV rows with too many fields are quarantined instead
+    of failing the read, and their count is kept in the profile.
+    """
+    opened = open_source(args)
+    source, table_name, dialect = opened.source, opened.table_name, opened.dialect
+    usecols, all_columns = opened.usecols, opened.all_columns
+
+    memory_plan = None
+    baseline_memory = None
+    if args.memory_budget:
+        # Interpreter and library memory is not charged to the budget
+        baseline_memory = peak_memory_bytes()
+        memory_plan = FileReader.plan_memory(
+            source,
+            args.memory_budget,
+            delimiter=args.delimiter,
+            encoding=args.encoding,
+            sheet_name=args.sheet_name,
+            max_columns=args.max_columns,
+            dialect=dialect,
+            usecols=usecols,
+            rejects=rejects,
+            selection=opened.sample or opened.rows,
+            collect_stats=collect_stats
+        )
+        logger.info(
+            "Memory budget %s: ~%s per row, sampling up to %s rows",
+            format_bytes(memory_plan.budget_bytes),
+            format_bytes(memory_plan.bytes_per_row),
+            memory_plan.sample_rows
+        )
+
+    profiler = ColumnProfiler() if collect_stats else None
+    progress = ProgressReporter(args.progress) if args.progress else NULL_PROGRESS
+
+    chunk_rows = args.chunk_rows or (
+        memory_plan.chunk_rows if memory_plan else DEFAULT_CHUNK_ROWS
+    )
+    with _create_inferrer(args) as inferrer:
+        if args.full_scan:
+            logger.info("Scanning full file: %s", source)
+            type_info, rows = scan_full_file(args, source, inferrer, profiler, chunk_rows, dialect,
+                                             usecols=usecols, progress=progress, rejects=rejects,
+                                             selection=opened.rows)
+            if rows == 0:
+                raise ValueError("File is empty or no data found")
+        else:
+            # Read file
+            logger.info("Reading file: %s", source)
+            progress.start('sample')
+            df = FileReader.read_file(
+                file_path=source,
+                delimiter=args.delimiter,
+                encoding=args.encoding,
+                sheet_name=args.sheet_name,
+                sample_size=args.sample_size or (None if memory_plan else DEFAULT_SAMPLE_SIZE),
+                max_columns=args.max_columns,
+                memory_plan=memory_plan,
+                dialect=dialect,
+                usecols=usecols,
+                progress=progress,
+                rejects=rejects,
+                selection=opened.sample or opened.rows
+            )
+            progress.advance(rows=len(df))
+
+            if df.empty:
+                raise ValueError("File is empty or no data found")
+
+            logger.info("Loaded %s rows, %s columns", len(df), len(df.columns))
+            rows = len(df)
+
+            # Infer types
+            logger.debug("Inferring data types")
+            progress.start('infer')
+            type_info = inferrer.infer_types(df)
+            if profiler is not None:
+                logger.debug("Profiling column statistics")
+                profiler.update(df, type_info)
+
+            if args.rescan_ambiguous:
+                del df
+                type_info = rescan_ambiguous(args, source, inferrer, type_info, chunk_rows, dialect,
+                                             progress, rejects, opened.rows)
+    progress.finish()
+
+    if all_columns is not None and args.excluded_type:
+        # Keep the file's column order, filling skipped columns with the fallback type
+        type_info = {
+            col: type_info.get(col) or TypeInferrer.fallback_type(args.excluded_type)
+            for col in all_columns
+        }
+
+    if memory_plan and baseline_memory is not None:
+        peak = peak_memory_bytes()
+        used = max(peak - baseline_memory, 0)
+        logger.info(
+            "Peak memory used: %s of %s budget (process peak %s)",
+            format_bytes(used),
+            format_bytes(memory_plan.budget_bytes),
+            format_bytes(peak)
+        )
+        if used > memory_plan.budget_bytes:
+            logger.warning("Peak memory exceeded the configured budget")
+
+    reject_summary = rejects.summary() if rejects is not None else None
+    if reject_summary is not None and reject_summary.rejected:
+        logger.warning("%s", reject_summary.describe().lstrip('- '))
+
+    return TableProfile(
+        source=str(source),
+        table_name=table_name,
+        row_count=rows,
+        type_info=type_info,
+        stats=profiler.stats if profiler is not None else None,
+        csv_dialect=dialect,
+        rejects=reject_summary
+    )
+
+
+def _profile_partition(args, path: str, collect_stats: bool) -> TableProfile:
+    """Profile one file of a ``unify`` run, or load its saved profile."""
+    if path.lower().endswith(PROFILE_SUFFIX):
+        return load_profile(str(Path(path).expanduser()))
+    partition_args = argparse.Namespace(**{**vars(args), 'file_path': path, 'table_name': None})
+    if args.file_workers > 1 and args.workers is None:
+        # Files are already profiled in parallel; do not start a pool per file
+        partition_args.workers = 1
+    reject_path = None
+    if args.reject_file:
+        # One reject file per input, e.g. rejects.csv -> rejects.events_01.csv
+        base = Path(args.reject_file)
+        reject_path = str(base.with_name(f"{base.stem}.{Path(path).stem}{base.suffix}"))
+    rejects = _open_reject_log(partition_args, reject_path)
+    try:
+        return profile_source(partition_args, collect_stats, rejects)
+    finally:
+        if rejects is not None:
+            rejects.close()
+
+
+def _create_file_executor(args) -> Executor:
+    if args.parallel_backend == 'process':
+        return ProcessPoolExecutor(max_workers=args.file_workers)
+    return ThreadPoolExecutor(max_workers=args.file_workers)
+
+
+def unify_sources(args, collect_stats: bool) -> TableProfile:
+    """
+    Profile every file in ``args.file_paths`` and merge them into one profile.
+
+    Files are profiled independently, ``--file-workers`` at a time, and
+    merged in the order given (see ``schema_union.union_profiles``).
+    """
+    if args.file_workers <= 0:
+        raise ValueError("--file-workers must be positive")
+    if STDIN_PATH in args.file_paths:
+        raise ValueError("unify reads files by path; stdin is not supported")
+
+    logger.info("Profiling %s files with %s workers", len(args.file_paths), args.file_workers)
+    if args.file_workers == 1:
+        profiles = [_profile_partition(args, path, collect_stats) for path in args.file_paths]
+    else:
+        with _create_file_executor(args) as executor:
+            futures = [
+                executor.submit(_profile_partition, args, path, collect_stats)
+                for path in args.file_paths
+            ]
+            profiles = [future.result() for future in futures]
+
+    if collect_stats and any(profile.stats is None for profile in profiles):
+        raise ValueError("Every input profile needs column statistics for the requested render options")
+    return union_profiles(profiles, args.table_name, args.dialect)
+
+
+def index_source(args) -> Dict[str, Any]:
+    """Build or refresh the record index of ``args.file_path`` and describe its splits."""
+    path = str(Path(args.file_path).expanduser())
+    if not os.path.isfile(path) or FileReader.detect_file_type(path) != 'csv':
+        raise ValueError(f"Only CSV files on disk can be indexed: {args.file_path}")
+    dialect = _csv_dialect(args, path) or CsvDialect(delimiter=args.delimiter)
+    index = RecordIndex.open(path, dialect, rebuild=args.rebuild)
+    return {
+        'file': path,
+        'index': RecordIndex.sidecar_path(path),
+        'rows': index.rows,
+        'header_bytes': int(index.offsets[0]),
+        'splits': [
+            {'rows': [start, end], 'bytes': [int(index.offsets[start]), int(index.offsets[end])]}
+            for start, end in index.split(args.splits)
+        ],
+    }
+
+
+def render_ddl(args, profile: TableProfile) -> str:
+    """Render DDL (plus any requested reports) for a profile."""
+    table_name = args.table_name or profile.table_name
+    if not table_name:
+        raise ValueError("--table-name is required when the source was read from stdin")
+
+    type_info = profile.type_info
+    column_constraints = None
+    report_sections = []
+    if profile.csv_dialect is not None:
+        report_sections.append(profile.csv_dialect.describe())
+    if profile.rejects is not None:
+        report_sections.append(profile.rejects.describe())
+    partial_columns = format_partial_columns(type_info)
+    if partial_columns:
+        report_sections.append(partial_columns)
+    budget_columns = format_budget_exceeded(type_info)
+    if budget_columns:
+        report_sections.append(budget_columns)
+    layout_hints = []
+    if args.emit_constraints or args.stats_report or args.layout_hints:
+        if profile.stats is None:
+            raise ValueError(
+                "The profile has no column statistics; --emit-constraints, "
+                "--stats-report and --layout-hints need them"
+            )
+        if args.emit_constraints:
+            column_constraints = suggest_constraints(profile.stats, type_info)
+        if args.stats_report:
+            report_sections.append(format_stats_report(profile.stats))
+        if args.layout_hints:
+            layout_hints = LayoutAdvisor(args.dialect).suggest(type_info, profile.stats)
+            if layout_hints:
+                report_sections.append(LayoutAdvisor.format_justifications(layout_hints))
+
+    # Map to dialect
+    logger.debug("Mapping to %s dialect", args.dialect)
+    mapper = DialectMapper(args.dialect)
+    column_types = mapper.map_column_types(type_info)
+
+    # Generate DDL
+    logger.debug("Generating DDL")
+    generator = DDLGenerator(args.dialect)
+    table_options, layout_statements = LayoutAdvisor(args.dialect).render(
+        generator.table_identifier(table_name),
+        layout_hints,
+        generator.resolve_column_identifiers(column_types)
+    )
+    ddl = generator.generate_ddl(
+        table_name,
+        column_types,
+        column_constraints=column_constraints,
+        table_options=table_options
+    )
+    return "\n\n".join(report_sections + [ddl] + layout_statements)
+
+
+def _open_reject_log(args, path: Optional[str] = None) -> Optional[RejectLog]:
+    """The bad-row quarantine requested by ``--reject-file``, or None."""
+    path = path or args.reject_file
+    if not path:
+        return None
+    return RejectLog(str(_resolve_writable_path(path, args.allow_outside_output)), args.max_error_rate)
+
+
+def _resolve_output_path(args) -> Optional[Path]:
+    if not args.output:
+        return None
+    return _resolve_writable_path(args.output, args.allow_outside_output)
+
+
+def _resolve_writable_path(path: str, allow_outside: bool) -> Path:
+    output_path = Path(path).expanduser()
+    resolved_output = output_path.resolve()
+    cwd = Path.cwd().resolve()
+
+    if not allow_outside and not str(resolved_output).startswith(str(cwd)):
+        raise PermissionError(
+            f"Refusing to write outside the working directory ({resolved_output}). "
+            "Use --allow-outside-output to override."
+        )
+
+    resolved_output.parent.mkdir(parents=True, exist_ok=True)
+    return resolved_output
+
+
+def main(argv: Optional[List[str]] = None):
+    argv = sys.argv[1:] if argv is None else argv
+    command = argv[0] if argv and argv[0] in COMMANDS else None
+    parser = build_parser(command)
+    args = parser.parse_args(argv[1:] if command else argv)
+
+    log_level = logging.DEBUG if args.verbose else logging.INFO
+    logging.basicConfig(
+        level=log_level,
+        format='%(levelname)s: %(message)s',
+        force=True
+    )
+
+    rejects = None
+    try:
+        if command == 'index':
+            print(json.dumps(index_source(args), indent=2))
+            return
+
+        if command is None and args.baseline:
+            rejects = _open_reject_log(args)
+            report = check_drift(args, rejects)
+            print(report.format())
+            if rejects is not None and rejects.rejected:
+                print(rejects.summary().describe())
+            if report.breaking:
+                sys.exit(DRIFT_EXIT_CODE)
+            return
+
+        if command == 'render':
+            profile = load_profile(str(Path(args.profile_path).expanduser()))
+            logger.debug("Loaded profile of %s (%s rows)", profile.source, profile.row_count)
+        elif command == 'unify':
+            if not args.table_name:
+                raise ValueError("--table-name is required for unify")
+            output_path = _resolve_output_path(args)
+            profile = unify_sources(
+                args, args.emit_constraints or args.stats_report or args.layout_hints
+            )
+        else:
+            if command is None and args.file_path == STDIN_PATH and not args.table_name:
+                raise ValueError("--table-name is required when reading from stdin")
+            # A saved profile always carries statistics so any render option works later
+            collect_stats = command == 'profile' or (
+                args.emit_constraints or args.stats_report or args.layout_hints
+            )
+            output_path = _resolve_output_path(args)
+            rejects = _open_reject_log(args)
+            profile = profile_source(args, collect_stats, rejects)
 
-        # Map to dialect
-        logger.debug("Mapping to %s dialect", args.dialect)
-        mapper = DialectMapper(args.dialect)
-        column_types = mapper.map_column_types(type_info)
+        if command == 'profile':
+            if output_path:
+                save_profile(profile, str(output_path))
+                logger.info("Profile written to: %s", output_path)
+            else:
+                print(dumps_profile(profile))
+            return
 
-        # Generate DDL
-        logger.debug("Generating DDL")
-        generator = DDLGenerator(args.dialect)
-        ddl = generator.generate_ddl(table_name, column_types)
+        ddl = render_ddl(args, profile)
+        if command == 'render':
+            output_path = _resolve_output_path(args)
 
         # Output
-        if args.output:
-            output_path = Path(args.output).expanduser()
-            resolved_output = output_path.resolve()
-            cwd = Path.cwd().resolve()
-
-            if not args.allow_outside_output and not str(resolved_output).startswith(str(cwd)):
-                logger.error(
-                    "Refusing to write outside the working directory (%s). "
-                    "Use --allow-outside-output to override.",
-                    resolved_output
-                )
-                sys.exit(1)
-
-            resolved_output.parent.mkdir(parents=True, exist_ok=True)
-            with open(resolved_output, 'w', encoding='utf-8') as f:
+        if output_path:
+            with open(output_path, 'w', encoding='utf-8') as f:
                 f.write(ddl)
-            logger.info("DDL written to: %s", resolved_output)
+            logger.info("DDL written to: %s", output_path)
         else:
             logger.debug("Writing DDL to stdout")
             print(ddl)
@@ -176,6 +1025,9 @@ Examples:
         else:
             logger.error("Error: %s", e)
         sys.exit(1)
+    finally:
+        if rejects is not None:
+            rejects.close()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,226 @@
+import csv
+import io
+import logging
+import re
+from collections import Counter
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+
+SNIFF_BYTES = 64 * 1024
+CANDIDATE_DELIMITERS = (',', ';', '\t', '|')
+QUOTE_CHARS = ('"', "'")
+MAX_SKIP_ROWS = 20
+
+_DIGITS = re.compile(r'\d')
+_LETTERS = re.compile(r'[^\W\d_]')
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CsvDialect:
+    """How to parse a CSV file; ``confidence`` is None when the settings were given explicitly."""
+
+    delimiter: str = ','
+    quotechar: str = '"'
+    escapechar: Optional[str] = None  # None means quotes are escaped by doubling
+    has_header: bool = True
+    skip_rows: int = 0
+    confidence: Optional[float] = None
+
+    @property
+    def doublequote(self) -> bool:
+        return self.escapechar is None
+
+    def read_options(self) -> Dict[str, Any]:
+        """Options for ``pd.read_csv`` (column names are handled by the reader)."""
+        options: Dict[str, Any] = {
+            'delimiter': self.delimiter,
+            'quotechar': self.quotechar,
+            'escapechar': self.escapechar,
+            'doublequote': self.doublequote,
+        }
+        if self.skip_rows:
+            options['skiprows'] = self.skip_rows
+        if not self.has_header:
+            options['header'] = None
+        return options
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    def describe(self) -> str:
+        """Render the dialect as a one-line SQL comment."""
+        escape = 'backslash-escaped quotes' if self.escapechar else 'doubled quotes'
+        header = 'header row' if self.has_header else 'no header row'
+        parts = [f"delimiter {self.delimiter!r}", f"quote {self.quotechar!r}", escape, header]
+        if self.skip_rows:
+            parts.append(f"{self.skip_rows} leading rows skipped")
+        if self.confidence is not None:
+            parts.append(f"confidence {self.confidence:.2f}")
+        return f"-- CSV dialect: {', '.join(parts)}"
+
+
+def sniff_dialect(sample: str, truncated: bool = False) -> CsvDialect:
+    """
+    Detect the CSV dialect of a text prefix.
+
+    Each candidate delimiter is scored by how consistently it splits rows
+    into the same number (> 1) of fields once leading junk rows (titles,
+    export banners) are skipped. Confidence is that consistency, discounted
+    when another delimiter splits the rows almost as well.
+
+    Args:
+        sample: Start of the file, decoded
+        truncated: True when ``sample`` is a prefix of a longer file, so the
+            last row may be cut short and is ignored
+    """
+    candidates = []
+    for delimiter in CANDIDATE_DELIMITERS:
+        quotechar = _detect_quotechar(sample, delimiter)
+        escapechar = _detect_escapechar(sample, quotechar)
+        records = _parse_records(sample, delimiter, quotechar, escapechar)
+        if truncated and len(records) > 1:
+            records = records[:-1]
+        width, consistency, skipped = _score_records(records)
+        candidates.append((consistency, width, delimiter, quotechar, escapechar, records, skipped))
+
+    # Delimiters that split rows at all come first, so one ragged row cannot lose
+    # the real delimiter to one that leaves every line whole (and perfectly
+    # consistent). Then highest consistency wins; ties go to the wider split,
+    # then to candidate order.
+    ranked = sorted(candidates, key=lambda c: (c[1] > 1, c[0], c[1]), reverse=True)
+    consistency, width, delimiter, quotechar, escapechar, records, skipped = ranked[0]
+    if width < 2 or consistency == 0:
+        logger.warning("No consistent delimiter found; assuming a single-column file with ','")
+        return CsvDialect(confidence=0.0)
+
+    runner_up = max(
+        (c[0] for c in ranked[1:] if c[1] > 1),
+        default=0.0
+    )
+    confidence = round(consistency * (1 - runner_up / 2), 2)
+
+    skip_rows = records[skipped - 1][1] if skipped else 0
+    body = [fields for fields, _ in records[skipped:] if fields]
+    dialect = CsvDialect(
+        delimiter=delimiter,
+        quotechar=quotechar,
+        escapechar=escapechar,
+        has_header=looks_like_header(body),
+        skip_rows=skip_rows,
+        confidence=confidence
+    )
+    logger.debug("Sniffed %s", dialect)
+    return dialect
+
+
+def _detect_quotechar(sample: str, delimiter: str) -> str:
+    """Pick the quote character that most often opens a field."""
+    counts = {}
+    for quote in QUOTE_CHARS:
+        pattern = rf'(?:^|{re.escape(delimiter)})[ \t]*{re.escape(quote)}'
+        counts[quote] = len(re.findall(pattern, sample, flags=re.MULTILINE))
+    return "'" if counts["'"] > counts['"'] else '"'
+
+
+def _detect_escapechar(sample: str, quotechar: str) -> Optional[str]:
+    """Return ``\\`` when quotes are backslash-escaped rather than doubled."""
+    backslashed = sample.count('\\' + quotechar)
+    if not backslashed:
+        return None
+    # Doubled quotes inside a field, not empty quoted fields
+    doubled = len(re.findall(rf'[^\s,;|\\]{re.escape(quotechar * 2)}', sample))
+    return '\\' if backslashed >= doubled else None
+
+
+def _parse_records(sample: str,
+                   delimiter: str,
+                   quotechar: str,
+                   escapechar: Optional[str]) -> List[Tuple[List[str], int]]:
+    """Parse ``sample`` into (fields, physical line number where the record ends)."""
+    reader = csv.reader(
+        io.StringIO(sample, newline=''),
+        delimiter=delimiter,
+        quotechar=quotechar,
+        escapechar=escapechar,
+        doublequote=escapechar is None
+    )
+    records = []
+    try:
+        for fields in reader:
+            records.append((fields, reader.line_num))
+    except csv.Error:
+        logger.debug("Delimiter %r could not parse the sample", delimiter)
+    return records
+
+
+def _score_records(records: List[Tuple[List[str], int]]) -> Tuple[int, float, int]:
+    """
+    Return (modal width, share of rows with that width, leading junk records).
+
+    Blank lines are ignored; leading records of a different width (up to
+    ``MAX_SKIP_ROWS``) count as junk rather than against consistency.
+    """
+    widths = [len(fields) for fields, _ in records if fields]
+    if not widths:
+        return 0, 0.0, 0
+    width = Counter(widths).most_common(1)[0][0]
+
+    skipped = 0
+    for fields, _ in records[:MAX_SKIP_ROWS]:
+        if fields and len(fields) == width:
+            break
+        skipped += 1
+    body = [len(fields) for fields, _ in records[skipped:] if fields]
+    if not body:
+        return width, 0.0, 0
+    return width, sum(1 for w in body if w == width) / len(body), skipped
+
+
+def looks_like_header(rows: List[List[str]]) -> bool:
+    """
+    Vote on whether the first row is a header, column by column.
+
+    The first row is kept as a header unless there is evidence against it:
+    a numeric cell, or a cell with digits shaped like the data below it
+    (e.g. another date), votes against. A text cell above numeric values,
+    or above values of a fixed length it does not share, votes for it.
+    Text shaped like text proves nothing, so all-text files keep their
+    header; ties keep it too.
+    """
+    if len(rows) < 2:
+        return True
+    header, data = rows[0], rows[1:]
+    votes = 0
+    for i, cell in enumerate(header):
+        column = [row[i] for row in data if len(row) > i and row[i] != '']
+        if not column or cell == '':
+            continue
+        if _is_number(cell):
+            votes -= 1
+        elif all(_is_number(value) for value in column):
+            votes += 1
+        elif _DIGITS.search(cell) and (
+            cell in column or {_shape(value) for value in column} == {_shape(cell)}
+        ):
+            votes -= 1
+        else:
+            lengths = {len(value) for value in column}
+            if len(lengths) == 1 and len(cell) not in lengths:
+                votes += 1
+    return votes >= 0
+
+
+def _shape(value: str) -> str:
+    """Collapse digits to 9 and letters to a, e.g. ``2024-01-31`` -> ``9999-99-99``."""
+    return _LETTERS.sub('a', _DIGITS.sub('9', value))
+
+
+def _is_number(value: str) -> bool:
+    try:
+        float(value.strip())
+    except ValueError:
+        return False
+    return True
@@ -1,8 +1,11 @@
 from dataclasses import dataclass
-from typing import Dict, Set
+from typing import Dict, List, Optional, Set
 import re
 
 
+_INVALID_IDENTIFIER_CHARS = re.compile(r'[^a-zA-Z0-9_]')
+
+
 COMMON_RESERVED_WORDS = {
     'add', 'all', 'alter', 'and', 'any', 'as', 'asc', 'between', 'by',
     'case', 'check', 'column', 'create', 'current', 'default',
@@ -59,7 +62,9 @@ class DDLGenerator:
     def generate_ddl(self,
                     table_name: str,
                     column_types: Dict[str, str],
-                    if_not_exists: bool = True) -> str:
+                    if_not_exists: bool = True,
+                    column_constraints: Optional[Dict[str, List[str]]] = None,
+                    table_options: Optional[List[str]] = None) -> str:
         """
         Generate CREATE TABLE DDL statement.
 
@@ -67,37 +72,67 @@ class DDLGenerator:
             table_name: Name of the table
             column_types: Dict of column_name -> sql_type
             if_not_exists: Whether to include IF NOT EXISTS clause
+            column_constraints: Optional dict of column_name -> constraint
+                clauses (e.g. ``['NOT NULL']``) appended after the type
+            table_options: Optional clauses placed after the column list
+                (e.g. ``['CLUSTER BY (event_date)']``)
 
         Returns:
             Complete CREATE TABLE statement
         """
         # Sanitize table name
-        table_name = self._sanitize_identifier(table_name)
+        table_name = self.table_identifier(table_name)
 
         # Build column definitions
+        identifiers = self.resolve_column_identifiers(column_types)
         columns = []
-        used_names = set()
-        used_normalized = set()
         for col_name, col_type in column_types.items():
-            sanitized_name = self._sanitize_identifier(col_name)
-            sanitized_name = self._avoid_reserved_word(sanitized_name)
-            unique_name = self._make_unique_identifier(sanitized_name, used_names, used_normalized)
-            used_names.add(unique_name)
-            used_normalized.add(self._normalize_identifier(unique_name))
-            columns.append(f"    {unique_name} {col_type}")
+            constraints = (column_constraints or {}).get(col_name)
+            if constraints:
+                # Constraints go before a column comment the dialect attached to the type
+                base_type, comment_sep, comment = col_type.partition(' COMMENT ')
+                col_type = f"{base_type} {' '.join(constraints)}{comment_sep}{comment}"
+            columns.append(f"    {identifiers[col_name]} {col_type}")
 
         columns_str = ",\n".join(columns)
 
         # Build DDL
         if_not_exists_clause = "IF NOT EXISTS " if if_not_exists else ""
-        ddl = f"CREATE TABLE {if_not_exists_clause}{table_name} (\n{columns_str}\n);"
+        options_str = "".join(f"\n{option}" for option in table_options or [])
+        ddl = f"CREATE TABLE {if_not_exists_clause}{table_name} (\n{columns_str}\n){options_str};"
 
         return ddl
 
+    def table_identifier(self, table_name: str) -> str:
+        """Return the sanitized identifier used for ``table_name``."""
+        return self._sanitize_identifier(table_name)
+
+    def resolve_column_identifiers(self, column_names) -> Dict[str, str]:
+        """
+        Map each source column name to its sanitized, unique SQL identifier.
+
+        Identifiers are assigned in input order, exactly as they appear in
+        the generated CREATE TABLE statement.
+        """
+        identifiers = {}
+        used_names = set()
+        used_normalized = set()
+        next_suffix = {}
+        for col_name in column_names:
+            sanitized_name = self._sanitize_identifier(col_name)
+            sanitized_name = self._avoid_reserved_word(sanitized_name)
+            unique_name = self._make_unique_identifier(
+                sanitized_name, used_names, used_normalized, next_suffix
+            )
+            used_names.add(unique_name)
+            used_normalized.add(self._normalize_identifier(unique_name))
+            identifiers[col_name] = unique_name
+        return identifiers
+
     def _sanitize_identifier(self, identifier: str) -> str:
         """Sanitize column/table names for SQL."""
         # Remove invalid characters, replace with underscore
-        sanitized = re.sub(r'[^a-zA-Z0-9_]', '_', identifier)
+        sanitized = _INVALID_IDENTIFIER_CHARS.sub('_', identifier)
 
         # Remove trailing underscores introduced by replacement
         sanitized = sanitized.rstrip('_')
@@ -121,13 +156,24 @@ class DDLGenerator:
             return self._append_suffix(identifier, suffix)
         return identifier
 
-    def _make_unique_identifier(self, base_name: str, existing: set, existing_normalized: set) -> str:
-        """Ensure identifier is unique within the current statement."""
+    def _make_unique_identifier(self,
+                                base_name: str,
+                                existing: set,
+                                existing_normalized: set,
+                                next_suffix: Optional[Dict[str, int]] = None) -> str:
+        """
+        Ensure identifier is unique within the current statement.
+
+        ``next_suffix`` remembers the last suffix probed per base name. Used
+        names are never released, so probing resumes where it stopped instead
+        of restarting at ``_1``; this keeps wide tables with many colliding
+        names linear while producing the same identifiers.
+        """
         normalized = self._normalize_identifier(base_name)
         if base_name not in existing and normalized not in existing_normalized:
             return base_name
 
-        suffix = 1
+        suffix = next_suffix.get(base_name, 1) if next_suffix is not None else 1
         candidate = f"{base_name}_{suffix}"
         normalized_candidate = self._normalize_identifier(candidate)
         while candidate in existing or normalized_candidate in existing_normalized:
@@ -135,6 +181,8 @@ class DDLGenerator:
             candidate = f"{base_name}_{suffix}"
             normalized_candidate = self._normalize_identifier(candidate)
 
+        if next_suffix is not None:
+            next_suffix[base_name] = suffix + 1
         return candidate
 
     @staticmethod
@@ -5,11 +5,20 @@ from abc import ABC, abstractmethod
 class Dialect(ABC):
     """Abstract base class for SQL dialects."""
 
+    # Unit of declared string lengths: 'char' or 'byte' (UTF-8)
+    LENGTH_SEMANTICS = 'char'
+
     @abstractmethod
     def map_type(self, inferred_type: str, params: Dict[str, Any]) -> str:
         """Map inferred type to dialect-specific SQL type."""
         pass
 
+    def string_length(self, params: Dict[str, Any]) -> int:
+        """Declared length of a string column in this dialect's ``LENGTH_SEMANTICS``."""
+        if self.LENGTH_SEMANTICS == 'byte' and 'max_bytes' in params:
+            return params['max_bytes']
+        return params.get('max_length', 255)
+
 
 class SnowflakeDialect(Dialect):
     """Snowflake SQL dialect mapper."""
@@ -24,8 +33,10 @@ class SnowflakeDialect(Dialect):
             precision = params.get('precision', 10)
             scale = params.get('scale', 2)
             return f'NUMBER({precision}, {scale})'
+        elif inferred_type == 'json':
+            return 'VARIANT'
         elif inferred_type == 'string':
-            max_length = params.get('max_length', 255)
+            max_length = self.string_length(params)
             return f'VARCHAR({max_length})'
         else:
             # Default fallback
@@ -42,6 +53,8 @@ class SQLiteDialect(Dialect):
             return 'INTEGER'
         elif inferred_type == 'float':
             return 'REAL'
+        elif inferred_type == 'json':
+            return 'TEXT'  # queried with the json1 functions
         elif inferred_type == 'string':
             return 'TEXT'
         else:
@@ -74,8 +87,10 @@ class PostgresDialect(Dialect):
             precision = max(scale + 1, min(precision, 1000))
             scale = min(scale, precision - 1)
             return f'NUMERIC({precision}, {scale})'
+        if inferred_type == 'json':
+            return 'JSONB'
         if inferred_type == 'string':
-            max_length = params.get('max_length', 255)
+            max_length = self.string_length(params)
             if max_length > 10485760:  # 10 MB upper bound for practical varchar sizing
                 return 'TEXT'
             return f'VARCHAR({max_length})'
@@ -85,6 +100,9 @@ class PostgresDialect(Dialect):
 class MySQLDialect(Dialect):
     """MySQL SQL dialect mapper."""
 
+    # utf8mb4 reserves 4 bytes per VARCHAR character against the 65,535-byte row limit
+    MAX_VARCHAR_LENGTH = 16383
+
     def map_type(self, inferred_type: str, params: Dict[str, Any]) -> str:
         if inferred_type == 'date':
             return 'DATE'
@@ -109,9 +127,11 @@ class MySQLDialect(Dialect):
             if scale >= precision:
                 precision = scale + 1
             return f'DECIMAL({precision}, {scale})'
+        if inferred_type == 'json':
+            return 'JSON'
         if inferred_type == 'string':
-            max_length = params.get('max_length', 255)
-            if max_length > 65535:
+            max_length = self.string_length(params)
+            if max_length > self.MAX_VARCHAR_LENGTH:
                 return 'TEXT'
             return f'VARCHAR({max_length})'
         return 'TEXT'
@@ -120,6 +140,8 @@ class MySQLDialect(Dialect):
 class OracleDialect(Dialect):
     """Oracle SQL dialect mapper."""
 
+    # VARCHAR2(n) counts bytes under the default NLS_LENGTH_SEMANTICS
+    LENGTH_SEMANTICS = 'byte'
     MAX_NUMERIC_PRECISION = 38
     MAX_VARCHAR_LENGTH = 4000
 
@@ -139,8 +161,11 @@ class OracleDialect(Dialect):
             if requested_precision > self.MAX_NUMERIC_PRECISION:
                 return 'NUMBER'
             return f'NUMBER({precision}, {scale})'
+        if inferred_type == 'json':
+            # The native JSON type needs 21c; CLOB holds JSON on every supported release
+            return 'CLOB'
         if inferred_type == 'string':
-            max_length = max(1, params.get('max_length', 255))
+            max_length = max(1, self.string_length(params))
             if max_length > self.MAX_VARCHAR_LENGTH:
                 return 'CLOB'
             return f'VARCHAR2({max_length})'
@@ -170,8 +195,10 @@ class SQLServerDialect(Dialect):
             precision = max(scale + 1, min(precision, 38))
             scale = min(scale, precision - 1)
             return f'DECIMAL({precision}, {scale})'
+        if inferred_type == 'json':
+            return 'NVARCHAR(MAX)'
         if inferred_type == 'string':
-            max_length = max(1, params.get('max_length', 255))
+            max_length = max(1, self.string_length(params))
             if max_length > 4000:
                 return 'NVARCHAR(MAX)'
             return f'NVARCHAR({max_length})'
@@ -201,8 +228,11 @@ class DatabricksDialect(Dialect):
             precision = max(scale + 1, min(precision, 38))
             scale = min(scale, precision - 1)
             return f'DECIMAL({precision}, {scale})'
+        if inferred_type == 'json':
+            # Parsed at query time with from_json / the : path operator
+            return "STRING COMMENT 'JSON'"
         if inferred_type == 'string':
-            max_length = max(1, params.get('max_length', 255))
+            max_length = max(1, self.string_length(params))
             if max_length > 65535:
                 return 'STRING'
             return f'VARCHAR({max_length})'
@@ -1,53 +1,249 @@
+import csv
+import io
 import logging
 import os
+import re
+import stat
+import sys
 import pandas as pd
-from typing import Optional
+from pandas.api.types import union_categoricals
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
 import chardet
 
+from bad_rows import RejectLog
+from csv_sniffer import SNIFF_BYTES, CsvDialect, sniff_dialect
+from fixed_width import FIXED_WIDTH_EXTENSIONS, FixedWidthLayout, FixedWidthSource
+
+from memory_budget import PROBE_ROWS, MemoryPlan
+from progress import NULL_PROGRESS, Progress, track_bytes
+from record_index import RecordSelection
+
 
 MAX_SAMPLE_ROWS = 50000
 DEFAULT_MAX_COLUMNS = 512
+WIDE_TABLE_COLUMNS = 1024
+DEFAULT_CHUNK_ROWS = 50000
+STDIN_PATH = '-'
+STREAM_PREFIX_BYTES = 64 * 1024
+ENCODING_DETECTION_BYTES = 10000
+# Sampled CSV rows are parsed in blocks of about this many cells, each
+# compacted before the next is parsed
+COMPACT_BLOCK_CELLS = 1_000_000
+MIN_COMPACT_BLOCK_ROWS = 1000
+# Text columns with at most this share of distinct values are stored as categoricals
+CATEGORICAL_MAX_DISTINCT_RATIO = 0.5
+
+try:
+    import pyarrow  # noqa: F401  (optional: compact Arrow-backed strings)
+    ARROW_STRING_DTYPE = pd.StringDtype('pyarrow')
+except ImportError:
+    ARROW_STRING_DTYPE = None
 
 logger = logging.getLogger(__name__)
 
 
+class _PrefixedStream(io.RawIOBase):
+    """Raw stream that replays an already-read prefix, then continues from the source."""
+
+    def __init__(self, prefix: bytes, source: BinaryIO):
+        self._prefix = memoryview(prefix)
+        self._source = source
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self._prefix:
+            size = min(len(buffer), len(self._prefix))
+            buffer[:size] = self._prefix[:size]
+            self._prefix = self._prefix[size:]
+            return size
+        data = self._source.read(len(buffer))
+        if not data:
+            return 0
+        buffer[:len(data)] = data
+        return len(data)
+
+
+class StreamSource:
+    """
+    Non-seekable CSV input such as stdin or a named pipe.
+
+    A bounded prefix (at least the header line) is buffered up front so
+    encoding detection, header checks, and memory probes can look at it;
+    ``open()`` then replays the prefix and continues with the rest of the
+    stream without spooling it to disk. The body can be read only once.
+    """
+
+    def __init__(self, raw: BinaryIO, name: str, prefix_bytes: int = STREAM_PREFIX_BYTES):
+        self.name = name
+        self._raw = raw
+        self._opened = False
+        chunks = []
+        size = 0
+        # Keep reading past the limit until the header line is complete
+        while size < prefix_bytes or not any(b'\n' in chunk for chunk in chunks):
+            data = raw.read(max(prefix_bytes - size, 4096))
+            if not data:
+                break
+            chunks.append(data)
+            size += len(data)
+        self.prefix = b''.join(chunks)
+
+    def __str__(self) -> str:
+        return self.name
+
+    def open(self) -> io.BufferedReader:
+        if self._opened:
+            raise ValueError(f"Stream input {self.name} can only be read once")
+        self._opened = True
+        return io.BufferedReader(_PrefixedStream(self.prefix, self._raw))
+
+
+FileSource = Union[str, StreamSource, FixedWidthSource]
+
+
+@dataclass(frozen=True)
+class ColumnFilter:
+    """
+    Include/exclude column patterns applied before parsing.
+
+    A pattern matches a column whose name equals it or which the pattern
+    matches as a full regular expression. With no include patterns every
+    column is included; exclusions always win.
+    """
+
+    include: Tuple[str, ...] = ()
+    exclude: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_args(cls,
+                  columns: Optional[List[str]] = None,
+                  exclude_columns: Optional[List[str]] = None) -> 'ColumnFilter':
+        """Build a filter from repeatable, comma-separated CLI values."""
+        def split(values):
+            return tuple(p.strip() for value in values or [] for p in value.split(',') if p.strip())
+        return cls(split(columns), split(exclude_columns))
+
+    def __bool__(self) -> bool:
+        return bool(self.include or self.exclude)
+
+    def matches(self, name) -> bool:
+        name = str(name)
+        if self.include and not any(_pattern_matches(p, name) for p in self.include):
+            return False
+        return not any(_pattern_matches(p, name) for p in self.exclude)
+
+    def select(self, columns: List[str]) -> List[str]:
+        return [col for col in columns if self.matches(col)]
+
+
+def _pattern_matches(pattern: str, name: str) -> bool:
+    if pattern == name:
+        return True
+    try:
+        return re.fullmatch(pattern, name) is not None
+    except re.error:
+        # Not a valid regex, so only an exact name match counts
+        return False
+
+
 class FileReader:
-    """Main class for reading CSV and Excel files with automatic type detection."""
+    """Main class for reading CSV, Excel, and fixed-width files with automatic type detection."""
+
+    @staticmethod
+    def is_stream_path(file_path: str) -> bool:
+        """True for ``-`` (stdin) and for named pipes or character devices."""
+        if file_path == STDIN_PATH:
+            return True
+        try:
+            mode = os.stat(file_path).st_mode
+        except OSError:
+            return False
+        return stat.S_ISFIFO(mode) or stat.S_ISCHR(mode)
+
+    @staticmethod
+    def open_stream(file_path: str) -> StreamSource:
+        """Open stdin (``-``) or a named pipe as a ``StreamSource``."""
+        if file_path == STDIN_PATH:
+            return StreamSource(sys.stdin.buffer, '<stdin>')
+        return StreamSource(open(file_path, 'rb'), file_path)
 
     @staticmethod
-    def detect_file_type(file_path: str) -> str:
-        """Detect file type based on extension."""
+    def open_fixed_width(file_path: FileSource,
+                         layout: Optional[FixedWidthLayout] = None,
+                         encoding: Optional[str] = None) -> FixedWidthSource:
+        """Pair a fixed-width file with ``layout``, inferring it when None; sources pass through."""
+        if isinstance(file_path, FixedWidthSource):
+            return file_path
+        encoding = encoding or FileReader._detect_encoding(file_path)
+        return FixedWidthSource.open(file_path, layout, encoding)
+
+    @staticmethod
+    def detect_file_type(file_path: FileSource) -> str:
+        """Detect file type based on extension; streams are always CSV."""
+        if isinstance(file_path, StreamSource):
+            return 'csv'
+        if isinstance(file_path, FixedWidthSource):
+            return 'fixed_width'
         _, ext = os.path.splitext(file_path.lower())
         if ext == '.csv':
             return 'csv'
         elif ext == '.xlsx':
             return 'excel'
+        elif ext in FIXED_WIDTH_EXTENSIONS:
+            return 'fixed_width'
         else:
-            raise ValueError(f"Unsupported file type: {ext}. Supported: .csv, .xlsx")
+            raise ValueError(f"Unsupported file type: {ext}. "
+                             f"Supported: .csv, .xlsx, {', '.join(FIXED_WIDTH_EXTENSIONS)}")
 
     @staticmethod
-    def read_file(file_path: str,
-                  delimiter: str = ',',
+    def read_file(file_path: FileSource,
+                  delimiter: Optional[str] = ',',
                   encoding: Optional[str] = None,
                   sheet_name: Optional[str] = None,
                   sample_size: Optional[int] = None,
-                  max_columns: Optional[int] = None) -> pd.DataFrame:
+                  max_columns: Optional[int] = None,
+                  memory_plan: Optional[MemoryPlan] = None,
+                  dialect: Optional[CsvDialect] = None,
+                  usecols: Optional[List[str]] = None,
+                  progress: Progress = NULL_PROGRESS,
+                  rejects: Optional[RejectLog] = None,
+                  selection: Optional[RecordSelection] = None) -> pd.DataFrame:
         """
-        Read CSV or Excel file and return DataFrame.
+        Read CSV, Excel, or fixed-width file and return DataFrame.
 
         Args:
-            file_path: Path to the file
-            delimiter: CSV delimiter (ignored for Excel)
-            encoding: File encoding (auto-detected for CSV if None)
+            file_path: Path to the file, a ``StreamSource``, or a ``FixedWidthSource``
+            delimiter: CSV delimiter (ignored for Excel); None sniffs the dialect
+            encoding: File encoding (auto-detected for CSV and fixed-width if None)
             sheet_name: Excel sheet name (uses first sheet if None)
             sample_size: Number of rows to read (None for all)
+            max_columns: Maximum allowed column count
+            memory_plan: Budget-derived limits; replaces the fixed
+                ``MAX_SAMPLE_ROWS`` cap and sizes the default sample
+            dialect: Full CSV dialect, e.g. from ``sniff_dialect``; overrides ``delimiter``
+            usecols: Columns to parse; the rest are skipped by the parser
+            progress: Receives bytes read from CSV input
+            rejects: Quarantine for CSV records with too many fields; without
+                one such a record makes the read fail
+            selection: Rows of a CSV file to read, from its ``RecordIndex``
 
         Returns:
             pandas DataFrame with the file data
         """
         file_type = FileReader.detect_file_type(file_path)
 
-        bounded_sample = FileReader._sanitize_sample_size(sample_size)
+        if memory_plan is not None:
+            bounded_sample = FileReader._sanitize_sample_size(
+                sample_size or memory_plan.sample_rows,
+                memory_plan.sample_rows
+            )
+        else:
+            bounded_sample = FileReader._sanitize_sample_size(sample_size)
 
         logger.debug(
             "Preparing to read %s as %s (sample_size=%s)",
@@ -57,9 +253,15 @@ class FileReader:
         )
 
         if file_type == 'csv':
-            df = FileReader._read_csv(file_path, delimiter, encoding, bounded_sample)
+            df = FileReader._read_csv(file_path, delimiter, encoding, bounded_sample, max_columns,
+                                      dialect, usecols, progress, rejects, selection)
         elif file_type == 'excel':
-            df = FileReader._read_excel(file_path, sheet_name, bounded_sample)
+            df = FileReader.compact_frame(
+                FileReader._read_excel(file_path, sheet_name, bounded_sample, usecols)
+            )
+        elif file_type == 'fixed_width':
+            source = FileReader.open_fixed_width(file_path, encoding=encoding)
+            df = FileReader.compact_frame(source.read(bounded_sample, usecols))
         else:
             raise ValueError(f"Unsupported file type: {file_type}")
 
@@ -67,45 +269,425 @@ class FileReader:
         return df
 
     @staticmethod
-    def _read_csv(file_path: str,
-                  delimiter: str = ',',
+    def iter_chunks(file_path: FileSource,
+                    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                    delimiter: Optional[str] = ',',
+                    encoding: Optional[str] = None,
+                    sheet_name: Optional[str] = None,
+                    max_columns: Optional[int] = None,
+                    dialect: Optional[CsvDialect] = None,
+                    usecols: Optional[List[str]] = None,
+                    nrows: Optional[int] = None,
+                    progress: Progress = NULL_PROGRESS,
+                    rejects: Optional[RejectLog] = None,
+                    selection: Optional[RecordSelection] = None) -> Iterator[pd.DataFrame]:
+        """
+        Yield the whole file as consecutive DataFrames of at most ``chunk_rows`` rows.
+
+        CSV files, streams, and fixed-width files are read incrementally;
+        Excel workbooks cannot be and are yielded as a single chunk. ``usecols`` projects the read
+        onto a subset of columns, so the parser skips converting the rest,
+        and ``nrows`` stops after that many data rows. Bytes read from CSV
+        input are reported to ``progress``, and malformed CSV records are
+        diverted to ``rejects`` when given. ``selection`` limits a CSV file
+        to some of its rows, read by seeking to their offsets.
+        """
+        if chunk_rows <= 0:
+            raise ValueError("chunk_rows must be positive")
+
+        file_type = FileReader.detect_file_type(file_path)
+        if file_type == 'excel':
+            df = FileReader._read_excel(file_path, sheet_name, nrows, usecols)
+            FileReader._validate_column_count(df, max_columns)
+            yield df
+            return
+        if file_type == 'fixed_width':
+            source = FileReader.open_fixed_width(file_path, encoding=encoding)
+            logger.debug("Streaming %s in chunks of %s rows", source, chunk_rows)
+            for chunk in source.iter_chunks(chunk_rows, nrows, usecols):
+                FileReader._validate_column_count(chunk, max_columns)
+                yield chunk
+            return
+
+        read_options = FileReader._csv_read_options(file_path, delimiter, encoding, max_columns,
+                                                    dialect, usecols)
+        logger.debug("Streaming %s in chunks of %s rows", file_path, chunk_rows)
+        with FileReader._open_csv_input(file_path, progress, rejects, read_options,
+                                        selection) as source, \
+                pd.read_csv(source,
+                            chunksize=chunk_rows,
+                            usecols=usecols,
+                            nrows=nrows,
+                            **read_options) as reader:
+            for chunk in reader:
+                FileReader._validate_column_count(chunk, max_columns)
+                yield chunk
+
+    @staticmethod
+    def plan_memory(file_path: FileSource,
+                    budget_bytes: int,
+                    delimiter: Optional[str] = ',',
+                    encoding: Optional[str] = None,
+                    sheet_name: Optional[str] = None,
+                    max_columns: Optional[int] = None,
+                    dialect: Optional[CsvDialect] = None,
+                    usecols: Optional[List[str]] = None,
+                    rejects: Optional[RejectLog] = None,
+                    selection: Optional[RecordSelection] = None,
+                    collect_stats: bool = False) -> MemoryPlan:
+        """
+        Probe the first rows of a file and size read limits to fit ``budget_bytes``.
+
+        Set ``collect_stats`` when column statistics will be gathered so their
+        memory is reserved from the budget. Samples are compacted but chunks
+        are not, so the probe is measured both ways.
+        """
+        if isinstance(file_path, StreamSource):
+            # Probe the buffered prefix so the stream itself is not consumed
+            read_options = FileReader._csv_read_options(file_path, delimiter, encoding, max_columns,
+                                                    dialect)
+            if rejects is not None:
+                # Bad rows are quarantined when the stream itself is read
+                read_options['on_bad_lines'] = 'skip'
+            probe = pd.read_csv(io.BytesIO(FileReader._complete_lines(file_path.prefix)),
+                                nrows=PROBE_ROWS,
+                                **read_options)
+        else:
+            chunks = FileReader.iter_chunks(file_path,
+                                            chunk_rows=PROBE_ROWS,
+                                            delimiter=delimiter,
+                                            encoding=encoding,
+                                            sheet_name=sheet_name,
+                                            max_columns=max_columns,
+                                            dialect=dialect,
+                                            usecols=usecols,
+                                            nrows=PROBE_ROWS,
+                                            rejects=rejects,
+                                            selection=selection)
+            try:
+                probe = next(chunks, pd.DataFrame())
+            finally:
+                chunks.close()
+        return MemoryPlan.from_probe(FileReader.compact_frame(probe.copy()),
+                                     budget_bytes,
+                                     collect_stats,
+                                     chunk_probe=probe)
+
+    @staticmethod
+    def read_columns(file_path: FileSource,
+                     delimiter: Optional[str] = ',',
+                     encoding: Optional[str] = None,
+                     sheet_name: Optional[str] = None,
+                     dialect: Optional[CsvDialect] = None) -> List[str]:
+        """Return the column names (as pandas would name them) without reading any rows."""
+        file_type = FileReader.detect_file_type(file_path)
+        if file_type == 'excel':
+            return list(FileReader._read_excel(file_path, sheet_name, 1).columns)
+        if file_type == 'fixed_width':
+            return FileReader.open_fixed_width(file_path, encoding=encoding).layout.names
+
+        read_options = FileReader._csv_read_options(file_path, delimiter, encoding, None, dialect)
+        if isinstance(file_path, StreamSource):
+            source = io.BytesIO(FileReader._complete_lines(file_path.prefix))
+        else:
+            source = file_path
+        return list(pd.read_csv(source, nrows=0, **read_options).columns)
+
+    @staticmethod
+    def _read_csv(file_path: FileSource,
+                  delimiter: Optional[str] = ',',
                   encoding: Optional[str] = None,
-                  sample_size: Optional[int] = None) -> pd.DataFrame:
+                  sample_size: Optional[int] = None,
+                  max_columns: Optional[int] = None,
+                  dialect: Optional[CsvDialect] = None,
+                  usecols: Optional[List[str]] = None,
+                  progress: Progress = NULL_PROGRESS,
+                  rejects: Optional[RejectLog] = None,
+                  selection: Optional[RecordSelection] = None) -> pd.DataFrame:
         """Read CSV file with encoding detection."""
-        if encoding is None:
-            # Auto-detect encoding
-            with open(file_path, 'rb') as f:
-                raw_data = f.read(10000)  # Read first 10KB for detection
-                detected = chardet.detect(raw_data)
-                encoding = detected.get('encoding', 'utf-8')
+        read_options = FileReader._csv_read_options(file_path, delimiter, encoding, max_columns,
+                                                    dialect, usecols)
 
-        # Read CSV
+        # Read CSV in blocks so only one block is ever held as uncompacted text
         nrows = sample_size if sample_size else None
-        df = pd.read_csv(file_path,
-                        delimiter=delimiter,
-                        encoding=encoding,
-                        nrows=nrows)
+        with FileReader._open_csv_input(file_path, progress, rejects, read_options,
+                                        selection) as source, \
+                pd.read_csv(source,
+                            nrows=nrows,
+                            usecols=usecols,
+                            chunksize=MIN_COMPACT_BLOCK_ROWS,
+                            **read_options) as reader:
+            first = reader.get_chunk()
+            block_rows = max(COMPACT_BLOCK_CELLS // max(len(first.columns), 1), MIN_COMPACT_BLOCK_ROWS)
+            blocks = [FileReader.compact_frame(first)]
+            del first
+            while True:
+                try:
+                    blocks.append(FileReader.compact_frame(reader.get_chunk(block_rows)))
+                except StopIteration:
+                    break
+        return FileReader._concat_blocks(blocks)
+
+    @staticmethod
+    def compact_frame(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Store the text columns of ``df`` compactly, in place.
+
+        Repetitive columns (at most ``CATEGORICAL_MAX_DISTINCT_RATIO``
+        distinct values) become categoricals; other string columns become
+        Arrow-backed strings when pyarrow is installed. Columns holding
+        mixed Python types are left as they are.
+        """
+        for col in df.columns:
+            series = df[col]
+            compacted = FileReader._compact_column(series)
+            # Assigning a column costs time on wide frames; skip unchanged ones
+            if compacted is not series:
+                df[col] = compacted
         return df
 
     @staticmethod
-    def _read_excel(file_path: str,
+    def _compact_column(series: pd.Series) -> pd.Series:
+        dtype = series.dtype
+        if isinstance(dtype, pd.StringDtype):
+            is_object = False
+        elif (pd.api.types.is_object_dtype(dtype)
+              and pd.api.types.infer_dtype(series, skipna=True) == 'string'):
+            is_object = True
+        else:
+            return series
+
+        non_null = series.count()
+        if non_null and series.nunique() <= non_null * CATEGORICAL_MAX_DISTINCT_RATIO:
+            return series.astype('category')
+        if is_object and ARROW_STRING_DTYPE is not None:
+            return series.astype(ARROW_STRING_DTYPE)
+        return series
+
+    @staticmethod
+    def _concat_blocks(blocks: List[pd.DataFrame]) -> pd.DataFrame:
+        """Stack compacted blocks, merging categoricals without expanding them."""
+        if len(blocks) == 1:
+            return blocks[0]
+        names = list(blocks[0].columns)
+        # Hand each block's columns over one by one so stacked and unstacked
+        # copies of the whole frame never coexist
+        for i, block in enumerate(blocks):
+            blocks[i] = dict(block.items())
+        del block
+        columns = {}
+        for col in names:
+            parts = [block.pop(col) for block in blocks]
+            if all(isinstance(part.dtype, pd.CategoricalDtype) for part in parts):
+                try:
+                    columns[col] = pd.Series(union_categoricals(parts), name=col)
+                    continue
+                except TypeError:
+                    pass  # categories of different types; fall back to plain values
+            # Blocks that compacted differently are re-compacted as a whole
+            parts = [
+                part.astype(part.cat.categories.dtype)
+                if isinstance(part.dtype, pd.CategoricalDtype) else part
+                for part in parts
+            ]
+            columns[col] = FileReader._compact_column(pd.concat(parts, ignore_index=True))
+        return pd.DataFrame(columns, copy=False)
+
+    @staticmethod
+    def sniff_dialect(file_path: FileSource, encoding: Optional[str] = None) -> CsvDialect:
+        """Sniff the CSV dialect from the first ``SNIFF_BYTES`` of a file or stream."""
+        if encoding is None:
+            encoding = FileReader._detect_encoding(file_path)
+        if isinstance(file_path, StreamSource):
+            raw_data = file_path.prefix
+            truncated = len(raw_data) >= SNIFF_BYTES
+        else:
+            with open(file_path, 'rb') as f:
+                raw_data = f.read(SNIFF_BYTES)
+                truncated = bool(f.read(1))
+        if truncated:
+            raw_data = FileReader._complete_lines(raw_data)
+        return sniff_dialect(raw_data.decode(encoding, errors='replace'), truncated)
+
+    @staticmethod
+    def _csv_read_options(file_path: FileSource,
+                          delimiter: Optional[str],
+                          encoding: Optional[str],
+                          max_columns: Optional[int],
+                          dialect: Optional[CsvDialect] = None,
+                          usecols: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Detect encoding and check the header, returning ``pd.read_csv`` options.
+
+        Only the header is parsed here so oversized files are rejected before
+        any rows of a very wide table are materialised. With ``usecols`` the
+        limit applies to the projected columns, not the whole header.
+        """
+        if encoding is None:
+            encoding = FileReader._detect_encoding(file_path)
+        if dialect is None:
+            if delimiter is None:
+                dialect = FileReader.sniff_dialect(file_path, encoding)
+            else:
+                dialect = CsvDialect(delimiter=delimiter)
+        options: Dict[str, Any] = {'encoding': encoding, **dialect.read_options()}
+
+        if len(dialect.delimiter) == 1:
+            header, header_lines = FileReader._read_csv_header(file_path, dialect, encoding)
+            FileReader._check_column_count(len(usecols if usecols is not None else header),
+                                           max_columns)
+            if not dialect.has_header:
+                options.update(names=[f"column_{i + 1}" for i in range(len(header))])
+            elif len(header) >= WIDE_TABLE_COLUMNS:
+                # Wide-table path: pandas' own header handling is superlinear
+                # in the column count, so pass the already-parsed names instead.
+                logger.debug("Using wide-table path for %s columns", len(header))
+                options.update(header=None,
+                               skiprows=header_lines,
+                               names=FileReader._dedup_column_names(header))
+        return options
+
+    @staticmethod
+    @contextmanager
+    def _open_csv_input(file_path: FileSource,
+                        progress: Progress = NULL_PROGRESS,
+                        rejects: Optional[RejectLog] = None,
+                        read_options: Optional[Dict[str, Any]] = None,
+                        selection: Optional[RecordSelection] = None):
+        """
+        Yield what ``pd.read_csv`` should read: the path, or an open handle.
+
+        Paths go to pandas untouched unless progress is enabled, in which
+        case reads go through a byte-counting wrapper, or malformed records
+        are quarantined, in which case pandas reads the text validated by
+        ``rejects``. A ``selection`` reads only the header and selected rows.
+        """
+        if rejects is not None and len(read_options['delimiter']) != 1:
+            logger.warning("Bad rows can only be quarantined with a single-character delimiter")
+            rejects = None
+        if isinstance(file_path, StreamSource):
+            handle = file_path.open()
+        elif selection is not None:
+            handle = selection.open(file_path)
+        elif progress.enabled or rejects is not None:
+            handle = open(file_path, 'rb')
+        else:
+            yield file_path
+            return
+        try:
+            source = track_bytes(handle, progress) if progress.enabled else handle
+            if rejects is not None:
+                text = io.TextIOWrapper(source, encoding=read_options['encoding'], newline='')
+                source = rejects.validate(text, read_options)
+            yield source
+        finally:
+            handle.close()
+
+    @staticmethod
+    def _detect_encoding(file_path: FileSource) -> str:
+        """Auto-detect encoding from the first 10KB of the file."""
+        if isinstance(file_path, StreamSource):
+            raw_data = file_path.prefix[:ENCODING_DETECTION_BYTES]
+        else:
+            with open(file_path, 'rb') as f:
+                raw_data = f.read(ENCODING_DETECTION_BYTES)
+        detected = chardet.detect(raw_data)
+        return detected.get('encoding') or 'utf-8'
+
+    @staticmethod
+    def _read_csv_header(file_path: FileSource,
+                         dialect: CsvDialect,
+                         encoding: str) -> Tuple[List[str], int]:
+        """Return the first row after skipped lines and the physical lines read through it."""
+        if isinstance(file_path, StreamSource):
+            text = FileReader._complete_lines(file_path.prefix).decode(encoding, errors='replace')
+            return FileReader._first_csv_record(io.StringIO(text, newline=''), dialect)
+        with open(file_path, 'r', encoding=encoding, newline='') as f:
+            return FileReader._first_csv_record(f, dialect)
+
+    @staticmethod
+    def _first_csv_record(handle, dialect: CsvDialect) -> Tuple[List[str], int]:
+        for _ in range(dialect.skip_rows):
+            handle.readline()
+        reader = csv.reader(handle,
+                            delimiter=dialect.delimiter,
+                            quotechar=dialect.quotechar,
+                            escapechar=dialect.escapechar,
+                            doublequote=dialect.doublequote)
+        for row in reader:
+            if row:
+                return row, dialect.skip_rows + reader.line_num
+        return [], dialect.skip_rows
+
+    @staticmethod
+    def _complete_lines(prefix: bytes) -> bytes:
+        """Trim a buffered prefix to its last full line."""
+        end = prefix.rfind(b'\n')
+        return prefix[:end + 1] if end >= 0 else prefix
+
+    @staticmethod
+    def _dedup_column_names(header: List[str]) -> List[str]:
+        """
+        Name columns exactly as pandas does (``Unnamed: i``, ``x.1``).
+
+        Mirrors the parser's mangling rules, including skipping suffixes that
+        already appear in the header, but tracks membership in a counter so
+        it stays linear in the number of columns.
+        """
+        names = []
+        unnamed = []
+        for i, name in enumerate(header):
+            if name == '':
+                names.append(f"Unnamed: {i}")
+                unnamed.append(i)
+            else:
+                names.append(name)
+
+        present = Counter(names)
+        counts = defaultdict(int)
+        unnamed_set = set(unnamed)
+        loop_order = [i for i in range(len(names)) if i not in unnamed_set] + unnamed
+        for i in loop_order:
+            col = old_col = names[i]
+            count = counts[col]
+            if count > 0:
+                while count > 0:
+                    counts[old_col] = count + 1
+                    col = f"{old_col}.{count}"
+                    if present[col]:
+                        count += 1
+                    else:
+                        count = counts[col]
+                present[old_col] -= 1
+                present[col] += 1
+                names[i] = col
+            counts[col] = count + 1
+        return names
+
+    @staticmethod
+    def _read_excel(file_path: FileSource,
                     sheet_name: Optional[str] = None,
-                    sample_size: Optional[int] = None) -> pd.DataFrame:
+                    sample_size: Optional[int] = None,
+                    usecols: Optional[List[str]] = None) -> pd.DataFrame:
         """Read Excel file."""
+        if isinstance(file_path, StreamSource):
+            raise ValueError("Excel input cannot be read from a stream")
         # Read Excel
         nrows = sample_size if sample_size else None
 
         if sheet_name is None:
             # Read first sheet
-            df = pd.read_excel(file_path, nrows=nrows)
+            df = pd.read_excel(file_path, nrows=nrows, usecols=usecols)
         else:
             df = pd.read_excel(file_path,
                               sheet_name=sheet_name,
-                              nrows=nrows)
+                              nrows=nrows,
+                              usecols=usecols)
         return df
 
     @staticmethod
-    def _sanitize_sample_size(sample_size: Optional[int]) -> Optional[int]:
+    def _sanitize_sample_size(sample_size: Optional[int],
+                              max_rows: int = MAX_SAMPLE_ROWS) -> Optional[int]:
         """Clamp requested sample size to prevent excessive memory usage."""
         if sample_size is None:
             return None
@@ -113,19 +695,23 @@ class FileReader:
         if sample_size <= 0:
             raise ValueError("sample_size must be positive when provided")
 
-        if sample_size > MAX_SAMPLE_ROWS:
+        if sample_size > max_rows:
             logger.debug(
                 "Sample size %s exceeds cap of %s; clamping",
                 sample_size,
-                MAX_SAMPLE_ROWS
+                max_rows
             )
-        return min(sample_size, MAX_SAMPLE_ROWS)
+        return min(sample_size, max_rows)
 
     @staticmethod
     def _validate_column_count(df: pd.DataFrame, max_columns: Optional[int]) -> None:
         """Ensure the dataframe does not exceed the allowed column count."""
+        FileReader._check_column_count(len(df.columns), max_columns)
+
+    @staticmethod
+    def _check_column_count(column_count: int, max_columns: Optional[int]) -> None:
+        """Raise when ``column_count`` exceeds the configured limit."""
         limit = max_columns if max_columns is not None else DEFAULT_MAX_COLUMNS
-        column_count = len(df.columns)
         if column_count > limit:
             raise ValueError(
                 f"File contains {column_count} columns which exceeds the allowed maximum of {limit}."
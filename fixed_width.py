@@ -0,0 +1,281 @@
+import itertools
+import json
+import logging
+import mmap
+import os
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from csv_sniffer import SNIFF_BYTES, looks_like_header
+
+
+FIXED_WIDTH_EXTENSIONS = ('.fwf', '.dat')
+# Records sliced per block by read()
+FIXED_WIDTH_BLOCK_ROWS = 50000
+_NEWLINE = ord('\n')
+_CARRIAGE_RETURN = ord('\r')
+_SPACE = ord(' ')
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class FixedWidthField:
+    """A column occupying bytes ``[start, start + width)`` of every record."""
+
+    name: str
+    start: int
+    width: int
+
+    @property
+    def end(self) -> int:
+        return self.start + self.width
+
+
+@dataclass(frozen=True)
+class FixedWidthLayout:
+    """Field positions of a fixed-width file, and how many leading lines to skip."""
+
+    fields: Tuple[FixedWidthField, ...]
+    skip_rows: int = 0
+
+    @classmethod
+    def load(cls, path: str) -> 'FixedWidthLayout':
+        """
+        Read a JSON layout spec.
+
+        ``{"skip_rows": 1, "fields": [{"name": "id", "start": 0, "width": 8}, ...]}``
+        with 0-based byte offsets; ``skip_rows`` defaults to 0.
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            try:
+                data = json.load(f)
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"Invalid layout file {path}: {exc}") from exc
+        return cls.from_dict(data)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'FixedWidthLayout':
+        try:
+            fields = tuple(
+                FixedWidthField(str(entry['name']), int(entry['start']), int(entry['width']))
+                for entry in data['fields']
+            )
+        except (KeyError, TypeError, ValueError) as exc:
+            raise ValueError(f"Layout fields need name, start, and width: {exc}") from exc
+        if not fields:
+            raise ValueError("Layout has no fields")
+        if any(field.start < 0 or field.width <= 0 for field in fields):
+            raise ValueError("Layout fields need a non-negative start and a positive width")
+        return cls(fields, int(data.get('skip_rows', 0)))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'skip_rows': self.skip_rows, 'fields': [asdict(field) for field in self.fields]}
+
+    @property
+    def names(self) -> List[str]:
+        return [field.name for field in self.fields]
+
+    def describe(self) -> str:
+        """One-line summary such as ``id[0:8], name[8:28]``."""
+        return ", ".join(f"{field.name}[{field.start}:{field.end}]" for field in self.fields)
+
+    @classmethod
+    def infer(cls, sample: bytes, encoding: str = 'utf-8') -> 'FixedWidthLayout':
+        """
+        Infer field boundaries from whitespace runs in complete sample lines.
+
+        A byte position that is blank (or past the end) on every line
+        separates fields; each field starts at the first non-blank position
+        after a separator and runs up to the next field, so padding on
+        either side belongs to the field. Fields packed without a blank
+        between them cannot be told apart and need a layout spec. The first
+        line is taken as a header when it looks unlike the rows below it.
+        """
+        lines = [line for line in sample.splitlines() if line.strip()]
+        if not lines:
+            raise ValueError("Cannot infer a fixed-width layout from an empty file")
+
+        # Headers often overhang right-aligned columns, so bound fields by the data lines
+        starts, ends = _field_bounds(lines[1:] or lines)
+        rows = [
+            [line[start:end].decode(encoding, errors='replace').strip() for start, end in zip(starts, ends)]
+            for line in lines[:100]
+        ]
+        has_header = len(rows) > 1 and looks_like_header(rows)
+        if has_header:
+            tokens = lines[0].decode(encoding, errors='replace').split()
+            names = tokens if len(tokens) == len(starts) else rows[0]
+        else:
+            starts, ends = _field_bounds(lines)
+            names = [f"column_{i + 1}" for i in range(len(starts))]
+        if len(starts) < 2:
+            logger.warning("No blank column separates fields; reading each line as one field")
+        fields = tuple(
+            FixedWidthField(name or f"column_{i + 1}", start, end - start)
+            for i, (name, start, end) in enumerate(zip(_dedup(names), starts, ends))
+        )
+        return cls(fields, skip_rows=sample.splitlines().index(lines[0]) + 1 if has_header else 0)
+
+
+class FixedWidthSource:
+    """
+    A fixed-width file and its layout.
+
+    The file is memory-mapped. When every record has the same length it is
+    viewed as a 2-D byte matrix without copying, and each field is sliced
+    for all rows at once; otherwise lines are padded into such a matrix
+    block by block.
+    """
+
+    def __init__(self, path: str, layout: FixedWidthLayout, encoding: str = 'utf-8'):
+        self.path = path
+        self.layout = layout
+        self.encoding = encoding
+
+    def __str__(self) -> str:
+        return self.path
+
+    @classmethod
+    def open(cls, path: str, layout: Optional[FixedWidthLayout] = None,
+             encoding: str = 'utf-8') -> 'FixedWidthSource':
+        """Pair ``path`` with ``layout``, inferring the layout from its first bytes if None."""
+        if layout is None:
+            with open(path, 'rb') as f:
+                sample = f.read(SNIFF_BYTES)
+                truncated = bool(f.read(1))
+            if truncated and b'\n' in sample:
+                sample = sample[:sample.rindex(b'\n') + 1]
+            layout = FixedWidthLayout.infer(sample, encoding)
+        return cls(path, layout, encoding)
+
+    def read(self, nrows: Optional[int] = None, usecols: Optional[List[str]] = None) -> pd.DataFrame:
+        """Read up to ``nrows`` records into a DataFrame of stripped strings (blank -> NaN)."""
+        blocks = list(self.iter_chunks(nrows or FIXED_WIDTH_BLOCK_ROWS, nrows, usecols))
+        if len(blocks) == 1:
+            return blocks[0]
+        return pd.concat(blocks, ignore_index=True)
+
+    def iter_chunks(self,
+                    chunk_rows: int,
+                    nrows: Optional[int] = None,
+                    usecols: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+        """Yield consecutive DataFrames of at most ``chunk_rows`` records."""
+        fields = self._select_fields(usecols)
+        emitted = False
+        with open(self.path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    for matrix in _record_blocks(mapped, self.layout.skip_rows, chunk_rows, nrows):
+                        frame = self._slice_fields(matrix, fields)
+                        del matrix  # views must be gone before the map closes
+                        emitted = True
+                        yield frame
+        if not emitted:
+            yield pd.DataFrame({field.name: pd.Series(dtype=object) for field in fields})
+
+    def _select_fields(self, usecols: Optional[List[str]]) -> List[FixedWidthField]:
+        if usecols is None:
+            return list(self.layout.fields)
+        wanted = set(usecols)
+        return [field for field in self.layout.fields if field.name in wanted]
+
+    def _slice_fields(self, matrix: np.ndarray, fields: List[FixedWidthField]) -> pd.DataFrame:
+        """Cut every field out of a block of records at once and decode it."""
+        columns = {}
+        for field in fields:
+            width = min(field.end, matrix.shape[1]) - field.start
+            if width <= 0:
+                columns[field.name] = pd.Series([np.nan] * len(matrix), dtype=object)
+                continue
+            raw = np.ascontiguousarray(matrix[:, field.start:field.start + width])
+            values = np.char.strip(np.char.decode(raw.view(f'S{width}').ravel(), self.encoding, 'replace'))
+            series = pd.Series(values, dtype=object)
+            columns[field.name] = series.where(series != '')
+        return pd.DataFrame(columns)
+
+
+def _record_blocks(mapped: mmap.mmap,
+                   skip_rows: int,
+                   chunk_rows: int,
+                   nrows: Optional[int]) -> Iterator[np.ndarray]:
+    """Yield records of the mapped file as 2-D uint8 matrices (line endings excluded)."""
+    offset = 0
+    for _ in range(skip_rows):
+        newline = mapped.find(b'\n', offset)
+        offset = len(mapped) if newline < 0 else newline + 1
+
+    record_length = _uniform_record_length(mapped, offset)
+    if record_length is None:
+        # Ragged lines: pad each block into a matrix
+        mapped.seek(offset)
+        lines = iter(mapped.readline, b'')
+        emitted = 0
+        while nrows is None or emitted < nrows:
+            size = chunk_rows if nrows is None else min(chunk_rows, nrows - emitted)
+            block = list(itertools.islice(lines, size))
+            if not block:
+                return
+            yield _line_matrix(block)
+            emitted += len(block)
+        return
+
+    # Every record has the same length: a zero-copy view of the map
+    line_width = record_length - 1
+    if line_width and mapped[offset + record_length - 2] == _CARRIAGE_RETURN:
+        line_width -= 1
+    records = np.frombuffer(mapped, dtype=np.uint8, offset=offset).reshape(-1, record_length)
+    count = len(records) if nrows is None else min(len(records), nrows)
+    try:
+        for start in range(0, count, chunk_rows):
+            yield records[start:min(start + chunk_rows, count), :line_width]
+    finally:
+        del records
+
+
+def _uniform_record_length(mapped: mmap.mmap, offset: int) -> Optional[int]:
+    """Record length including the newline when every record has that length, else None."""
+    newline = mapped.find(b'\n', offset)
+    size = len(mapped) - offset
+    if newline < 0 or size % (newline - offset + 1):
+        return None
+    record_length = newline - offset + 1
+    data = np.frombuffer(mapped, dtype=np.uint8, offset=offset)
+    uniform = bool((data[record_length - 1::record_length] == _NEWLINE).all())
+    del data
+    return record_length if uniform else None
+
+
+def _field_bounds(lines: List[bytes]) -> Tuple[List[int], List[int]]:
+    """Start and end offsets of the fields separated by columns blank on every line."""
+    matrix = _line_matrix(lines)
+    used = np.flatnonzero((matrix != _SPACE).any(axis=0))
+    # A field starts wherever a used position follows an unused one
+    starts = used[np.concatenate(([True], np.diff(used) > 1))].tolist()
+    return starts, starts[1:] + [matrix.shape[1]]
+
+
+def _line_matrix(lines: List[bytes]) -> np.ndarray:
+    """Pad lines with spaces into a 2-D uint8 matrix."""
+    lines = [line.rstrip(b'\r\n') for line in lines]
+    width = max((len(line) for line in lines), default=0)
+    if width == 0:
+        return np.zeros((len(lines), 0), dtype=np.uint8)
+    padded = np.array([line.ljust(width) for line in lines], dtype=f'S{width}')
+    return padded.view(np.uint8).reshape(len(lines), width)
+
+
+def _dedup(names: List[str]) -> List[str]:
+    seen: Dict[str, int] = {}
+    result = []
+    for name in names:
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        result.append(name)
+    return result
@@ -0,0 +1,191 @@
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+from column_stats import ColumnStats
+
+
+MAX_NULL_RATIO = 0.5
+MAX_CLUSTER_KEYS = 3
+MAX_PARTITION_DISTINCT = 1000
+INDEX_DIALECTS = ('postgres', 'sqlite', 'mysql', 'oracle', 'sqlserver')
+# Semi-structured columns cannot be plain cluster, partition, or index keys
+SEMI_STRUCTURED_TYPES = ('json',)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class LayoutHint:
+    """A physical layout suggestion with the evidence behind it."""
+
+    kind: str  # 'cluster_by', 'partition_by', 'zorder_by', or 'index'
+    columns: Tuple[str, ...]
+    justification: str
+    method: str = ''  # index access method, e.g. 'BRIN'
+
+
+class LayoutAdvisor:
+    """Suggests clustering, partitioning, and index clauses from column statistics."""
+
+    def __init__(self, dialect: str = 'snowflake'):
+        self.dialect = dialect.lower()
+
+    def suggest(self,
+                type_info: Dict[str, Dict[str, Any]],
+                stats: Dict[str, ColumnStats]) -> List[LayoutHint]:
+        """
+        Suggest layout hints for the current dialect.
+
+        Mostly-NULL columns and integer key candidates (surrogate keys,
+        already served by a primary key) never drive layout.
+
+        Returns:
+            List of ``LayoutHint`` in emission order
+        """
+        ordered, low_cardinality = self._classify(type_info, stats)
+
+        if self.dialect == 'snowflake':
+            hints = self._snowflake_hints(ordered, low_cardinality, stats)
+        elif self.dialect == 'databricks':
+            hints = self._databricks_hints(ordered, low_cardinality, type_info, stats)
+        elif self.dialect in INDEX_DIALECTS:
+            hints = self._index_hints(ordered, stats)
+        else:
+            hints = []
+
+        logger.debug("Suggested %s layout hints for %s", len(hints), self.dialect)
+        return hints
+
+    def render(self,
+               table_name: str,
+               hints: List[LayoutHint],
+               identifiers: Dict[str, str]) -> Tuple[List[str], List[str]]:
+        """
+        Render hints as SQL.
+
+        Args:
+            table_name: Sanitized table identifier
+            hints: Hints from ``suggest``
+            identifiers: Source column name -> SQL identifier
+
+        Returns:
+            Tuple of (CREATE TABLE options, statements to run afterwards)
+        """
+        options = []
+        statements = []
+        for hint in hints:
+            cols = [identifiers[col] for col in hint.columns]
+            col_list = ", ".join(cols)
+            if hint.kind == 'cluster_by':
+                options.append(f"CLUSTER BY ({col_list})")
+            elif hint.kind == 'partition_by':
+                options.append(f"PARTITIONED BY ({col_list})")
+            elif hint.kind == 'zorder_by':
+                statements.append(f"OPTIMIZE {table_name} ZORDER BY ({col_list});")
+            elif hint.kind == 'index':
+                statements.append(self._index_statement(table_name, cols, hint.method))
+        return options, statements
+
+    @staticmethod
+    def format_justifications(hints: List[LayoutHint]) -> str:
+        """Render the reasoning for each hint as a SQL comment block."""
+        lines = ["-- Layout hints"]
+        for hint in hints:
+            label = hint.kind.replace('_', ' ').upper()
+            if hint.method:
+                label = f"{label} ({hint.method})"
+            lines.append(f"-- {label} {', '.join(hint.columns)}: {hint.justification}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _classify(type_info: Dict[str, Dict[str, Any]],
+                  stats: Dict[str, ColumnStats]) -> Tuple[List[str], List[str]]:
+        """Split eligible columns into monotonic (integer/date) and low-cardinality lists."""
+        ordered = []
+        low_cardinality = []
+        for col, col_stats in stats.items():
+            if col_stats.row_count == 0 or col_stats.null_ratio > MAX_NULL_RATIO:
+                continue
+            inferred_type = type_info.get(col, {}).get('inferred_type')
+            if inferred_type in SEMI_STRUCTURED_TYPES:
+                continue
+            if col_stats.is_key_candidate and inferred_type != 'date':
+                continue
+            if col_stats.is_monotonic:
+                ordered.append(col)
+            elif col_stats.is_low_cardinality and col_stats.distinct_estimate > 1:
+                low_cardinality.append(col)
+        # Dates make better range keys than arbitrary increasing integers
+        ordered.sort(key=lambda col: type_info.get(col, {}).get('inferred_type') != 'date')
+        return ordered, low_cardinality
+
+    @staticmethod
+    def _snowflake_hints(ordered: List[str],
+                         low_cardinality: List[str],
+                         stats: Dict[str, ColumnStats]) -> List[LayoutHint]:
+        # Snowflake recommends ordering cluster keys from lowest to highest cardinality
+        keys = sorted(low_cardinality, key=lambda col: stats[col].distinct_estimate)
+        keys = (keys[:MAX_CLUSTER_KEYS - 1] + ordered[:1]) if ordered else keys[:MAX_CLUSTER_KEYS]
+        if not keys:
+            return []
+        reasons = []
+        for col in keys:
+            if col in ordered:
+                reasons.append(f"{col} arrives in sorted order, so micro-partitions stay range-pruned")
+            else:
+                reasons.append(f"{col} has ~{stats[col].distinct_estimate} distinct values, "
+                               "cheap to maintain as a leading cluster key")
+        return [LayoutHint('cluster_by', tuple(keys), "; ".join(reasons))]
+
+    @staticmethod
+    def _databricks_hints(ordered: List[str],
+                          low_cardinality: List[str],
+                          type_info: Dict[str, Dict[str, Any]],
+                          stats: Dict[str, ColumnStats]) -> List[LayoutHint]:
+        hints = []
+        partition = None
+        for col in ordered + low_cardinality:
+            is_date = type_info.get(col, {}).get('inferred_type') == 'date'
+            distinct = stats[col].distinct_estimate
+            if (is_date or col in low_cardinality) and distinct <= MAX_PARTITION_DISTINCT:
+                partition = col
+                hints.append(LayoutHint(
+                    'partition_by', (col,),
+                    f"~{distinct} distinct values with null ratio {stats[col].null_ratio:.2f}; "
+                    "coarse enough to avoid small-file partitions"
+                ))
+                break
+        zorder = [col for col in ordered if col != partition][:MAX_CLUSTER_KEYS]
+        if zorder:
+            hints.append(LayoutHint(
+                'zorder_by', tuple(zorder),
+                "monotonic values co-locate well, so range filters skip most files"
+            ))
+        return hints
+
+    def _index_hints(self, ordered: List[str], stats: Dict[str, ColumnStats]) -> List[LayoutHint]:
+        hints = []
+        for col in ordered:
+            if self.dialect == 'postgres':
+                hints.append(LayoutHint(
+                    'index', (col,),
+                    "values follow physical row order; a BRIN index serves range scans "
+                    "at a fraction of a B-tree's size",
+                    method='BRIN'
+                ))
+            else:
+                hints.append(LayoutHint(
+                    'index', (col,),
+                    f"monotonic with ~{stats[col].distinct_estimate} distinct values; "
+                    "supports range predicates and ordered scans"
+                ))
+        return hints
+
+    def _index_statement(self, table_name: str, cols: List[str], method: str) -> str:
+        index_name = f"idx_{table_name}_{'_'.join(cols)}"
+        col_list = ", ".join(cols)
+        if self.dialect in ('postgres', 'sqlite'):
+            using = f" USING {method}" if method else ""
+            return f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name}{using} ({col_list});"
+        return f"CREATE INDEX {index_name} ON {table_name} ({col_list});"
@@ -0,0 +1,113 @@
+import logging
+import re
+import sys
+from dataclasses import dataclass
+from typing import Optional
+
+import pandas as pd
+
+
+PROBE_ROWS = 200
+SAMPLE_BUDGET_FRACTION = 0.5
+CHUNK_BUDGET_FRACTION = 0.1
+# Column statistics keep up to EXACT_DISTINCT_LIMIT hashes per column before
+# collapsing to a 4 KiB sketch; reserve that much per column up front.
+STATS_BYTES_PER_COLUMN = 256 * 1024
+MIN_PLANNED_ROWS = 100
+
+_SIZE_PATTERN = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*([KMGT]?)(I?B)?\s*$', re.IGNORECASE)
+_SIZE_UNITS = {'': 1, 'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3, 'T': 1024 ** 4}
+
+logger = logging.getLogger(__name__)
+
+
+def parse_byte_size(text: str) -> int:
+    """Parse sizes such as ``512MB``, ``2G``, or ``1048576`` into bytes (binary units)."""
+    match = _SIZE_PATTERN.match(str(text))
+    if not match:
+        raise ValueError(f"Invalid memory size: {text!r}. Use e.g. 512MB or 2GB")
+    value, unit, _ = match.groups()
+    size = int(float(value) * _SIZE_UNITS[unit.upper()])
+    if size <= 0:
+        raise ValueError("Memory budget must be positive")
+    return size
+
+
+@dataclass(frozen=True)
+class MemoryPlan:
+    """Row limits derived from a memory budget and a probe of the file."""
+
+    budget_bytes: int
+    bytes_per_row: float
+    chunk_bytes_per_row: float
+    sample_rows: int
+    chunk_rows: int
+    stats_bytes: int
+
+    @classmethod
+    def from_probe(cls, probe: pd.DataFrame, budget_bytes: int,
+                   collect_stats: bool = False,
+                   chunk_probe: Optional[pd.DataFrame] = None) -> 'MemoryPlan':
+        """
+        Size the sample and chunk limits from a probe read.
+
+        Half of the budget (after reserving column statistics when
+        ``collect_stats`` is set) holds the sampled frame; the rest is
+        headroom for the per-column copies made during inference. Streaming
+        modes read ``chunk_rows`` at a time, sized from ``chunk_probe``: the
+        probe as chunks arrive, before compaction (defaults to ``probe``).
+        """
+        bytes_per_row = _bytes_per_row(probe)
+        chunk_bytes_per_row = bytes_per_row if chunk_probe is None else _bytes_per_row(chunk_probe)
+        stats_bytes = len(probe.columns) * STATS_BYTES_PER_COLUMN if collect_stats else 0
+        available = budget_bytes - stats_bytes
+        if available <= 0:
+            raise ValueError(
+                f"Memory budget of {format_bytes(budget_bytes)} cannot hold statistics "
+                f"for {len(probe.columns)} columns; raise --memory-budget"
+            )
+
+        sample_rows = max(int(available * SAMPLE_BUDGET_FRACTION / bytes_per_row), MIN_PLANNED_ROWS)
+        chunk_rows = max(int(available * CHUNK_BUDGET_FRACTION / chunk_bytes_per_row), MIN_PLANNED_ROWS)
+        plan = cls(
+            budget_bytes=budget_bytes,
+            bytes_per_row=bytes_per_row,
+            chunk_bytes_per_row=chunk_bytes_per_row,
+            sample_rows=sample_rows,
+            chunk_rows=min(chunk_rows, sample_rows),
+            stats_bytes=stats_bytes
+        )
+        logger.debug(
+            "Memory plan: %.0f bytes/row -> sample %s rows; %.0f bytes/row -> chunk %s rows",
+            plan.bytes_per_row,
+            plan.sample_rows,
+            plan.chunk_bytes_per_row,
+            plan.chunk_rows
+        )
+        return plan
+
+
+def _bytes_per_row(frame: pd.DataFrame) -> float:
+    return max(float(frame.memory_usage(deep=True, index=False).sum()) / max(len(frame), 1), 1.0)
+
+
+def peak_memory_bytes() -> Optional[int]:
+    """Return the peak resident set size of this process, if the platform reports it."""
+    try:
+        import resource
+    except ImportError:  # pragma: no cover - Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def format_bytes(size: float) -> str:
+    """Format a byte count for log output (e.g. ``512.0MB``)."""
+    if size < 1024:
+        return f"{size:.0f}B"
+    for unit in ('KB', 'MB', 'GB'):
+        size /= 1024
+        if size < 1024 or unit == 'GB':
+            break
+    return f"{size:.1f}{unit}"
@@ -0,0 +1,123 @@
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable
+
+DEFAULT_PIPELINE_DEPTH = 2
+_POLL_SECONDS = 0.1
+_DONE = object()
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PipelineStats:
+    """Where each stage spent its time; the blocked totals show which stage is slower."""
+
+    chunks: int = 0
+    producer_seconds: float = 0.0
+    consumer_seconds: float = 0.0
+    producer_blocked_seconds: float = 0.0
+    consumer_blocked_seconds: float = 0.0
+    wall_seconds: float = 0.0
+
+
+def run_pipeline(produce: Iterable[Any],
+                 consume: Callable[[Any], None],
+                 depth: int = DEFAULT_PIPELINE_DEPTH) -> PipelineStats:
+    """
+    Overlap a producer (reading/decoding) with a consumer (profiling).
+
+    ``produce`` is iterated on a background thread and its items handed to
+    ``consume`` on the calling thread through a queue of at most ``depth``
+    items. When the consumer falls behind, the producer blocks, which caps
+    the number of chunks held in memory at ``depth + 2``. Exceptions from
+    either side stop both stages and are re-raised here. ``depth=0`` runs
+    both stages one after the other on the calling thread.
+    """
+    if depth < 0:
+        raise ValueError("depth must not be negative")
+    if depth == 0:
+        return _run_serial(produce, consume)
+
+    items: queue.Queue = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    errors = []
+    stats = PipelineStats()
+
+    def put(item: Any) -> bool:
+        started = time.perf_counter()
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=_POLL_SECONDS)
+                stats.producer_blocked_seconds += time.perf_counter() - started
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def producer() -> None:
+        iterator = iter(produce)
+        try:
+            while not stop.is_set():
+                started = time.perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    break
+                stats.producer_seconds += time.perf_counter() - started
+                if not put(item):
+                    return
+        except BaseException as exc:  # re-raised on the consumer thread
+            errors.append(exc)
+        finally:
+            close = getattr(iterator, 'close', None)
+            if close is not None:
+                close()
+            put(_DONE)
+
+    wall_started = time.perf_counter()
+    thread = threading.Thread(target=producer, name='csv2ddl-reader', daemon=True)
+    thread.start()
+    try:
+        while True:
+            started = time.perf_counter()
+            item = items.get()
+            stats.consumer_blocked_seconds += time.perf_counter() - started
+            if item is _DONE:
+                break
+            started = time.perf_counter()
+            consume(item)
+            stats.consumer_seconds += time.perf_counter() - started
+            stats.chunks += 1
+    finally:
+        stop.set()
+        thread.join()
+
+    stats.wall_seconds = time.perf_counter() - wall_started
+    if errors:
+        raise errors[0]
+
+    logger.debug(
+        "Pipeline processed %s chunks in %.2fs (read %.2fs, profile %.2fs)",
+        stats.chunks,
+        stats.wall_seconds,
+        stats.producer_seconds,
+        stats.consumer_seconds
+    )
+    return stats
+
+
+def _run_serial(produce: Iterable[Any], consume: Callable[[Any], None]) -> PipelineStats:
+    stats = PipelineStats()
+    wall_started = time.perf_counter()
+    for item in produce:
+        started = time.perf_counter()
+        consume(item)
+        stats.consumer_seconds += time.perf_counter() - started
+        stats.chunks += 1
+    stats.wall_seconds = time.perf_counter() - wall_started
+    stats.producer_seconds = stats.wall_seconds - stats.consumer_seconds
+    return stats
@@ -0,0 +1,120 @@
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from bad_rows import RejectSummary
+from column_stats import ColumnStats
+from csv_sniffer import CsvDialect
+
+
+PROFILE_FORMAT = 'csv2ddl-profile'
+PROFILE_FORMAT_VERSION = 1
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TableProfile:
+    """
+    Everything DDL rendering needs, detached from the source file.
+
+    ``type_info`` holds the inferred types in column order; ``stats`` is
+    present only when column statistics were gathered, ``csv_dialect``
+    only when the CSV dialect was sniffed rather than given, and ``rejects``
+    only when malformed rows were quarantined.
+    """
+
+    source: str
+    table_name: Optional[str]
+    row_count: int
+    type_info: Dict[str, Dict[str, Any]]
+    stats: Optional[Dict[str, ColumnStats]] = None
+    csv_dialect: Optional[CsvDialect] = None
+    rejects: Optional[RejectSummary] = None
+    created_at: str = field(
+        default_factory=lambda: datetime.now(timezone.utc).isoformat(timespec='seconds')
+    )
+
+    def to_dict(self) -> Dict[str, Any]:
+        columns = []
+        for col, info in self.type_info.items():
+            entry = {'name': col, 'type': info}
+            if self.stats is not None and col in self.stats:
+                entry['stats'] = self.stats[col].to_dict()
+            columns.append(entry)
+        return {
+            'format': PROFILE_FORMAT,
+            'version': PROFILE_FORMAT_VERSION,
+            'created_at': self.created_at,
+            'source': self.source,
+            'table_name': self.table_name,
+            'row_count': self.row_count,
+            'has_stats': self.stats is not None,
+            'csv_dialect': self.csv_dialect.to_dict() if self.csv_dialect is not None else None,
+            'rejects': self.rejects.to_dict() if self.rejects is not None else None,
+            'columns': columns,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'TableProfile':
+        if data.get('format') != PROFILE_FORMAT:
+            raise ValueError("Not a csv2ddl profile")
+        version = data.get('version')
+        if version != PROFILE_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported profile version {version}; "
+                f"this csv2ddl reads version {PROFILE_FORMAT_VERSION}"
+            )
+
+        type_info = {}
+        stats = {} if data.get('has_stats') else None
+        for entry in data['columns']:
+            type_info[entry['name']] = entry['type']
+            if stats is not None and 'stats' in entry:
+                stats[entry['name']] = ColumnStats.from_dict(entry['stats'])
+        csv_dialect = data.get('csv_dialect')
+        rejects = data.get('rejects')
+        return cls(
+            source=data['source'],
+            table_name=data.get('table_name'),
+            row_count=data['row_count'],
+            type_info=type_info,
+            stats=stats,
+            csv_dialect=CsvDialect(**csv_dialect) if csv_dialect else None,
+            rejects=RejectSummary(**rejects) if rejects else None,
+            created_at=data.get('created_at', ''),
+        )
+
+
+def dumps_profile(profile: TableProfile) -> str:
+    """Serialise a profile to a JSON string."""
+    return json.dumps(profile.to_dict(), indent=2, default=_json_default)
+
+
+def save_profile(profile: TableProfile, path: str) -> None:
+    """Write a profile as JSON."""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(dumps_profile(profile))
+        f.write('\n')
+    logger.debug("Saved profile of %s columns to %s", len(profile.type_info), path)
+
+
+def load_profile(path: str) -> TableProfile:
+    """Read a profile written by ``save_profile``."""
+    with open(path, 'r', encoding='utf-8') as f:
+        try:
+            data = json.load(f)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"Invalid profile file {path}: {exc}") from exc
+    return TableProfile.from_dict(data)
+
+
+def _json_default(value: Any) -> Any:
+    # Inference results carry numpy scalars (lengths, precision, confidence)
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Cannot serialise {type(value).__name__} in a profile")
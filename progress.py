@@ -0,0 +1,177 @@
+import io
+import json
+import logging
+import sys
+import threading
+import time
+from typing import Any, BinaryIO, Dict, Optional, TextIO
+
+from memory_budget import format_bytes
+
+
+PROGRESS_MODES = ('auto', 'bar', 'log', 'json')
+# Seconds between updates for each output style
+REPORT_INTERVALS = {'bar': 0.2, 'log': 5.0, 'json': 1.0}
+BAR_WIDTH = 30
+
+logger = logging.getLogger(__name__)
+
+
+class Progress:
+    """
+    Progress sink that ignores everything.
+
+    Used when reporting is off, so instrumented code pays one no-op call
+    per chunk and readers skip byte counting entirely (``enabled`` is False).
+    """
+
+    enabled = False
+
+    def start(self, stage: str, total_bytes: Optional[int] = None) -> None:
+        pass
+
+    def advance(self, nbytes: int = 0, rows: int = 0) -> None:
+        pass
+
+    def finish(self) -> None:
+        pass
+
+
+NULL_PROGRESS = Progress()
+
+
+class ProgressReporter(Progress):
+    """
+    Reports bytes and rows processed, throughput, and ETA for the current stage on stderr.
+
+    ``bar`` redraws a single line, ``log`` emits periodic log records, and
+    ``json`` writes one JSON object per line for schedulers. ETA is only
+    known when the stage was started with ``total_bytes``.
+    """
+
+    enabled = True
+
+    def __init__(self, mode: str = 'auto', stream: Optional[TextIO] = None):
+        if mode not in PROGRESS_MODES:
+            raise ValueError(f"Unsupported progress mode: {mode}. Supported: {list(PROGRESS_MODES)}")
+        self.stream = stream or sys.stderr
+        if mode == 'auto':
+            mode = 'bar' if self.stream.isatty() else 'log'
+        self.mode = mode
+        self.interval = REPORT_INTERVALS[mode]
+        self._lock = threading.Lock()
+        self._stage: Optional[str] = None
+        self._reset(None, None)
+
+    def _reset(self, stage: Optional[str], total_bytes: Optional[int]) -> None:
+        self._stage = stage
+        self._total_bytes = total_bytes
+        self._bytes = 0
+        self._rows = 0
+        self._started = time.monotonic()
+        self._last_report = self._started
+
+    def start(self, stage: str, total_bytes: Optional[int] = None) -> None:
+        with self._lock:
+            if self._stage is not None:
+                self._report('stage_end')
+            self._reset(stage, total_bytes)
+            self._report('stage_start')
+
+    def advance(self, nbytes: int = 0, rows: int = 0) -> None:
+        # Called from the reader thread (bytes) and the profiling thread (rows)
+        with self._lock:
+            self._bytes += nbytes
+            self._rows += rows
+            now = time.monotonic()
+            if now - self._last_report >= self.interval:
+                self._last_report = now
+                self._report('progress')
+
+    def finish(self) -> None:
+        with self._lock:
+            if self._stage is not None:
+                self._report('stage_end')
+                self._stage = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current counters and rates for the active stage."""
+        elapsed = max(time.monotonic() - self._started, 1e-9)
+        bytes_per_second = self._bytes / elapsed
+        eta = None
+        percent = None
+        if self._total_bytes:
+            done = min(self._bytes, self._total_bytes)
+            percent = round(100.0 * done / self._total_bytes, 1)
+            if bytes_per_second > 0:
+                eta = round((self._total_bytes - done) / bytes_per_second, 1)
+        return {
+            'stage': self._stage,
+            'bytes': self._bytes,
+            'total_bytes': self._total_bytes,
+            'rows': self._rows,
+            'elapsed_seconds': round(elapsed, 2),
+            'bytes_per_second': round(bytes_per_second),
+            'rows_per_second': round(self._rows / elapsed),
+            'percent': percent,
+            'eta_seconds': eta,
+        }
+
+    def _report(self, event: str) -> None:
+        snapshot = self.snapshot()
+        if self.mode == 'json':
+            self.stream.write(json.dumps({'event': event, **snapshot}) + '\n')
+            self.stream.flush()
+        elif self.mode == 'bar':
+            self.stream.write('\r' + _format_bar(snapshot))
+            if event == 'stage_end':
+                self.stream.write('\n')
+            self.stream.flush()
+        elif event != 'stage_start':
+            logger.info("Progress: %s", _format_line(snapshot))
+
+
+def track_bytes(handle: BinaryIO, progress: Progress) -> io.BufferedReader:
+    """Wrap a binary handle so every read advances ``progress`` by the bytes returned."""
+    return io.BufferedReader(_CountingStream(handle, progress))
+
+
+class _CountingStream(io.RawIOBase):
+    def __init__(self, source: BinaryIO, progress: Progress):
+        self._source = source
+        self._progress = progress
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._source.read(len(buffer))
+        if not data:
+            return 0
+        buffer[:len(data)] = data
+        self._progress.advance(nbytes=len(data))
+        return len(data)
+
+
+def _format_line(snapshot: Dict[str, Any]) -> str:
+    parts = [snapshot['stage'], format_bytes(snapshot['bytes'])]
+    if snapshot['total_bytes']:
+        parts[-1] += f"/{format_bytes(snapshot['total_bytes'])} ({snapshot['percent']:.1f}%)"
+    parts.append(f"{format_bytes(snapshot['bytes_per_second'])}/s")
+    parts.append(f"{snapshot['rows']:,} rows")
+    if snapshot['eta_seconds'] is not None:
+        parts.append(f"ETA {_format_seconds(snapshot['eta_seconds'])}")
+    return ", ".join(parts)
+
+
+def _format_bar(snapshot: Dict[str, Any]) -> str:
+    fraction = (snapshot['percent'] or 0.0) / 100
+    filled = int(BAR_WIDTH * fraction)
+    bar = '#' * filled + '.' * (BAR_WIDTH - filled) if snapshot['total_bytes'] else ' ' * BAR_WIDTH
+    return f"[{bar}] {_format_line(snapshot)}\x1b[K"
+
+
+def _format_seconds(seconds: float) -> str:
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}"
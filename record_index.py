@@ -0,0 +1,274 @@
+import io
+import json
+import logging
+import mmap
+import os
+from dataclasses import dataclass
+from typing import BinaryIO, List, Optional, Tuple
+
+import numpy as np
+
+from csv_sniffer import CsvDialect
+
+
+INDEX_SUFFIX = '.csv2ddl-index.npz'
+INDEX_FORMAT_VERSION = 1
+# Bytes scanned per vectorised step when building an index
+INDEX_BLOCK_BYTES = 16 * 1024 * 1024
+RANDOM_SAMPLE_SEED = 0
+_NEWLINE = ord('\n')
+
+logger = logging.getLogger(__name__)
+
+
+def parse_row_range(text: str) -> Tuple[int, Optional[int]]:
+    """Parse ``START:END`` (0-based data rows, END exclusive and optional) into a tuple."""
+    start, sep, end = str(text).partition(':')
+    try:
+        if not sep:
+            raise ValueError
+        bounds = (int(start or 0), int(end) if end else None)
+    except ValueError:
+        raise ValueError(f"Invalid row range: {text!r}. Use e.g. 1000:2000 or 5000:") from None
+    if bounds[0] < 0 or (bounds[1] is not None and bounds[1] < bounds[0]):
+        raise ValueError(f"Invalid row range: {text!r}")
+    return bounds
+
+
+@dataclass(frozen=True)
+class RecordSelection:
+    """
+    Byte spans of a CSV file to parse: its header, then whole records.
+
+    ``open()`` returns a binary stream of exactly those bytes, so pandas
+    parses the selected rows as if they were the whole file.
+    """
+
+    spans: Tuple[Tuple[int, int], ...]
+    rows: int
+
+    @property
+    def nbytes(self) -> int:
+        return sum(end - start for start, end in self.spans)
+
+    def open(self, path: str) -> io.BufferedReader:
+        return io.BufferedReader(_SpanStream(open(path, 'rb'), self.spans))
+
+
+@dataclass
+class RecordIndex:
+    """
+    Byte offset of every data record of a CSV file, for O(1) seeks to any row.
+
+    ``offsets[i]`` is where data row ``i`` starts and ``offsets[-1]`` the end
+    of the last one; bytes before ``offsets[0]`` are skipped lines and the
+    header. Boundaries are newlines outside quotes, so quoted fields
+    spanning lines stay one record. The index is only valid for the file
+    ``size`` and ``mtime_ns`` it was built from, and for the same dialect.
+    """
+
+    size: int
+    mtime_ns: int
+    quotechar: str
+    escapechar: Optional[str]
+    skip_rows: int
+    has_header: bool
+    offsets: np.ndarray
+
+    @property
+    def rows(self) -> int:
+        return len(self.offsets) - 1
+
+    @staticmethod
+    def sidecar_path(path: str) -> str:
+        return path + INDEX_SUFFIX
+
+    @classmethod
+    def open(cls, path: str, dialect: CsvDialect, rebuild: bool = False) -> 'RecordIndex':
+        """Load the sidecar index of ``path`` if it is current, else build and save a new one."""
+        index_path = cls.sidecar_path(path)
+        if not rebuild and os.path.exists(index_path):
+            try:
+                index = cls.load(index_path)
+            except ValueError as exc:
+                logger.warning("Ignoring unreadable index %s: %s", index_path, exc)
+            else:
+                if index.matches(path, dialect):
+                    logger.info("Using record index %s (%s rows)", index_path, index.rows)
+                    return index
+                logger.info("Record index %s is stale; rebuilding", index_path)
+
+        index = cls.build(path, dialect)
+        index.save(index_path)
+        logger.info("Indexed %s rows of %s into %s", index.rows, path, index_path)
+        return index
+
+    @classmethod
+    def build(cls, path: str, dialect: CsvDialect) -> 'RecordIndex':
+        """Scan ``path`` once for record boundaries (ASCII-compatible encodings only)."""
+        stat = os.stat(path)
+        with open(path, 'rb') as f:
+            for _ in range(dialect.skip_rows):
+                f.readline()
+            body_start = f.tell()
+            if not stat.st_size:
+                starts = np.zeros(1, dtype=np.int64)
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    starts = _record_starts(mapped, body_start, dialect.quotechar, dialect.escapechar)
+                    if dialect.has_header:
+                        # The header is the first non-blank record
+                        header = 0
+                        while header < len(starts) - 2 and \
+                                not mapped[starts[header]:starts[header + 1]].strip():
+                            header += 1
+                        starts = starts[min(header + 1, len(starts) - 1):]
+
+        return cls(
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            quotechar=dialect.quotechar,
+            escapechar=dialect.escapechar,
+            skip_rows=dialect.skip_rows,
+            has_header=dialect.has_header,
+            offsets=starts
+        )
+
+    def matches(self, path: str, dialect: CsvDialect) -> bool:
+        """True when ``path`` is unchanged since indexing and is read with the same dialect."""
+        stat = os.stat(path)
+        return (
+            (self.size, self.mtime_ns) == (stat.st_size, stat.st_mtime_ns)
+            and (self.quotechar, self.escapechar, self.skip_rows, self.has_header)
+            == (dialect.quotechar, dialect.escapechar, dialect.skip_rows, dialect.has_header)
+        )
+
+    def save(self, index_path: str) -> None:
+        """Write the index; offsets are stored as record lengths, compressed."""
+        lengths = np.diff(self.offsets)
+        dtype = np.uint32 if not len(lengths) or lengths.max() < 2 ** 32 else np.uint64
+        meta = {
+            'version': INDEX_FORMAT_VERSION,
+            'size': self.size,
+            'mtime_ns': self.mtime_ns,
+            'quotechar': self.quotechar,
+            'escapechar': self.escapechar,
+            'skip_rows': self.skip_rows,
+            'has_header': self.has_header,
+            'data_start': int(self.offsets[0]),
+        }
+        with open(index_path, 'wb') as f:
+            np.savez_compressed(f, meta=np.array(json.dumps(meta)), lengths=lengths.astype(dtype))
+
+    @classmethod
+    def load(cls, index_path: str) -> 'RecordIndex':
+        try:
+            with np.load(index_path, allow_pickle=False) as data:
+                meta = json.loads(str(data['meta']))
+                lengths = data['lengths'].astype(np.int64)
+        except (OSError, KeyError, ValueError) as exc:
+            raise ValueError(f"Invalid record index {index_path}: {exc}") from exc
+        if meta.get('version') != INDEX_FORMAT_VERSION:
+            raise ValueError(f"Unsupported record index version {meta.get('version')}")
+        offsets = np.empty(len(lengths) + 1, dtype=np.int64)
+        offsets[0] = meta['data_start']
+        np.cumsum(lengths, out=offsets[1:])
+        offsets[1:] += meta['data_start']
+        return cls(meta['size'], meta['mtime_ns'], meta['quotechar'], meta['escapechar'],
+                   meta['skip_rows'], meta['has_header'], offsets)
+
+    def row_range(self, start: int, end: Optional[int] = None) -> RecordSelection:
+        """Select data rows ``start`` to ``end`` (exclusive, 0-based)."""
+        start, end = self._clamp(start, end)
+        return RecordSelection(self._header_span() + ((int(self.offsets[start]), int(self.offsets[end])),),
+                               end - start)
+
+    def sample(self, rows: int, start: int = 0, end: Optional[int] = None,
+               seed: int = RANDOM_SAMPLE_SEED) -> RecordSelection:
+        """Select ``rows`` data rows uniformly at random from ``start:end``, in file order."""
+        start, end = self._clamp(start, end)
+        if rows >= end - start:
+            return self.row_range(start, end)
+        chosen = np.sort(np.random.default_rng(seed).choice(end - start, size=rows, replace=False)) + start
+        # Adjacent rows are read as one span
+        runs = np.split(chosen, np.flatnonzero(np.diff(chosen) > 1) + 1)
+        spans = tuple((int(self.offsets[run[0]]), int(self.offsets[run[-1] + 1])) for run in runs)
+        return RecordSelection(self._header_span() + spans, rows)
+
+    def split(self, parts: int) -> List[Tuple[int, int]]:
+        """Split the data rows into up to ``parts`` row ranges of about equal bytes."""
+        if parts <= 0:
+            raise ValueError("parts must be positive")
+        targets = np.linspace(self.offsets[0], self.offsets[-1], parts + 1)[1:-1]
+        cuts = np.searchsorted(self.offsets, targets)
+        bounds = sorted({0, self.rows, *(int(cut) for cut in cuts)})
+        return [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+    def _header_span(self) -> Tuple[Tuple[int, int], ...]:
+        return ((0, int(self.offsets[0])),) if self.offsets[0] else ()
+
+    def _clamp(self, start: int, end: Optional[int]) -> Tuple[int, int]:
+        end = self.rows if end is None else min(end, self.rows)
+        if start < 0 or start > end:
+            raise ValueError(f"Row range {start}:{end} is outside the file's {self.rows} rows")
+        return start, end
+
+
+def _record_starts(mapped: mmap.mmap, body_start: int, quotechar: str,
+                   escapechar: Optional[str]) -> np.ndarray:
+    """Offsets where records start (from ``body_start``), plus the end of the file."""
+    quote = ord(quotechar)
+    escape = ord(escapechar) if escapechar else None
+    size = len(mapped)
+    starts = [np.array([body_start], dtype=np.int64)]
+    inside = 0
+    for block_start in range(body_start, size, INDEX_BLOCK_BYTES):
+        count = min(INDEX_BLOCK_BYTES, size - block_start)
+        block = np.frombuffer(mapped, dtype=np.uint8, count=count, offset=block_start)
+        newlines = np.flatnonzero(block == _NEWLINE)
+        quotes = np.flatnonzero(block == quote)
+        if escape is not None and len(quotes):
+            # Escaped quotes do not open or close a field
+            quotes = quotes[(quotes == 0) | (block[np.maximum(quotes - 1, 0)] != escape)]
+        del block
+        # A newline ends a record when an even number of quotes precede it
+        outside = (np.searchsorted(quotes, newlines) + inside) % 2 == 0
+        starts.append(newlines[outside].astype(np.int64) + block_start + 1)
+        inside = (inside + len(quotes)) % 2
+    offsets = np.concatenate(starts)
+    if offsets[-1] != size:
+        offsets = np.append(offsets, size)
+    return offsets
+
+
+class _SpanStream(io.RawIOBase):
+    """Raw stream reading the given byte spans of a file back to back."""
+
+    def __init__(self, handle: BinaryIO, spans: Tuple[Tuple[int, int], ...]):
+        self._handle = handle
+        self._spans = spans
+        self._span = 0
+        self._position = None
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while self._span < len(self._spans):
+            start, end = self._spans[self._span]
+            if self._position is None:
+                self._handle.seek(start)
+                self._position = start
+            if self._position < end:
+                data = self._handle.read(min(len(buffer), end - self._position))
+                if data:
+                    buffer[:len(data)] = data
+                    self._position += len(data)
+                    return len(data)
+            self._span += 1
+            self._position = None
+        return 0
+
+    def close(self) -> None:
+        self._handle.close()
+        super().close()
@@ -0,0 +1,260 @@
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from ddl_generator import DDLGenerator
+from dialect_mapper import DialectMapper
+from profile_artifact import load_profile
+from type_inference import MAX_NUMERIC_PRECISION, TypeInferrer
+
+
+# Exit status when the new file no longer fits its baseline (1 is reserved for errors)
+DRIFT_EXIT_CODE = 3
+# Length given to TEXT/CLOB/STRING baseline columns. Unlike
+# type_inference.UNBOUNDED_TEXT_LENGTH (16 MiB, the length emitted for
+# excluded text), it must exceed any value a database's unbounded type holds
+# (Postgres TEXT takes 1 GB), so such a baseline never widens.
+DRIFT_UNBOUNDED_LENGTH = 2 ** 31 - 1
+UNBOUNDED_TEXT_TYPES = ('TEXT', 'CLOB', 'STRING', 'NVARCHAR(MAX)', 'VARCHAR(MAX)', 'VARCHAR')
+JSON_TYPES = ('JSON', 'JSONB', 'VARIANT')
+FLOATING_TYPES = ('REAL', 'FLOAT', 'DOUBLE', 'DOUBLE PRECISION')
+# Largest inferred precision each dialect maps to a given integer type (see dialect_mapper)
+INTEGER_TYPE_PRECISION = {
+    'postgres': {'SMALLINT': 4, 'INTEGER': 9, 'INT': 9, 'BIGINT': 18},
+    'databricks': {'TINYINT': 3, 'SMALLINT': 5, 'INT': 9, 'BIGINT': 18},
+    'sqlite': {'INTEGER': MAX_NUMERIC_PRECISION},
+}
+DEFAULT_INTEGER_TYPE_PRECISION = {
+    'TINYINT': 3, 'SMALLINT': 5, 'MEDIUMINT': 7, 'INT': 10, 'INTEGER': 10, 'BIGINT': 19,
+}
+CONSTRAINT_KEYWORDS = ('PRIMARY', 'NOT', 'NULL', 'UNIQUE', 'DEFAULT', 'CHECK', 'REFERENCES',
+                       'COMMENT', 'CONSTRAINT', 'COLLATE')
+
+_CREATE_TABLE = re.compile(r'CREATE\s+(?:OR\s+REPLACE\s+)?TABLE\b[^(]*\(', re.IGNORECASE)
+_SIZED_TYPE = re.compile(r'^(\w+)\s*\(\s*(\d+)\s*(?:,\s*(\d+)\s*)?\)$')
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DriftReport:
+    """Columns that changed between a baseline schema and a new file, keyed by identifier."""
+
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    widened: Dict[str, Tuple[str, str]] = field(default_factory=dict)
+    narrowed: Dict[str, Tuple[str, str]] = field(default_factory=dict)
+    rows_checked: int = 0
+    stopped_early: bool = False
+
+    @property
+    def breaking(self) -> bool:
+        """True when the new file would not load into the baseline table."""
+        return bool(self.added or self.removed or self.widened)
+
+    def format(self) -> str:
+        lines = [f"-- Schema drift ({self.rows_checked} rows checked"
+                 f"{', stopped at first widened column' if self.stopped_early else ''})"]
+        for col in self.added:
+            lines.append(f"-- added: {col}")
+        for col in self.removed:
+            lines.append(f"-- removed: {col}")
+        for col, (before, after) in self.widened.items():
+            lines.append(f"-- widened: {col} {before} -> {after}")
+        for col, (before, after) in self.narrowed.items():
+            lines.append(f"-- narrowed: {col} {before} -> {after}")
+        if len(lines) == 1:
+            lines.append("-- no drift")
+        return "\n".join(lines)
+
+
+class SchemaBaseline:
+    """
+    Expected column types from an earlier profile or CREATE TABLE statement.
+
+    Columns are keyed by their lower-cased SQL identifier, so a baseline DDL
+    and a new file line up exactly as the generator would name them.
+    """
+
+    def __init__(self, columns: Dict[str, Dict[str, Any]], dialect: str = 'snowflake'):
+        self.columns = columns
+        self.generator = DDLGenerator(dialect)
+        self.mapper = DialectMapper(dialect)
+
+    @classmethod
+    def load(cls, path: str, dialect: str = 'snowflake') -> 'SchemaBaseline':
+        """Load a JSON profile, or a DDL file written for ``dialect``."""
+        with open(path, 'r', encoding='utf-8') as f:
+            text = f.read()
+        if text.lstrip().startswith('{'):
+            profile = load_profile(path)
+            generator = DDLGenerator(dialect)
+            identifiers = generator.resolve_column_identifiers(profile.type_info)
+            columns = {
+                identifiers[col].lower(): {**info, 'identifier': identifiers[col]}
+                for col, info in profile.type_info.items()
+            }
+        else:
+            columns = parse_ddl_columns(text, dialect)
+        logger.debug("Loaded baseline of %s columns from %s", len(columns), path)
+        return cls(columns, dialect)
+
+    def identifiers(self, column_names) -> Dict[str, str]:
+        """Map source column names to baseline keys."""
+        resolved = self.generator.resolve_column_identifiers([str(col) for col in column_names])
+        return {col: resolved[str(col)].lower() for col in column_names}
+
+    def compare_columns(self, column_names, report: DriftReport) -> None:
+        """Record added and removed columns from a header alone."""
+        keys = self.identifiers(column_names)
+        present = set(keys.values())
+        report.added = [col for col, key in keys.items() if key not in self.columns]
+        report.removed = [info['identifier'] for key, info in self.columns.items() if key not in present]
+
+    def compare_types(self, type_info: Dict[str, Dict[str, Any]], report: DriftReport) -> None:
+        """Record widened and narrowed columns; later calls replace earlier findings."""
+        keys = self.identifiers(type_info)
+        report.widened.clear()
+        report.narrowed.clear()
+        for col, info in type_info.items():
+            baseline = self.columns.get(keys[col])
+            if baseline is None or info.get('all_null'):
+                continue
+            # A DDL baseline only drifts when the rendered column type would change
+            rendered = self.mapper.dialect.map_type(info['inferred_type'], info.get('parameters', {}))
+            if baseline.get('sql_type') == _normalize_sql_type(rendered.partition(' COMMENT ')[0]):
+                continue
+            change = compare_type(baseline, info)
+            if change == 'widened':
+                report.widened[col] = (_describe(baseline), _describe(info))
+            elif change == 'narrowed':
+                report.narrowed[col] = (_describe(baseline), _describe(info))
+
+
+def compare_type(baseline: Dict[str, Any], current: Dict[str, Any]) -> Optional[str]:
+    """
+    Classify ``current`` against ``baseline``.
+
+    Returns ``'widened'`` when the values seen in the new data (before the
+    headroom inference adds) need more than the baseline type, by the
+    widening rules of ``TypeInferrer.merge_column_types``; ``'narrowed'``
+    when the current type fits in a strictly smaller one; and None when
+    they are the same or the data still fits.
+    """
+    merged = TypeInferrer.merge_column_types(baseline, TypeInferrer.observed_type(current))
+    if _capacity(merged) != _capacity(baseline):
+        return 'widened'
+    # Only the parameters the baseline records can narrow (a DDL has no byte lengths)
+    fits = _capacity(TypeInferrer.merge_column_types(baseline, current)) == _capacity(baseline)
+    if fits and _capacity(current, baseline) != _capacity(baseline):
+        return 'narrowed'
+    return None
+
+
+def parse_ddl_columns(ddl: str, dialect: str = 'snowflake') -> Dict[str, Dict[str, Any]]:
+    """Parse the first CREATE TABLE statement into identifier -> type info."""
+    match = _CREATE_TABLE.search(ddl)
+    if not match:
+        raise ValueError("Baseline contains no CREATE TABLE statement")
+
+    columns = {}
+    for definition in _split_top_level(ddl[match.end():]):
+        tokens = definition.split()
+        if not tokens or tokens[0].upper() in ('CONSTRAINT', 'PRIMARY', 'UNIQUE', 'FOREIGN', 'CHECK'):
+            continue
+        identifier = tokens[0].strip('"`[]')
+        type_tokens = []
+        for token in tokens[1:]:
+            if token.upper() in CONSTRAINT_KEYWORDS:
+                break
+            type_tokens.append(token)
+        sql_type = ' '.join(type_tokens)
+        columns[identifier.lower()] = {
+            **parse_sql_type(sql_type, dialect),
+            'identifier': identifier,
+            'sql_type': _normalize_sql_type(sql_type)
+        }
+    return columns
+
+
+def parse_sql_type(sql_type: str, dialect: str = 'snowflake') -> Dict[str, Any]:
+    """Map a rendered SQL type back to the inferred type family and parameters."""
+    normalized = _normalize_sql_type(sql_type)
+    if normalized == 'DATE':
+        return _type_info('date', {})
+    if normalized in JSON_TYPES:
+        return _type_info('json', {})
+    if normalized in UNBOUNDED_TEXT_TYPES:
+        return _type_info('string', {'max_length': DRIFT_UNBOUNDED_LENGTH})
+    if normalized in FLOATING_TYPES:
+        return _type_info('float', {'precision': MAX_NUMERIC_PRECISION, 'scale': 15})
+
+    integer_types = INTEGER_TYPE_PRECISION.get(dialect, DEFAULT_INTEGER_TYPE_PRECISION)
+    if normalized in integer_types:
+        return _type_info('integer', {'precision': integer_types[normalized], 'scale': 0})
+    if normalized in ('NUMBER', 'NUMERIC', 'DECIMAL'):
+        return _type_info('float', {'precision': MAX_NUMERIC_PRECISION, 'scale': 15})
+
+    sized = _SIZED_TYPE.match(normalized.replace(', ', ','))
+    if sized:
+        name, first, second = sized.group(1), int(sized.group(2)), sized.group(3)
+        if name in ('NUMBER', 'NUMERIC', 'DECIMAL'):
+            scale = int(second or 0)
+            if scale == 0:
+                return _type_info('integer', {'precision': first, 'scale': 0})
+            return _type_info('float', {'precision': first, 'scale': scale})
+        if name in ('VARCHAR', 'VARCHAR2', 'NVARCHAR', 'CHAR', 'NCHAR', 'STRING'):
+            dialect_class = DialectMapper.DIALECTS.get(dialect)
+            if name not in ('NVARCHAR', 'NCHAR') and dialect_class is not None \
+                    and dialect_class.LENGTH_SEMANTICS == 'byte':
+                return _type_info('string', {'max_length': first, 'max_bytes': first})
+            return _type_info('string', {'max_length': first})
+    raise ValueError(f"Cannot interpret baseline column type: {sql_type}")
+
+
+def _normalize_sql_type(sql_type: str) -> str:
+    normalized = re.sub(r'\s+', ' ', sql_type.strip().upper())
+    return re.sub(r'\s*([(),])\s*', r'\1', normalized).replace(',', ', ')
+
+
+def _type_info(inferred_type: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    return {'inferred_type': inferred_type, 'parameters': params}
+
+
+def _capacity(info: Dict[str, Any], like: Optional[Dict[str, Any]] = None) -> Tuple[str, Tuple]:
+    params = info.get('parameters', {})
+    if like is not None and info['inferred_type'] == like['inferred_type']:
+        params = {key: value for key, value in params.items() if key in like.get('parameters', {})}
+    return info['inferred_type'], tuple(sorted(params.items()))
+
+
+def _describe(info: Dict[str, Any]) -> str:
+    params = info.get('parameters', {})
+    if info['inferred_type'] == 'string':
+        length = params.get('max_length')
+        return 'string(unbounded)' if length == DRIFT_UNBOUNDED_LENGTH else f"string({length})"
+    if info['inferred_type'] in ('integer', 'float'):
+        return f"{info['inferred_type']}({params.get('precision')}, {params.get('scale', 0)})"
+    return info['inferred_type']
+
+
+def _split_top_level(body: str) -> List[str]:
+    """Split a column list on top-level commas, stopping at its closing parenthesis."""
+    parts = []
+    depth = 0
+    current = []
+    for char in body:
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            if depth == 0:
+                break
+            depth -= 1
+        elif char == ',' and depth == 0:
+            parts.append(''.join(current).strip())
+            current = []
+            continue
+        current.append(char)
+    parts.append(''.join(current).strip())
+    return [part for part in parts if part]
@@ -0,0 +1,127 @@
+import logging
+from typing import Any, Dict, List, Optional
+
+from bad_rows import RejectSummary
+from column_stats import ColumnStats, HyperLogLog
+from ddl_generator import DDLGenerator
+from profile_artifact import TableProfile
+from type_inference import TypeInferrer
+
+
+logger = logging.getLogger(__name__)
+
+
+def union_profiles(profiles: List[TableProfile],
+                   table_name: Optional[str] = None,
+                   dialect: str = 'snowflake') -> TableProfile:
+    """
+    Merge per-file profiles of one logical table into a single profile.
+
+    Columns are aligned by their sanitized SQL identifier (case-insensitive),
+    so ``Order ID`` in one file and ``order_id`` in another become one column
+    named as in the first file that has it. Types are widened with
+    ``TypeInferrer.merge_column_types`` and statistics merged in file order.
+    A column missing from some files is flagged with ``missing_from`` and
+    counts those files' rows as nulls, so it is never suggested NOT NULL.
+    """
+    if not profiles:
+        raise ValueError("No profiles to unify")
+
+    generator = DDLGenerator(dialect)
+    names: Dict[str, str] = {}
+    type_info: Dict[str, Dict[str, Any]] = {}
+    present: Dict[str, List[int]] = {}
+    for index, profile in enumerate(profiles):
+        identifiers = generator.resolve_column_identifiers([str(col) for col in profile.type_info])
+        for col, info in profile.type_info.items():
+            key = identifiers[str(col)].lower()
+            if key not in names:
+                names[key] = col
+                type_info[key] = info
+                present[key] = []
+            else:
+                type_info[key] = TypeInferrer.merge_column_types(type_info[key], info)
+            present[key].append(index)
+
+    stats = None
+    if all(profile.stats is not None for profile in profiles):
+        stats = _union_stats(profiles, generator, present)
+
+    merged = {}
+    for key, col in names.items():
+        info = {key_: value for key_, value in type_info[key].items() if key_ != 'missing_from'}
+        if len(present[key]) < len(profiles):
+            seen = set(present[key])
+            info['missing_from'] = [
+                profile.source for index, profile in enumerate(profiles) if index not in seen
+            ]
+        merged[col] = info
+
+    partial = sum(1 for info in merged.values() if 'missing_from' in info)
+    logger.info("Unified %s files into %s columns (%s not present in every file)",
+                len(profiles), len(merged), partial)
+
+    dialects = {profile.csv_dialect for profile in profiles}
+    return TableProfile(
+        source=_describe_sources(profiles),
+        table_name=table_name or profiles[0].table_name,
+        row_count=sum(profile.row_count for profile in profiles),
+        type_info=merged,
+        stats=None if stats is None else {names[key]: stats[key] for key in names},
+        csv_dialect=dialects.pop() if len(dialects) == 1 else None,
+        rejects=_union_rejects(profiles)
+    )
+
+
+def format_partial_columns(type_info: Dict[str, Dict[str, Any]]) -> str:
+    """Render the columns missing from some input files as SQL comments."""
+    lines = []
+    for col, info in type_info.items():
+        missing = info.get('missing_from')
+        if missing:
+            lines.append(f"--   {col}: missing from {len(missing)} files (e.g. {missing[0]})")
+    if not lines:
+        return ""
+    return "\n".join(["-- Columns not present in every file (nullable):"] + lines)
+
+
+def _union_stats(profiles: List[TableProfile],
+                 generator: DDLGenerator,
+                 present: Dict[str, List[int]]) -> Dict[str, ColumnStats]:
+    stats: Dict[str, ColumnStats] = {}
+    for index, profile in enumerate(profiles):
+        identifiers = generator.resolve_column_identifiers([str(col) for col in profile.type_info])
+        by_key = {
+            identifiers[str(col)].lower(): profile.stats[col]
+            for col in profile.type_info if col in profile.stats
+        }
+        for key, indexes in present.items():
+            col_stats = by_key.get(key)
+            if col_stats is None:
+                if index in indexes:
+                    continue
+                # Rows of a file without the column load as NULLs
+                col_stats = ColumnStats(row_count=profile.row_count, null_count=profile.row_count)
+            if key not in stats:
+                stats[key] = ColumnStats(sketch=HyperLogLog(col_stats.sketch.precision))
+            stats[key].merge(col_stats)
+    return stats
+
+
+def _union_rejects(profiles: List[TableProfile]) -> Optional[RejectSummary]:
+    summaries = [profile.rejects for profile in profiles if profile.rejects is not None]
+    if not summaries:
+        return None
+    files = [summary.reject_file for summary in summaries if summary.reject_file]
+    return RejectSummary(
+        rejected=sum(summary.rejected for summary in summaries),
+        rows_checked=sum(summary.rows_checked for summary in summaries),
+        # Several files cannot be named in one place; each was logged when written
+        reject_file=files[0] if len(files) == 1 else None
+    )
+
+
+def _describe_sources(profiles: List[TableProfile]) -> str:
+    if len(profiles) == 1:
+        return profiles[0].source
+    return f"{profiles[0].source} and {len(profiles) - 1} more files"
@@ -0,0 +1,51 @@
+import csv
+import io
+
+import pandas as pd
+import pytest
+
+from bad_rows import RejectLog
+
+READ_OPTIONS = {'delimiter': ',', 'quotechar': '"', 'escapechar': None, 'doublequote': True}
+
+
+def _read(log, text, **options):
+    options = {**READ_OPTIONS, **options}
+    return pd.read_csv(log.validate(io.StringIO(text, newline=''), options), **options)
+
+
+def test_rejects_records_with_extra_fields_and_keeps_line_numbers(tmp_path):
+    reject_path = tmp_path / "rejects.csv"
+    log = RejectLog(str(reject_path), max_error_rate=0.5)
+
+    df = _read(log, 'junk\na,b\n1,2\n3,4,5\n"x\ny",6\n\n7,8,9,10\n11,12\n', skiprows=1)
+    log.close()
+
+    assert df["a"].tolist() == ["1", "x\ny", "11"]
+    with open(reject_path, newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    assert [(row["line"], row["fields"], row["record"]) for row in rows] == [
+        ("4", "3", "3,4,5"),
+        ("8", "4", "7,8,9,10"),
+    ]
+    summary = log.summary()
+    assert (summary.rejected, summary.rows_checked) == (2, 5)
+    assert "2 of 5" in summary.describe()
+
+
+def test_repeated_passes_count_each_record_once():
+    log = RejectLog(max_error_rate=0.5)
+    for _ in range(2):
+        _read(log, "1,2\n3,4,5\n5,6\n", header=None, names=["c1", "c2"])
+
+    assert log.rejected == 1
+    assert log.rows_checked == 3
+    assert log.summary().reject_file is None
+
+
+def test_error_rate_limit_stops_the_read():
+    log = RejectLog(max_error_rate=0.01)
+    text = "a,b\n" + "1,2,3\n" * 20 + "1,2\n" * 2000
+
+    with pytest.raises(ValueError, match="wrong number of fields"):
+        _read(log, text)
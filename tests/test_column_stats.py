@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+
+from column_stats import ColumnProfiler, ColumnStats, HyperLogLog, format_stats_report, suggest_constraints
+
+
+def test_sketch_estimate_within_error_bounds():
+    sketch = HyperLogLog()
+    sketch.add_series(pd.Series(np.arange(200_000)))
+
+    assert sketch.exact_hashes is None
+    assert abs(sketch.estimate() - 200_000) / 200_000 < 0.05
+
+
+def test_sketches_merge_across_chunks():
+    left = HyperLogLog()
+    right = HyperLogLog()
+    left.add_series(pd.Series(np.arange(0, 60_000)))
+    right.add_series(pd.Series(np.arange(30_000, 90_000)))
+
+    left.merge(right)
+
+    assert abs(left.estimate() - 90_000) / 90_000 < 0.05
+
+
+def test_profiler_detects_keys_and_low_cardinality():
+    df = pd.DataFrame({
+        "id": range(200),
+        "status": ["open", "closed"] * 100,
+        "notes": ["x"] * 150 + [None] * 50,
+    })
+    profiler = ColumnProfiler()
+    profiler.update(df.iloc[:120])
+    profiler.update(df.iloc[120:])
+
+    stats = profiler.stats
+    assert stats["id"].is_key_candidate
+    assert stats["status"].is_low_cardinality
+    assert stats["notes"].null_ratio == 0.25
+
+    type_info = {
+        "id": {"inferred_type": "integer"},
+        "status": {"inferred_type": "string"},
+        "notes": {"inferred_type": "string"},
+    }
+    constraints = suggest_constraints(stats, type_info)
+    assert constraints == {"id": ["PRIMARY KEY"], "status": ["NOT NULL"]}
+    assert "low_cardinality" in format_stats_report(stats)
+
+
+def test_monotonic_order_tracked_across_chunks():
+    df = pd.DataFrame({"seq": [1, 2, 3, 4, 3, 5]})
+    type_info = {"seq": {"inferred_type": "integer"}}
+
+    ordered = ColumnProfiler()
+    ordered.update(df.iloc[:3], type_info)
+    ordered.update(df.iloc[3:4], type_info)
+    broken = ColumnProfiler()
+    broken.update(df.iloc[:4], type_info)
+    broken.update(df.iloc[4:], type_info)
+
+    assert ordered.stats["seq"].is_monotonic
+    assert not broken.stats["seq"].is_monotonic
+
+
+def test_categorical_dates_track_order_without_expanding():
+    dates = pd.Series(["2024-01-01", "2024-01-01", "2024-02-01", "bad", "2024-03-01"])
+    profiler = ColumnProfiler()
+
+    profiler.update(pd.DataFrame({"day": dates.astype("category")}), {"day": {"inferred_type": "date"}})
+
+    stats = profiler.stats["day"]
+    assert stats.is_monotonic
+    assert stats.distinct_estimate == 4
+
+
+def test_sketch_counts_values_alike_across_chunk_dtypes():
+    stats = ColumnStats()
+    stats.update(pd.Series([1, 2, 3]))
+    stats.update(pd.Series([2.0, None, 3.0, 1.5]))
+    stats.update(pd.Series(["3", "4", "04"], dtype=object))
+    stats.update(pd.Series([4, 5]).astype("category"))
+
+    # 1, 2, 3, 1.5, 4, '04', 5
+    assert stats.distinct_estimate == 7
+
+
+def test_key_candidate_estimated_past_exact_limit():
+    rows = 20_000
+    profiler = ColumnProfiler()
+    df = pd.DataFrame({"id": range(rows), "half": np.arange(rows) // 2})
+    for start in range(0, rows, 5_000):
+        profiler.update(df.iloc[start:start + 5_000])
+
+    stats = profiler.stats
+    assert not stats["id"].is_exact
+    assert stats["id"].is_key_candidate
+    assert not stats["half"].is_key_candidate
+    type_info = {"id": {"inferred_type": "integer"}, "half": {"inferred_type": "integer"}}
+    assert suggest_constraints(stats, type_info)["id"] == ["PRIMARY KEY"]
+    assert "key_candidate~" in format_stats_report(stats)
@@ -0,0 +1,59 @@
+from csv_sniffer import CsvDialect, sniff_dialect
+
+
+def test_sniffs_semicolon_with_junk_rows_and_quoted_delimiters():
+    sample = (
+        "Report generated 2024-01-01\n"
+        "\n"
+        "id;name;amount\n"
+        "1;Alpha;3,5\n"
+        '2;"Beta; x";4,0\n'
+        "3;C;1\n"
+    )
+
+    dialect = sniff_dialect(sample)
+
+    assert dialect.delimiter == ";"
+    assert dialect.skip_rows == 2
+    assert dialect.has_header
+    assert dialect.confidence == 1.0
+
+
+def test_sniffs_headerless_pipe_file():
+    dialect = sniff_dialect("1|alpha|2024-01-01\n2|beta|2024-01-02\n3|gamma|2024-01-03\n")
+
+    assert dialect.delimiter == "|"
+    assert not dialect.has_header
+    assert dialect.read_options()["header"] is None
+
+
+def test_sniffs_quote_and_escape_style():
+    backslash = sniff_dialect('id,text\n1,"he said \\"hi\\""\n2,"ok"\n')
+    single = sniff_dialect("id,name\n1,'O''Brien, P'\n2,'x'\n")
+
+    assert backslash.escapechar == "\\"
+    assert not backslash.doublequote
+    assert single.quotechar == "'"
+
+
+def test_single_column_falls_back_with_zero_confidence():
+    dialect = sniff_dialect("name\nalpha\nbeta\n")
+
+    assert dialect == CsvDialect(confidence=0.0)
+
+
+def test_one_ragged_row_keeps_the_real_delimiter():
+    rows = ["a;b;c"] + [f"{i};x{i};{i * 2}" for i in range(300)]
+    rows[150] = "150;x;300;extra"
+
+    dialect = sniff_dialect("\n".join(rows) + "\n")
+
+    assert dialect.delimiter == ";"
+    assert dialect.confidence > 0.9
+    assert sniff_dialect("\n".join(row.replace(";", ",") for row in rows)).delimiter == ","
+
+
+def test_text_only_file_keeps_its_header():
+    dialect = sniff_dialect("name,code\nJohn,ABCD\nJane,WXYZ\nMark,QRST\n")
+
+    assert dialect.has_header
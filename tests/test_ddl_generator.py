@@ -15,3 +15,37 @@ def test_generate_ddl_sanitizes_and_uniquifies_columns():
     assert "order_date_1 DATE" in ddl
     assert "Select_col VARCHAR(10)" in ddl
     assert "__" not in ddl
+
+
+def test_generate_ddl_resumes_suffixes_for_colliding_names():
+    generator = DDLGenerator("snowflake")
+    column_types = {"a_1": "INT"}
+    column_types.update({f"a{'!' * i}": "INT" for i in range(1, 5)})
+
+    ddl = generator.generate_ddl("wide", column_types)
+
+    lines = [line.strip() for line in ddl.splitlines()[1:-1]]
+    assert lines == ["a_1 INT,", "a INT,", "a_2 INT,", "a_3 INT,", "a_4 INT"]
+
+
+def test_generate_ddl_appends_column_constraints():
+    generator = DDLGenerator("postgres")
+
+    ddl = generator.generate_ddl(
+        "orders",
+        {"id": "INTEGER", "status": "VARCHAR(10)"},
+        column_constraints={"id": ["PRIMARY KEY"], "status": ["NOT NULL"]},
+    )
+
+    assert "id INTEGER PRIMARY KEY," in ddl
+    assert "status VARCHAR(10) NOT NULL" in ddl
+
+
+def test_generate_ddl_places_constraints_before_type_comment():
+    ddl = DDLGenerator("databricks").generate_ddl(
+        "events",
+        {"payload": "STRING COMMENT 'JSON'"},
+        column_constraints={"payload": ["NOT NULL"]},
+    )
+
+    assert "payload STRING NOT NULL COMMENT 'JSON'" in ddl
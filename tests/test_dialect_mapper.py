@@ -59,6 +59,29 @@ def test_map_mysql_string_to_text():
     assert mapped["notes"] == "TEXT"
 
 
+def test_string_lengths_use_each_dialects_length_unit():
+    type_info = {
+        "city": {
+            "inferred_type": "string",
+            "parameters": {"max_length": 20, "max_bytes": 50}
+        },
+        "notes": {
+            "inferred_type": "string",
+            "parameters": {"max_length": 20000, "max_bytes": 20000}
+        }
+    }
+
+    oracle = DialectMapper("oracle").map_column_types(type_info)
+    snowflake = DialectMapper("snowflake").map_column_types(type_info)
+    mysql = DialectMapper("mysql").map_column_types(type_info)
+
+    assert oracle["city"] == "VARCHAR2(50)"
+    assert oracle["notes"] == "CLOB"
+    assert snowflake["city"] == "VARCHAR(20)"
+    # utf8mb4 VARCHAR columns over 16383 characters break MySQL's row-size limit
+    assert mysql["notes"] == "TEXT"
+
+
 def test_map_oracle_string_to_clob():
     type_info = {
         "payload": {
@@ -146,3 +169,19 @@ def test_map_databricks_string_overflow_to_string():
 def test_unsupported_dialect_raises():
     with pytest.raises(ValueError):
         DialectMapper("teradata")
+
+
+def test_json_maps_to_semi_structured_types():
+    type_info = {"payload": {"inferred_type": "json", "parameters": {}}}
+    expected = {
+        "snowflake": "VARIANT",
+        "postgres": "JSONB",
+        "mysql": "JSON",
+        "databricks": "STRING COMMENT 'JSON'",
+        "sqlite": "TEXT",
+        "oracle": "CLOB",
+        "sqlserver": "NVARCHAR(MAX)",
+    }
+
+    for dialect, sql_type in expected.items():
+        assert DialectMapper(dialect).map_column_types(type_info)["payload"] == sql_type
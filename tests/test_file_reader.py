@@ -1,6 +1,12 @@
+import io
+import os
+import threading
+
 import pandas as pd
+import pytest
 
-from file_reader import FileReader
+from bad_rows import RejectLog
+from file_reader import ColumnFilter, FileReader, StreamSource
 
 
 def test_read_csv(tmp_path):
@@ -31,3 +37,143 @@ def test_read_csv_with_encoding_detection(tmp_path):
     df = FileReader.read_file(str(csv_path), delimiter=";")
 
     assert df.iloc[0]["name"] == "José"
+
+
+def test_wide_csv_path_matches_pandas_column_names(tmp_path, monkeypatch):
+    import file_reader
+
+    csv_path = tmp_path / "wide.csv"
+    csv_path.write_text("a,,a,a.1,a\n1,2,3,4,5\n", encoding="utf-8")
+    expected = list(pd.read_csv(csv_path).columns)
+
+    monkeypatch.setattr(file_reader, "WIDE_TABLE_COLUMNS", 2)
+    df = FileReader.read_file(str(csv_path))
+
+    assert list(df.columns) == expected
+    assert df.iloc[0].tolist() == [1, 2, 3, 4, 5]
+
+
+def test_header_over_column_limit_is_rejected(tmp_path):
+    csv_path = tmp_path / "too_wide.csv"
+    csv_path.write_text("a,b,c\n1,2,3\n", encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        FileReader.read_file(str(csv_path), max_columns=2)
+
+
+def test_iter_chunks_streams_all_rows(tmp_path):
+    csv_path = tmp_path / "rows.csv"
+    pd.DataFrame({"id": range(25), "name": ["x"] * 25}).to_csv(csv_path, index=False)
+
+    chunks = list(FileReader.iter_chunks(str(csv_path), chunk_rows=10))
+
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    assert chunks[-1]["id"].tolist() == list(range(20, 25))
+
+
+def test_stream_source_replays_prefix(tmp_path):
+    rows = "".join(f"{i},name{i}\n" for i in range(500))
+    source = StreamSource(io.BytesIO(("id,name\n" + rows).encode("utf-8")), "<test>", prefix_bytes=64)
+
+    chunks = list(FileReader.iter_chunks(source, chunk_rows=200))
+
+    assert FileReader.detect_file_type(source) == "csv"
+    assert [len(chunk) for chunk in chunks] == [200, 200, 100]
+    assert chunks[-1].iloc[-1]["name"] == "name499"
+    with pytest.raises(ValueError):
+        source.open()
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="named pipes not supported")
+def test_read_named_pipe(tmp_path):
+    fifo_path = tmp_path / "data.csv"
+    os.mkfifo(fifo_path)
+
+    def write_rows():
+        with open(fifo_path, "w", encoding="utf-8") as f:
+            f.write("id,name\n1,Alpha\n2,Beta\n")
+
+    writer = threading.Thread(target=write_rows)
+    writer.start()
+    assert FileReader.is_stream_path(str(fifo_path))
+    df = FileReader.read_file(FileReader.open_stream(str(fifo_path)))
+    writer.join()
+
+    assert list(df.columns) == ["id", "name"]
+    assert len(df) == 2
+
+
+def test_read_csv_with_sniffed_dialect(tmp_path):
+    csv_path = tmp_path / "export.csv"
+    csv_path.write_text("Exported by: ops\n1|Alpha\n2|Beta\n3|Gamma\n", encoding="utf-8")
+
+    dialect = FileReader.sniff_dialect(str(csv_path))
+    df = FileReader.read_file(str(csv_path), delimiter=None)
+
+    assert dialect.delimiter == "|"
+    assert dialect.skip_rows == 1
+    assert list(df.columns) == ["column_1", "column_2"]
+    assert len(df) == 3
+
+
+def test_iter_chunks_projects_columns_and_limits_rows(tmp_path):
+    csv_path = tmp_path / "wide.csv"
+    csv_path.write_text("a,b,c\n" + "".join(f"{i},{i},{i}\n" for i in range(50)), encoding="utf-8")
+
+    chunks = list(FileReader.iter_chunks(str(csv_path), chunk_rows=20, usecols=["b"], nrows=30))
+
+    assert [list(chunk.columns) for chunk in chunks] == [["b"], ["b"]]
+    assert sum(len(chunk) for chunk in chunks) == 30
+
+
+def test_column_filter_projects_read(tmp_path):
+    csv_path = tmp_path / "export.csv"
+    csv_path.write_text("id,notes_1,notes_2,amount\n1,a,b,2.5\n", encoding="utf-8")
+    column_filter = ColumnFilter.from_args(exclude_columns=["notes_.*"])
+
+    columns = FileReader.read_columns(str(csv_path))
+    df = FileReader.read_file(str(csv_path), usecols=column_filter.select(columns))
+
+    assert columns == ["id", "notes_1", "notes_2", "amount"]
+    assert list(df.columns) == ["id", "amount"]
+    assert ColumnFilter.from_args(columns=["id,amount"]).select(columns) == ["id", "amount"]
+    assert not ColumnFilter.from_args()
+
+
+def test_sample_read_in_blocks_is_compacted(tmp_path, monkeypatch):
+    monkeypatch.setattr("file_reader.COMPACT_BLOCK_CELLS", 1)
+    monkeypatch.setattr("file_reader.MIN_COMPACT_BLOCK_ROWS", 7)
+    csv_path = tmp_path / "orders.csv"
+    statuses = ["open", "closed", "pending"]
+    csv_path.write_text(
+        "id,status,note\n"
+        + "".join(f"{i},{statuses[i % 3]},note {i}\n" for i in range(40))
+        + "40,on_hold,\n",
+        encoding="utf-8"
+    )
+
+    df = FileReader.read_file(str(csv_path))
+
+    assert len(df) == 41
+    assert isinstance(df["status"].dtype, pd.CategoricalDtype)
+    assert set(df["status"].cat.categories) == set(statuses) | {"on_hold"}
+    assert df["status"].tolist()[:4] == ["open", "closed", "pending", "open"]
+    assert not isinstance(df["note"].dtype, pd.CategoricalDtype)
+    assert df["note"].iloc[39] == "note 39" and pd.isna(df["note"].iloc[40])
+    assert df["id"].tolist() == list(range(41))
+
+
+def test_iter_chunks_quarantines_bad_rows_from_a_stream(tmp_path):
+    reject_path = tmp_path / "rejects.csv"
+    rejects = RejectLog(str(reject_path), max_error_rate=0.1)
+    body = "id,name\n" + "".join(
+        f"{i},x,extra\n" if i == 7 else f"{i},name{i}\n" for i in range(40)
+    )
+    source = StreamSource(io.BytesIO(body.encode()), "<test>")
+
+    chunks = list(FileReader.iter_chunks(source, chunk_rows=16, rejects=rejects))
+    rejects.close()
+
+    assert sum(len(chunk) for chunk in chunks) == 39
+    assert rejects.summary().rejected == 1
+    assert reject_path.read_text().splitlines()[1] == "9,3,2,\"7,x,extra\""
@@ -0,0 +1,77 @@
+import json
+
+import pytest
+
+from file_reader import FileReader
+from fixed_width import FixedWidthLayout, FixedWidthSource
+
+
+def _write_report(path, rows=30, line_ending="\n"):
+    lines = ["id      name          amount  joined"]
+    for i in range(1, rows + 1):
+        lines.append(f"{i:<8}{'name' + str(i):<14}{i * 1.5:>8.2f}  2024-01-{i % 28 + 1:02d}")
+    path.write_bytes(line_ending.join(lines).encode() + line_ending.encode())
+
+
+def test_infer_layout_with_header_and_right_aligned_numbers(tmp_path):
+    path = tmp_path / "report.fwf"
+    _write_report(path)
+
+    source = FixedWidthSource.open(str(path))
+
+    assert source.layout.names == ["id", "name", "amount", "joined"]
+    assert source.layout.skip_rows == 1
+    df = source.read()
+    assert len(df) == 30
+    assert df.iloc[0].tolist() == ["1", "name1", "1.50", "2024-01-02"]
+
+
+def test_layout_spec_and_blank_fields(tmp_path):
+    path = tmp_path / "packed.txt"
+    path.write_text("0001ALPHA  20\n0002       \n0003GAMMA 7\n", encoding="utf-8")
+    layout_path = tmp_path / "layout.json"
+    layout_path.write_text(json.dumps({"fields": [
+        {"name": "id", "start": 0, "width": 4},
+        {"name": "label", "start": 4, "width": 6},
+        {"name": "qty", "start": 10, "width": 3},
+    ]}), encoding="utf-8")
+
+    source = FixedWidthSource(str(path), FixedWidthLayout.load(str(layout_path)))
+    df = source.read()
+
+    assert df["id"].tolist() == ["0001", "0002", "0003"]
+    assert df["label"].isna().tolist() == [False, True, False]
+    # The ragged last line ends inside the qty field
+    assert df["qty"].tolist()[0] == "20"
+    assert df["qty"].tolist()[2] == "7"
+
+
+def test_invalid_layout_is_rejected():
+    with pytest.raises(ValueError):
+        FixedWidthLayout.from_dict({"fields": [{"name": "id", "start": 0}]})
+    with pytest.raises(ValueError):
+        FixedWidthLayout.from_dict({"fields": []})
+
+
+@pytest.mark.parametrize("line_ending", ["\n", "\r\n"])
+def test_chunks_and_projection_match_full_read(tmp_path, line_ending):
+    path = tmp_path / "report.dat"
+    _write_report(path, rows=25, line_ending=line_ending)
+
+    source = FixedWidthSource.open(str(path))
+    chunks = list(source.iter_chunks(10, usecols=["amount"]))
+
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    assert all(list(chunk.columns) == ["amount"] for chunk in chunks)
+    assert chunks[-1]["amount"].iloc[-1] == "37.50"
+    assert source.read(nrows=3)["joined"].tolist() == ["2024-01-02", "2024-01-03", "2024-01-04"]
+
+
+def test_file_reader_infers_fixed_width_by_extension(tmp_path):
+    path = tmp_path / "report.fwf"
+    _write_report(path)
+
+    assert FileReader.detect_file_type(str(path)) == "fixed_width"
+    assert FileReader.read_columns(str(path)) == ["id", "name", "amount", "joined"]
+    df = FileReader.read_file(str(path), sample_size=5)
+    assert len(df) == 5
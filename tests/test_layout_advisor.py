@@ -0,0 +1,62 @@
+import pandas as pd
+
+from column_stats import ColumnProfiler
+from ddl_generator import DDLGenerator
+from layout_advisor import LayoutAdvisor
+
+
+def _profile():
+    df = pd.DataFrame({
+        "id": range(300),
+        "event_date": pd.date_range("2024-01-01", periods=300, freq="D").strftime("%Y-%m-%d"),
+        "region": ["north", "south", "east"] * 100,
+    })
+    type_info = {
+        "id": {"inferred_type": "integer"},
+        "event_date": {"inferred_type": "date"},
+        "region": {"inferred_type": "string"},
+    }
+    profiler = ColumnProfiler()
+    profiler.update(df.iloc[:100], type_info)
+    profiler.update(df.iloc[100:], type_info)
+    return type_info, profiler.stats
+
+
+def test_snowflake_cluster_by_low_cardinality_then_date():
+    type_info, stats = _profile()
+    advisor = LayoutAdvisor("snowflake")
+
+    hints = advisor.suggest(type_info, stats)
+    options, statements = advisor.render("events", hints, {c: c for c in type_info})
+
+    assert options == ["CLUSTER BY (region, event_date)"]
+    assert statements == []
+    assert "sorted order" in LayoutAdvisor.format_justifications(hints)
+
+
+def test_postgres_brin_index_for_monotonic_date():
+    type_info, stats = _profile()
+    advisor = LayoutAdvisor("postgres")
+    generator = DDLGenerator("postgres")
+
+    hints = advisor.suggest(type_info, stats)
+    options, statements = advisor.render(
+        "events", hints, generator.resolve_column_identifiers(type_info)
+    )
+
+    assert options == []
+    assert statements == [
+        "CREATE INDEX IF NOT EXISTS idx_events_event_date ON events USING BRIN (event_date);"
+    ]
+
+
+def test_databricks_partition_and_table_options_rendered():
+    type_info, stats = _profile()
+    advisor = LayoutAdvisor("databricks")
+
+    options, _ = advisor.render("events", advisor.suggest(type_info, stats), {c: c for c in type_info})
+    ddl = DDLGenerator("databricks").generate_ddl(
+        "events", {"id": "INT", "event_date": "DATE", "region": "STRING"}, table_options=options
+    )
+
+    assert ddl.endswith(")\nPARTITIONED BY (event_date);")
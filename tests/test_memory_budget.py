@@ -0,0 +1,60 @@
+import pandas as pd
+import pytest
+
+from file_reader import MAX_SAMPLE_ROWS, FileReader
+from memory_budget import CHUNK_BUDGET_FRACTION, MemoryPlan, parse_byte_size
+
+
+def test_parse_byte_size_units():
+    assert parse_byte_size("512MB") == 512 * 1024 ** 2
+    assert parse_byte_size("2g") == 2 * 1024 ** 3
+    assert parse_byte_size("4096") == 4096
+    with pytest.raises(ValueError):
+        parse_byte_size("lots")
+
+
+def test_plan_scales_sample_with_row_width():
+    narrow = pd.DataFrame({"id": range(200)})
+    wide = pd.DataFrame({f"text_{i}": ["x" * 200] * 200 for i in range(50)})
+
+    narrow_plan = MemoryPlan.from_probe(narrow, parse_byte_size("512MB"))
+    wide_plan = MemoryPlan.from_probe(wide, parse_byte_size("512MB"))
+
+    assert narrow_plan.sample_rows > MAX_SAMPLE_ROWS
+    assert wide_plan.sample_rows < narrow_plan.sample_rows / 100
+    assert wide_plan.chunk_rows <= wide_plan.sample_rows
+
+
+def test_read_file_uses_budget_instead_of_fixed_cap(tmp_path):
+    csv_path = tmp_path / "narrow.csv"
+    pd.DataFrame({"id": range(MAX_SAMPLE_ROWS + 500)}).to_csv(csv_path, index=False)
+
+    plan = FileReader.plan_memory(str(csv_path), parse_byte_size("64MB"))
+    df = FileReader.read_file(str(csv_path), memory_plan=plan)
+
+    assert len(df) == MAX_SAMPLE_ROWS + 500
+
+
+def test_statistics_are_reserved_only_when_collected():
+    wide = pd.DataFrame({f"col_{i}": range(10) for i in range(10000)})
+    budget = parse_byte_size("512MB")
+
+    plan = MemoryPlan.from_probe(wide, budget)
+    assert plan.stats_bytes == 0
+    with pytest.raises(ValueError, match="cannot hold statistics"):
+        MemoryPlan.from_probe(wide, budget, collect_stats=True)
+
+
+def test_chunks_fit_the_budget_before_compaction(tmp_path):
+    csv_path = tmp_path / "repetitive.csv"
+    pd.DataFrame({f"status_{i}": ["pending", "shipped", "returned"] * 8000
+                  for i in range(20)}).to_csv(csv_path, index=False)
+    budget = parse_byte_size("16MB")
+
+    plan = FileReader.plan_memory(str(csv_path), budget)
+    chunks = list(FileReader.iter_chunks(str(csv_path), chunk_rows=plan.chunk_rows))
+
+    assert len(chunks) > 1
+    assert plan.chunk_bytes_per_row > plan.bytes_per_row
+    for chunk in chunks:
+        assert chunk.memory_usage(deep=True).sum() <= budget * CHUNK_BUDGET_FRACTION * 1.05
@@ -0,0 +1,55 @@
+import threading
+
+import pytest
+
+from pipeline import run_pipeline
+
+
+def test_pipeline_preserves_order_and_bounds_read_ahead():
+    produced = []
+    consumed = []
+    max_ahead = []
+    lock = threading.Lock()
+
+    def produce():
+        for i in range(20):
+            with lock:
+                produced.append(i)
+            yield i
+
+    def consume(item):
+        with lock:
+            max_ahead.append(len(produced) - len(consumed))
+        consumed.append(item)
+
+    stats = run_pipeline(produce(), consume, depth=2)
+
+    assert consumed == list(range(20))
+    assert stats.chunks == 20
+    assert max(max_ahead) <= 2 + 2
+
+
+def test_pipeline_reraises_producer_errors():
+    def produce():
+        yield 1
+        raise ValueError("bad chunk")
+
+    with pytest.raises(ValueError, match="bad chunk"):
+        run_pipeline(produce(), lambda item: None)
+
+
+def test_pipeline_stops_producer_when_consumer_fails():
+    def consume(item):
+        raise RuntimeError("profile failed")
+
+    with pytest.raises(RuntimeError):
+        run_pipeline(iter(range(1000)), consume, depth=1)
+
+
+def test_serial_mode_runs_inline():
+    consumed = []
+
+    stats = run_pipeline(iter(range(3)), consumed.append, depth=0)
+
+    assert consumed == [0, 1, 2]
+    assert stats.chunks == 3
@@ -0,0 +1,53 @@
+import json
+
+import pandas as pd
+import pytest
+
+from bad_rows import RejectSummary
+from column_stats import ColumnProfiler
+from profile_artifact import PROFILE_FORMAT_VERSION, TableProfile, load_profile, save_profile
+from type_inference import TypeInferrer
+
+
+def test_profile_round_trip_preserves_types_and_stats(tmp_path):
+    df = pd.DataFrame({
+        "id": range(200),
+        "status": ["open", "closed"] * 100,
+        "amount": [i * 1.5 for i in range(200)],
+    })
+    type_info = TypeInferrer().infer_types(df)
+    profiler = ColumnProfiler()
+    profiler.update(df, type_info)
+    profile = TableProfile("data.csv", "data", len(df), type_info, profiler.stats,
+                           rejects=RejectSummary(3, 203, "rejects.csv"))
+    path = tmp_path / "data.profile.json"
+
+    save_profile(profile, str(path))
+    loaded = load_profile(str(path))
+
+    assert list(loaded.type_info) == ["id", "status", "amount"]
+    assert loaded.type_info["amount"]["snowflake_type"] == type_info["amount"]["snowflake_type"]
+    assert loaded.stats["id"].is_key_candidate
+    assert loaded.stats["id"].is_monotonic
+    assert loaded.stats["status"].distinct_estimate == 2
+    assert (loaded.stats["id"].sketch.registers == profiler.stats["id"].sketch.registers).all()
+    assert loaded.rejects == RejectSummary(3, 203, "rejects.csv")
+    # Exact counts are saved without the hashes behind them
+    sketch = json.loads(path.read_text())["columns"][0]["stats"]["sketch"]
+    assert sketch["exact_count"] == 200 and "exact_hashes" not in sketch
+    assert loaded.stats["id"].is_exact
+
+
+def test_profile_without_stats_and_unknown_version(tmp_path):
+    profile = TableProfile("-", None, 1, {"a": {"inferred_type": "string"}})
+    path = tmp_path / "p.json"
+    save_profile(profile, str(path))
+
+    assert load_profile(str(path)).stats is None
+    assert load_profile(str(path)).rejects is None
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data["version"] = PROFILE_FORMAT_VERSION + 1
+    path.write_text(json.dumps(data), encoding="utf-8")
+    with pytest.raises(ValueError, match="Unsupported profile version"):
+        load_profile(str(path))
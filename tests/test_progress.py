@@ -0,0 +1,36 @@
+import io
+import json
+
+from file_reader import FileReader
+from progress import NULL_PROGRESS, ProgressReporter, track_bytes
+
+
+def test_json_progress_reports_bytes_rows_and_eta(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("id,name\n" + "".join(f"{i},n{i}\n" for i in range(1000)), encoding="utf-8")
+    stream = io.StringIO()
+    progress = ProgressReporter("json", stream=stream)
+
+    progress.start("scan", total_bytes=csv_path.stat().st_size)
+    for chunk in FileReader.iter_chunks(str(csv_path), chunk_rows=300, progress=progress):
+        progress.advance(rows=len(chunk))
+    progress.finish()
+
+    events = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [e["event"] for e in (events[0], events[-1])] == ["stage_start", "stage_end"]
+    assert events[-1]["bytes"] == csv_path.stat().st_size
+    assert events[-1]["rows"] == 1000
+    assert events[-1]["percent"] == 100.0
+    assert events[-1]["eta_seconds"] == 0.0
+
+
+def test_track_bytes_counts_reads_and_null_progress_is_inert():
+    progress = ProgressReporter("json", stream=io.StringIO())
+    progress.start("sample")
+
+    data = track_bytes(io.BytesIO(b"x" * 10000), progress).read()
+
+    assert len(data) == 10000
+    assert progress.snapshot()["bytes"] == 10000
+    assert not NULL_PROGRESS.enabled
+    NULL_PROGRESS.advance(nbytes=5, rows=1)
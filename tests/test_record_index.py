@@ -0,0 +1,64 @@
+import os
+
+import pytest
+
+from csv_sniffer import CsvDialect
+from file_reader import FileReader
+from record_index import RecordIndex, parse_row_range
+
+
+def _write(path, text):
+    path.write_bytes(text.encode("utf-8"))
+    return str(path)
+
+
+def test_index_is_quote_aware_and_skips_header(tmp_path):
+    path = _write(tmp_path / "q.csv", 'title\n\na,b\n1,"x\ny"\n2,"said ""hi\n"""\n3,z\n4,w')
+    index = RecordIndex.build(path, CsvDialect(skip_rows=1))
+
+    raw = open(path, "rb").read()
+    records = [raw[index.offsets[i]:index.offsets[i + 1]] for i in range(index.rows)]
+    assert records == [b'1,"x\ny"\n', b'2,"said ""hi\n"""\n', b"3,z\n", b"4,w"]
+
+    dialect = CsvDialect(skip_rows=1)
+    df = FileReader.read_file(path, dialect=dialect, selection=index.row_range(1, 3))
+    assert df["a"].tolist() == [2, 3]
+    assert df["b"].iloc[0] == 'said "hi\n"'
+
+
+def test_sidecar_is_reused_until_the_file_changes(tmp_path):
+    path = _write(tmp_path / "data.csv", "id\n" + "".join(f"{i}\n" for i in range(100)))
+    dialect = CsvDialect()
+
+    first = RecordIndex.open(path, dialect)
+    assert os.path.exists(RecordIndex.sidecar_path(path))
+    assert (RecordIndex.load(RecordIndex.sidecar_path(path)).offsets == first.offsets).all()
+    assert RecordIndex.open(path, dialect).matches(path, dialect)
+
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("100\n")
+    assert not first.matches(path, dialect)
+    assert RecordIndex.open(path, dialect).rows == 101
+
+
+def test_random_sample_and_splits_cover_rows_in_order(tmp_path):
+    path = _write(tmp_path / "data.csv", "id,v\n" + "".join(f"{i},{'x' * (i % 7)}\n" for i in range(1000)))
+    index = RecordIndex.build(path, CsvDialect())
+
+    sample = FileReader.read_file(path, dialect=CsvDialect(), selection=index.sample(50, 100, 600))
+    ids = sample["id"].tolist()
+    assert len(ids) == 50 and ids == sorted(ids) and len(set(ids)) == 50
+    assert 100 <= ids[0] and ids[-1] < 600
+
+    splits = index.split(4)
+    assert splits[0][0] == 0 and splits[-1][1] == 1000
+    assert all(end == next_start for (_, end), (next_start, _) in zip(splits, splits[1:]))
+
+
+def test_parse_row_range():
+    assert parse_row_range("10:20") == (10, 20)
+    assert parse_row_range("5:") == (5, None)
+    with pytest.raises(ValueError):
+        parse_row_range("20:10")
+    with pytest.raises(ValueError):
+        parse_row_range("12")
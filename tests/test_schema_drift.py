@@ -0,0 +1,106 @@
+import pandas as pd
+import pytest
+
+from csv2ddl import DRIFT_CHUNK_ROWS, build_parser, check_drift
+from schema_drift import DriftReport, SchemaBaseline, compare_type, parse_ddl_columns, parse_sql_type
+
+
+def test_parse_ddl_columns_ignores_constraints_and_table_options():
+    columns = parse_ddl_columns(
+        "CREATE TABLE IF NOT EXISTS t (\n"
+        "    id NUMBER(3, 0) PRIMARY KEY,\n"
+        "    name VARCHAR(10) NOT NULL,\n"
+        "    amount NUMBER(6, 2)\n"
+        ")\nCLUSTER BY (id);"
+    )
+
+    assert list(columns) == ["id", "name", "amount"]
+    assert columns["amount"]["parameters"] == {"precision": 6, "scale": 2}
+    assert columns["name"]["inferred_type"] == "string"
+
+
+def test_compare_type_uses_widening_rules():
+    baseline = parse_sql_type("NUMBER(5, 0)")
+
+    assert compare_type(baseline, parse_sql_type("NUMBER(7, 0)")) == "widened"
+    assert compare_type(baseline, parse_sql_type("NUMBER(4, 2)")) == "widened"
+    assert compare_type(baseline, parse_sql_type("NUMBER(3, 0)")) == "narrowed"
+    assert compare_type(baseline, parse_sql_type("NUMBER(5, 0)")) is None
+    assert compare_type(parse_sql_type("TEXT", "postgres"), parse_sql_type("DATE")) == "narrowed"
+    assert compare_type(parse_sql_type("VARIANT"), parse_sql_type("VARCHAR(40)")) == "widened"
+    assert compare_type(parse_sql_type("JSONB", "postgres"), {"inferred_type": "json"}) is None
+    with pytest.raises(ValueError):
+        parse_sql_type("GEOGRAPHY")
+
+
+def test_baseline_reports_added_removed_and_widened_columns():
+    baseline = SchemaBaseline(
+        parse_ddl_columns("CREATE TABLE t (id INTEGER, status VARCHAR(11), ts DATE)", "postgres"),
+        "postgres"
+    )
+    report = DriftReport()
+
+    baseline.compare_columns(["id", "status", "extra"], report)
+    baseline.compare_types({
+        "id": {"inferred_type": "integer", "parameters": {"precision": 6, "scale": 0}},
+        "status": {"inferred_type": "string", "parameters": {"max_length": 40}},
+    }, report)
+
+    assert report.added == ["extra"]
+    assert report.removed == ["ts"]
+    # precision 6 still renders as INTEGER on Postgres
+    assert list(report.widened) == ["status"]
+    assert report.narrowed == {}
+    assert report.breaking
+
+
+def test_oracle_baseline_compares_byte_lengths():
+    baseline = parse_ddl_columns("CREATE TABLE t (city VARCHAR2(12))", "oracle")["city"]
+
+    assert baseline["parameters"] == {"max_length": 12, "max_bytes": 12}
+    multibyte = {"inferred_type": "string", "parameters": {"max_length": 10, "max_bytes": 16}}
+    assert compare_type(baseline, multibyte) == "widened"
+    # A DDL baseline without byte lengths only compares characters
+    postgres = parse_sql_type("VARCHAR(12)", "postgres")
+    assert compare_type(postgres, multibyte) == "narrowed"
+
+
+def test_padded_inferred_types_that_still_fit_do_not_widen():
+    baseline = parse_sql_type("VARCHAR(14)")
+    padded = {"inferred_type": "string", "parameters": {"max_length": 16},
+              "observed": {"max_length": 14}}
+    amount = {"inferred_type": "float", "parameters": {"precision": 8, "scale": 3},
+              "observed": {"precision": 6, "scale": 2}}
+
+    assert compare_type(baseline, padded) is None
+    assert compare_type(parse_sql_type("NUMBER(6, 2)"), amount) is None
+    assert compare_type(parse_sql_type("NUMBER(5, 2)"), amount) == "widened"
+    assert compare_type(parse_sql_type("VARCHAR(13)"), padded) == "widened"
+
+
+
+def test_check_drift_reports_early_stop_only_with_rows_left(tmp_path):
+    ddl_path = tmp_path / "events.sql"
+    ddl_path.write_text("CREATE TABLE events (id INTEGER, code VARCHAR(5))")
+
+    def drift(long_code_row, *options):
+        csv_path = tmp_path / "events.csv"
+        codes = ["A"] * 20_000
+        codes[long_code_row] = "TOO-LONG-FOR-IT"
+        pd.DataFrame({"id": range(20_000), "code": codes}).to_csv(csv_path, index=False)
+        args = build_parser().parse_args(
+            ["--baseline", str(ddl_path), "--dialect", "postgres", "--full-scan", *options, str(csv_path)]
+        )
+        return check_drift(args)
+
+    # Widened in the last chunk, or in a chunk holding the whole file: nothing was left unread
+    last = drift(19_999)
+    assert list(last.widened) == ["code"]
+    assert last.rows_checked == 20_000
+    assert not last.stopped_early
+    assert not drift(0, "--chunk-rows", "50000").stopped_early
+
+    # Widened in the first small drift chunk, with rows still unread
+    early = drift(0)
+    assert early.stopped_early
+    assert early.rows_checked == DRIFT_CHUNK_ROWS
@@ -0,0 +1,52 @@
+import pandas as pd
+import pytest
+
+from column_stats import ColumnProfiler
+from profile_artifact import TableProfile
+from schema_union import format_partial_columns, union_profiles
+from type_inference import TypeInferrer
+
+
+def _profile(source, df):
+    type_info = TypeInferrer().infer_types(df)
+    profiler = ColumnProfiler()
+    profiler.update(df, type_info)
+    return TableProfile(source, None, len(df), type_info, profiler.stats)
+
+
+def test_union_aligns_by_sanitized_name_and_widens_types():
+    first = _profile("day1.csv", pd.DataFrame({"Order ID": [1, 2], "status": ["open", "closed"]}))
+    second = _profile("day2.csv", pd.DataFrame({
+        "order_id": [3, 40000],
+        "status": ["pending_review", "open"],
+        "coupon": ["X1", None],
+    }))
+
+    union = union_profiles([first, second], "orders")
+
+    assert list(union.type_info) == ["Order ID", "status", "coupon"]
+    assert union.type_info["Order ID"]["parameters"]["precision"] == 5
+    assert union.type_info["status"]["parameters"]["max_length"] >= len("pending_review")
+    assert union.type_info["coupon"]["missing_from"] == ["day1.csv"]
+    assert "missing_from" not in union.type_info["status"]
+    assert union.row_count == 4
+    assert union.table_name == "orders"
+
+
+def test_union_counts_missing_rows_as_nulls():
+    first = _profile("a.csv", pd.DataFrame({"id": [1, 2, 3]}))
+    second = _profile("b.csv", pd.DataFrame({"id": [4, 5], "note": ["x", "y"]}))
+
+    union = union_profiles([first, second])
+
+    assert union.stats["id"].row_count == 5
+    assert union.stats["id"].distinct_estimate == 5
+    assert union.stats["id"].is_monotonic
+    assert union.stats["note"].row_count == 5
+    assert union.stats["note"].null_count == 3
+    assert "note: missing from 1 files (e.g. a.csv)" in format_partial_columns(union.type_info)
+
+
+def test_union_requires_profiles():
+    with pytest.raises(ValueError):
+        union_profiles([])
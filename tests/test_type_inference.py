@@ -1,6 +1,9 @@
+import datetime
+
 import pandas as pd
 
-from type_inference import TypeInferrer
+from dialect_mapper import DialectMapper
+from type_inference import EXACT_LENGTH_MIN_ROWS, UNBOUNDED_TEXT_LENGTH, TypeInferrer
 
 
 def test_infer_integer_column():
@@ -28,3 +31,190 @@ def test_infer_date_column():
 
     assert result["created"]["inferred_type"] == "date"
     assert result["created"]["snowflake_type"] == "DATE"
+
+
+def test_parallel_inference_matches_serial_order():
+    df = pd.DataFrame({
+        "id": [1, 2, 3, 4],
+        "price": [1.5, 2.25, 3.0, 4.75],
+        "created": ["2024-01-01", "2024-02-01", "2024-03-01", "2024-04-01"],
+        "notes": ["a", "bb", "ccc", None],
+        "flag": ["yes", "no", "yes", "no"],
+    })
+
+    serial = TypeInferrer().infer_types(df)
+    with TypeInferrer(workers=3) as inferrer:
+        threaded = inferrer.infer_types(df)
+    with TypeInferrer(workers=2, backend="process") as inferrer:
+        processes = inferrer.infer_types(df)
+        pool = inferrer._executor
+        # Later chunks reuse the pool started for the first
+        assert inferrer.infer_types(df.iloc[2:]) == TypeInferrer().infer_types(df.iloc[2:])
+        assert inferrer._executor is pool
+    assert inferrer._executor is None
+
+    assert list(threaded) == list(df.columns)
+    assert threaded == serial
+    assert processes == serial
+
+
+def test_merge_types_widens_across_chunks():
+    inferrer = TypeInferrer()
+    first = inferrer.infer_types(pd.DataFrame({
+        "qty": [1, 2], "price": [1.5, 2.5], "code": [10, 20], "empty": [None, None]
+    }))
+    second = inferrer.infer_types(pd.DataFrame({
+        "qty": [100, 2000], "price": [12.125, 3.0], "code": ["A-100", "B"], "empty": [7, 8]
+    }))
+
+    merged = TypeInferrer.merge_types(first, second)
+
+    assert merged["qty"]["snowflake_type"] == "NUMBER(4, 0)"
+    assert merged["price"]["inferred_type"] == "float"
+    assert merged["price"]["parameters"]["scale"] == second["price"]["parameters"]["scale"]
+    assert merged["code"]["inferred_type"] == "string"
+    assert merged["code"]["parameters"]["max_length"] >= len("A-100")
+    assert merged["empty"] == second["empty"]
+
+
+def test_borderline_evidence_marks_column_ambiguous():
+    df = pd.DataFrame({
+        "borderline": [str(i) for i in range(85)] + [f"x{i}" for i in range(15)],
+        "clear": [str(i) for i in range(100)],
+    })
+
+    result = TypeInferrer().infer_types(df)
+
+    assert result["borderline"]["inferred_type"] == "integer"
+    assert result["borderline"]["evidence"]["numeric"] == 0.85
+    assert TypeInferrer.is_ambiguous(result["borderline"])
+    assert not TypeInferrer.is_ambiguous(result["clear"])
+
+
+def test_fallback_type_for_excluded_columns():
+    info = TypeInferrer.fallback_type("string")
+
+    assert info["excluded"]
+    assert info["snowflake_type"] == "VARCHAR(16777216)"
+    for dialect, sql_type in [("postgres", "TEXT"), ("mysql", "TEXT"), ("oracle", "CLOB"),
+                              ("sqlserver", "NVARCHAR(MAX)"), ("databricks", "STRING")]:
+        assert DialectMapper(dialect).map_column_types({"notes": info}) == {"notes": sql_type}
+
+
+def test_categorical_columns_infer_like_plain_text():
+    df = pd.DataFrame({
+        "flag": ["Yes", "no", "yes", "N"] * 5,
+        "status": ["open", "closed", "pending_review", "open"] * 5,
+        "code": ["1", "2", "3", "n/a"] * 5,
+    })
+    compact = df.astype("category")
+    compact["status"] = compact["status"].cat.add_categories(["a much longer unused category"])
+
+    assert TypeInferrer().infer_types(compact) == TypeInferrer().infer_types(df)
+
+
+def test_json_column_detected_from_bounded_sample(monkeypatch):
+    monkeypatch.setattr("type_inference.JSON_MAX_PARSE_BYTES", 64)
+    payloads = ['{"id": %d, "tags": ["a"]}' % i for i in range(300)]
+    df = pd.DataFrame({
+        "payload": payloads + [' [1, 2]', '{"big": "' + "x" * 100 + '"}', None],
+        "notes": ["{draft} reviewed", "[x] done", "plain"] * 101,
+    })
+
+    result = TypeInferrer().infer_types(df)
+
+    assert result["payload"]["inferred_type"] == "json"
+    assert result["payload"]["snowflake_type"] == "VARIANT"
+    assert result["payload"]["evidence"]["json"] == 1.0
+    assert result["notes"]["inferred_type"] == "string"
+    merged = TypeInferrer.merge_column_types(result["payload"], result["notes"])
+    assert merged["inferred_type"] == "string"
+    assert merged["parameters"]["max_length"] == UNBOUNDED_TEXT_LENGTH
+
+
+def test_long_values_are_not_parsed_as_dates():
+    df = pd.DataFrame({"created": ["2024-01-01"] * 5 + ["2024-01-01" + " " * 100] * 5})
+
+    assert TypeInferrer().infer_types(df)["created"]["evidence"]["date"] == 0.5
+    assert TypeInferrer(max_parse_length=200).infer_types(df)["created"]["inferred_type"] == "date"
+
+
+def test_column_over_time_budget_falls_back_to_string():
+    df = pd.DataFrame({
+        "created": ["2024-01-01", "2024-02-01", "2024-03-01"],
+        "amount": [1, 2, 3],
+    })
+
+    result = TypeInferrer(column_time_budget=1e-9).infer_types(df)
+
+    assert result["created"]["inferred_type"] == "string"
+    assert result["created"]["budget_exceeded"] is True
+    assert "budget_exceeded" not in result["amount"]
+    merged = TypeInferrer.merge_column_types(result["created"], {
+        "inferred_type": "string", "parameters": {"max_length": 40}, "confidence": 0.9
+    })
+    assert merged["budget_exceeded"] is True
+    assert merged["parameters"]["max_length"] == 40
+
+
+def test_string_columns_record_character_and_byte_lengths():
+    cities = ["Zürich", "東京", "Lyon", "São Paulo"] * 3
+    df = pd.DataFrame({
+        "city": cities,
+        "city_category": pd.Series(cities, dtype="category"),
+        "code": ["AB", "CD", "EF"] * 4,
+    })
+
+    result = TypeInferrer().infer_types(df)
+
+    params = result["city"]["parameters"]
+    # 9 characters / 10 bytes ("São Paulo") plus 10% headroom
+    assert params == {"max_length": 10, "max_bytes": 11}
+    # 4-7 bytes: Zürich, 東京, Lyon; 8-15 bytes: São Paulo
+    assert result["city"]["length_histogram"] == [0, 0, 0, 9, 3]
+    assert result["city_category"]["parameters"] == params
+    assert result["city_category"]["length_histogram"] == result["city"]["length_histogram"]
+    # A small sample keeps the headroom even when every value has one length
+    assert result["code"]["parameters"] == {"max_length": 3, "max_bytes": 3}
+
+    exact = TypeInferrer(full_scan=True).infer_types(df[["code"]])
+    assert exact["code"]["parameters"] == {"max_length": 2, "max_bytes": 2}
+    large = TypeInferrer().infer_types(pd.DataFrame({"code": ["AB"] * EXACT_LENGTH_MIN_ROWS}))
+    assert large["code"]["parameters"] == {"max_length": 2, "max_bytes": 2}
+
+
+def test_object_column_without_text_is_typed():
+    # openpyxl returns Excel time-of-day cells as datetime.time objects
+    df = pd.DataFrame({"start": [datetime.time(9, 30), datetime.time(17, 0), None]})
+
+    result = TypeInferrer().infer_types(df)
+
+    assert result["start"]["inferred_type"] == "date"
+
+
+def test_date_screen_skips_values_dateutil_cannot_read():
+    df = pd.DataFrame({
+        "month": ["March", "April", "May", "June"] * 5,
+        "ticket": [f"user-{i:06d}-3" for i in range(20)],
+        "when": ["5th of May 2024", "2024-01-01T10:00Z", "Sep 5 2024", "2024-03-01 10:00 GMT"] * 5,
+    })
+
+    result = TypeInferrer().infer_types(df)
+
+    # Month names alone hold no calendar date
+    assert result["month"]["inferred_type"] == "string"
+    assert result["ticket"]["evidence"]["date"] == 0.0
+    assert result["when"]["inferred_type"] == "date"
+
+
+def test_wide_frames_default_to_a_process_pool(monkeypatch):
+    monkeypatch.setattr("type_inference.WIDE_TABLE_COLUMNS", 3)
+    monkeypatch.setattr("type_inference.os.cpu_count", lambda: 2)
+    df = pd.DataFrame({"id": [1, 2], "name": ["a", "b"], "day": ["2024-01-01", "2024-01-02"]})
+
+    with TypeInferrer() as inferrer:
+        result = inferrer.infer_types(df)
+        assert (inferrer.workers, inferrer.backend) == (2, "process")
+    with TypeInferrer(workers=1) as explicit:
+        assert explicit.infer_types(df) == result
+        assert explicit._executor is None
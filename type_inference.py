@@ -1,41 +1,339 @@
+import functools
+import json
 import logging
+import math
+import os
+import re
+import time
+import numpy as np
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 import pandas as pd
-from dateutil.parser import parse as date_parse
-from typing import Dict, Any
-
+from dateutil.parser import parse as date_parse, parserinfo
+from typing import Dict, Any, List, Optional, Tuple
+
+from file_reader import WIDE_TABLE_COLUMNS
+
+
+PARALLEL_BACKENDS = ('thread', 'process')
+# Width assumed for date values when a date column has to widen to string
+DATE_TEXT_LENGTH = 26
+MAX_NUMERIC_PRECISION = 38
+BOOLEAN_TOKENS = {'true', 'false', '1', '0', 'yes', 'no', 'y', 'n'}
+BATCHES_PER_WORKER = 4
+DATE_SAMPLE_SEED = 0
+NUMERIC_THRESHOLD = 0.8
+DATE_THRESHOLD = 0.8
+# dateutil results are remembered for this many distinct values, so values
+# repeated within and across the columns of a wide file are parsed once
+DATE_PARSE_CACHE_SIZE = 65536
+# Evidence within this distance of a threshold makes a column ambiguous
+AMBIGUITY_MARGIN = 0.1
+# JSON columns: values that open like an object or array are pre-filtered
+# cheaply; at most JSON_SAMPLE_SIZE of them, each at most JSON_MAX_PARSE_BYTES,
+# are actually parsed.
+JSON_THRESHOLD = 0.8
+JSON_SAMPLE_SIZE = 100
+JSON_MAX_PARSE_BYTES = 64 * 1024
+JSON_OPENING = r'\s*[\[{]'
+# Values longer than this are never parsed as numbers or dates; they count
+# as failing those tests. 38 digits plus sign, point, and exponent fit.
+MAX_PARSE_LENGTH = 64
+# CPU seconds one column may spend in its numeric, JSON, and date tests
+# before it is typed as string and flagged with ``budget_exceeded``.
+COLUMN_TIME_BUDGET = 2.0
+# String columns: headroom added to the longest sampled value (in characters
+# and in UTF-8 bytes) for longer unseen values. Columns whose values all have
+# the same length, such as codes and hashes, get none once at least
+# EXACT_LENGTH_MIN_ROWS values were seen or every row was scanned.
+STRING_LENGTH_HEADROOM = 0.1
+EXACT_LENGTH_MIN_ROWS = 10000
+# Characters encoded per step when measuring UTF-8 byte lengths
+BYTE_LENGTH_BLOCK_CHARS = 4 * 1024 * 1024
+# Longest string any dialect declares: Snowflake's VARCHAR maximum (16 MiB),
+# past the 10 MiB at which Postgres switches to TEXT.
+UNBOUNDED_TEXT_LENGTH = 16 * 1024 * 1024
+# Parameters for columns emitted without inference. Unknown text maps to each
+# dialect's unbounded text type: VARCHAR(16777216) on Snowflake (what a plain
+# VARCHAR means there), TEXT, CLOB, NVARCHAR(MAX), or STRING elsewhere.
+FALLBACK_PARAMETERS = {
+    'string': {'max_length': UNBOUNDED_TEXT_LENGTH},
+    'integer': {'precision': 18, 'scale': 0},
+    'float': {'precision': MAX_NUMERIC_PRECISION, 'scale': 10},
+    'date': {},
+}
 
 logger = logging.getLogger(__name__)
 
 
+class _BudgetExceeded(Exception):
+    """A column used up its inference time budget."""
+
+
+def _infer_column_batch(inferrer: 'TypeInferrer', frame: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Worker entry point: infer every column of a column-partitioned frame."""
+    return [inferrer._infer_named_column(col, frame[col]) for col in frame.columns]
+
+
 class TypeInferrer:
-    """Engine for inferring data types from DataFrame columns."""
+    """
+    Engine for inferring data types from DataFrame columns.
+
+    With ``workers > 1`` one pool is started on first use and reused for
+    every chunk; ``close()`` (or leaving a ``with`` block) shuts it down.
+    Inference is mostly pure Python, so ``thread`` workers contend for the
+    GIL and only help when sources are I/O-bound; use ``process`` for
+    CPU-bound inference. When ``workers`` is not given, frames of
+    ``WIDE_TABLE_COLUMNS`` or more columns are inferred on a process pool
+    with one worker per CPU.
+    """
 
     DATE_FORMATS = [
         '%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%Y/%m/%d',
         '%d-%m-%Y', '%m-%d-%Y', '%Y%m%d', '%d/%m/%y'
     ]
 
-    def __init__(self, date_formats: list = None):
+    def __init__(self,
+                 date_formats: list = None,
+                 workers: Optional[int] = None,
+                 backend: str = 'thread',
+                 max_parse_length: int = MAX_PARSE_LENGTH,
+                 column_time_budget: Optional[float] = COLUMN_TIME_BUDGET,
+                 full_scan: bool = False):
+        if backend not in PARALLEL_BACKENDS:
+            raise ValueError(f"Unsupported parallel backend: {backend}. Supported: {list(PARALLEL_BACKENDS)}")
+        if workers is not None and workers <= 0:
+            raise ValueError("workers must be positive when provided")
+        if max_parse_length <= 0:
+            raise ValueError("max_parse_length must be positive")
+        if column_time_budget is not None and column_time_budget <= 0:
+            raise ValueError("column_time_budget must be positive when provided")
+
         self.date_formats = date_formats or self.DATE_FORMATS
+        self.workers = workers or 1
+        self.backend = backend
+        self._auto_workers = workers is None
+        self.max_parse_length = max_parse_length
+        self.column_time_budget = column_time_budget
+        self.full_scan = full_scan
+        self._executor: Optional[Executor] = None
+
+    def __enter__(self) -> 'TypeInferrer':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Process workers receive the inferrer without its pool
+        return {**self.__dict__, '_executor': None}
+
+    def close(self) -> None:
+        """Shut down the worker pool, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
 
     def infer_types(self, df: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
         """
         Infer types for all columns in DataFrame.
 
+        Columns are independent, so with ``workers > 1`` they are partitioned
+        into contiguous batches and inferred concurrently. Results are always
+        returned in the input column order.
+
         Returns:
             Dict with column names as keys and type info as values
         """
-        results = {}
-        logger.debug("Inferring types for %s columns", len(df.columns))
-        for col in df.columns:
-            logger.debug("Analyzing column '%s'", col)
-            inferred = self._infer_column_type(df[col])
-            logger.debug("Column '%s' inferred as %s", col, inferred['snowflake_type'])
-            results[col] = inferred
+        columns = list(df.columns)
+        logger.debug("Inferring types for %s columns", len(columns))
+        cpus = os.cpu_count() or 1
+        if self._auto_workers and len(columns) >= WIDE_TABLE_COLUMNS and cpus > 1:
+            logger.info("Inferring %s columns on %s worker processes", len(columns), cpus)
+            self.workers, self.backend = cpus, 'process'
+            self._auto_workers = False
+
+        if self.workers > 1 and len(columns) > 1:
+            inferred = self._infer_parallel(df, columns)
+        else:
+            inferred = [self._infer_named_column(col, df[col]) for col in columns]
+
+        return dict(zip(columns, inferred))
+
+    def _infer_parallel(self, df: pd.DataFrame, columns: list) -> List[Dict[str, Any]]:
+        """Infer column batches on a worker pool, preserving column order."""
+        batches = self._partition_columns(columns, self.workers * BATCHES_PER_WORKER)
+        logger.debug(
+            "Inferring %s columns in %s batches on %s %s workers",
+            len(columns),
+            len(batches),
+            self.workers,
+            self.backend
+        )
+
+        executor = self._get_executor()
+        if self.backend == 'thread':
+            # Threads share the parent's DataFrame; each task only holds
+            # references to its own columns.
+            futures = [
+                executor.submit(self._infer_batch, [(col, df[col]) for col in batch])
+                for batch in batches
+            ]
+        else:
+            # Each process receives only its own column partition, so the
+            # frame is transferred once in total rather than once per worker.
+            futures = [
+                executor.submit(_infer_column_batch, self, df[batch])
+                for batch in batches
+            ]
+
+        results = []
+        for future in futures:
+            results.extend(future.result())
         return results
 
+    def _get_executor(self) -> Executor:
+        """The worker pool, started on first use and reused for every later chunk."""
+        if self._executor is None:
+            if self.backend == 'process':
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def _infer_batch(self, named_columns: list) -> List[Dict[str, Any]]:
+        return [self._infer_named_column(col, series) for col, series in named_columns]
+
+    def _infer_named_column(self, col: str, series: pd.Series) -> Dict[str, Any]:
+        logger.debug("Analyzing column '%s'", col)
+        inferred = self._infer_column_type(series)
+        logger.debug("Column '%s' inferred as %s", col, inferred['snowflake_type'])
+        return inferred
+
+    @staticmethod
+    def _partition_columns(columns: list, max_batches: int) -> List[list]:
+        """Split columns into at most ``max_batches`` contiguous, ordered batches."""
+        batch_size = max(1, math.ceil(len(columns) / max_batches))
+        return [columns[i:i + batch_size] for i in range(0, len(columns), batch_size)]
+
+    @classmethod
+    def merge_types(cls,
+                    left: Dict[str, Dict[str, Any]],
+                    right: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Combine results inferred from two chunks of the same table.
+
+        Each column is widened just enough to hold both observations.
+        Columns seen in only one side are kept as-is, left columns first.
+        """
+        merged = dict(left)
+        for col, info in right.items():
+            merged[col] = cls.merge_column_types(merged[col], info) if col in merged else info
+        return merged
+
+    @staticmethod
+    def merge_column_types(left: Dict[str, Any], right: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the narrowest type that can hold values of both ``left`` and ``right``."""
+        if left.get('all_null'):
+            return right
+        if right.get('all_null'):
+            return left
+
+        left_type, right_type = left['inferred_type'], right['inferred_type']
+        left_params, right_params = left.get('parameters', {}), right.get('parameters', {})
+        confidence = min(left.get('confidence', 0.0), right.get('confidence', 0.0))
+
+        if left_type == right_type and left_type in ('date', 'json'):
+            return {**left, 'confidence': confidence}
+
+        numeric = ('integer', 'float')
+        if left_type in numeric and right_type in numeric:
+            scale = max(left_params.get('scale', 0), right_params.get('scale', 0))
+            whole_digits = max(
+                left_params.get('precision', 1) - left_params.get('scale', 0),
+                right_params.get('precision', 1) - right_params.get('scale', 0)
+            )
+            precision = min(whole_digits + scale, MAX_NUMERIC_PRECISION)
+            inferred_type = 'integer' if left_type == right_type == 'integer' else 'float'
+            params = {'precision': precision, 'scale': scale}
+        else:
+            inferred_type = 'string'
+            max_length = max(_text_length(left_type, left_params), _text_length(right_type, right_params))
+            params = {'max_length': max_length}
+            byte_lengths = (_text_bytes(left_type, left_params), _text_bytes(right_type, right_params))
+            if None not in byte_lengths:
+                params['max_bytes'] = max(byte_lengths)
+
+        merged = {
+            'inferred_type': inferred_type,
+            'snowflake_type': _snowflake_type(inferred_type, params),
+            'parameters': params,
+            'confidence': confidence
+        }
+        histograms = (left.get('length_histogram'), right.get('length_histogram'))
+        if inferred_type == 'string' and None not in histograms:
+            merged['length_histogram'] = _add_histograms(*histograms)
+        if left.get('budget_exceeded') or right.get('budget_exceeded'):
+            merged['budget_exceeded'] = True
+        if 'observed' in left or 'observed' in right:
+            merged['observed'] = TypeInferrer.merge_column_types(
+                TypeInferrer.observed_type(left), TypeInferrer.observed_type(right)
+            )['parameters']
+        return merged
+
+    @staticmethod
+    def observed_type(info: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        ``info`` with the parameters actually seen in the data, before padding.
+
+        Float and string results keep these in ``observed``; other types
+        are not padded, so their parameters are returned as they are.
+        """
+        observed = {key: value for key, value in info.items() if key != 'observed'}
+        if 'observed' in info:
+            observed['parameters'] = info['observed']
+        return observed
+
+    @staticmethod
+    def fallback_type(inferred_type: str) -> Dict[str, Any]:
+        """Type info for a column that was not read, e.g. one excluded from parsing."""
+        if inferred_type not in FALLBACK_PARAMETERS:
+            raise ValueError(
+                f"Unsupported fallback type: {inferred_type}. Supported: {list(FALLBACK_PARAMETERS)}"
+            )
+        params = dict(FALLBACK_PARAMETERS[inferred_type])
+        return {
+            'inferred_type': inferred_type,
+            'snowflake_type': _snowflake_type(inferred_type, params),
+            'parameters': params,
+            'confidence': 0.0,
+            'excluded': True
+        }
+
+    @staticmethod
+    def is_ambiguous(info: Dict[str, Any], margin: float = AMBIGUITY_MARGIN) -> bool:
+        """
+        True when a numeric or date test was decided within ``margin`` of its threshold.
+
+        Such decisions can flip on a different sample, so these columns are
+        worth re-reading in full.
+        """
+        evidence = info.get('evidence', {})
+        thresholds = {'numeric': NUMERIC_THRESHOLD, 'date': DATE_THRESHOLD}
+        return any(
+            abs(ratio - thresholds[test]) < margin
+            for test, ratio in evidence.items()
+            if test in thresholds
+        )
+
     def _infer_column_type(self, series: pd.Series) -> Dict[str, Any]:
-        """Infer type for a single column."""
+        """
+        Infer type for a single column.
+
+        Numeric and date results, and strings that failed those tests, carry
+        an ``evidence`` dict with the share of values that passed each test.
+        A column whose tests run past ``column_time_budget`` CPU seconds is
+        sized as a string and marked ``budget_exceeded``.
+        """
         # Remove nulls for analysis
         non_null = series.dropna()
 
@@ -46,7 +344,8 @@ class TypeInferrer:
                 'inferred_type': 'string',
                 'snowflake_type': 'VARCHAR(1)',
                 'parameters': {'max_length': 1},
-                'confidence': 0.5
+                'confidence': 0.5,
+                'all_null': True
             }
 
         # Check for boolean-like values
@@ -59,80 +358,183 @@ class TypeInferrer:
                 'confidence': 0.9
             }
 
-        # First, try numeric detection (most restrictive)
-        numeric_info = self._analyze_numeric(non_null)
-        if numeric_info:
-            return numeric_info
+        evidence: Dict[str, float] = {}
+        deadline = (
+            time.thread_time() + self.column_time_budget
+            if self.column_time_budget is not None else None
+        )
+        try:
+            # First, try numeric detection (most restrictive)
+            numeric_info = self._analyze_numeric(non_null, evidence)
+            if numeric_info:
+                return {**numeric_info, 'evidence': evidence}
+            _check_budget(deadline)
+
+            # Semi-structured values are recognised before the slower date test
+            if self._is_json_column(non_null, evidence, deadline):
+                logger.debug("Column detected as JSON")
+                return {
+                    'inferred_type': 'json',
+                    'snowflake_type': 'VARIANT',
+                    'parameters': {},
+                    'confidence': 0.9,
+                    'evidence': evidence
+                }
 
-        # Then try date detection
-        if self._is_date_column(non_null):
-            logger.debug("Column detected as date")
-            return {
-                'inferred_type': 'date',
-                'snowflake_type': 'DATE',
-                'parameters': {},
-                'confidence': 0.9
-            }
+            # Then try date detection
+            if self._is_date_column(non_null, evidence, deadline):
+                logger.debug("Column detected as date")
+                return {
+                    'inferred_type': 'date',
+                    'snowflake_type': 'DATE',
+                    'parameters': {},
+                    'confidence': 0.9,
+                    'evidence': evidence
+                }
+        except _BudgetExceeded:
+            logger.warning(
+                "Column '%s' exceeded its %ss inference budget; sizing it as a string",
+                series.name,
+                self.column_time_budget
+            )
+            string_info = self._analyze_string(non_null)
+            return {**string_info, 'evidence': evidence, 'budget_exceeded': True}
 
         # Default to string
         string_info = self._analyze_string(non_null)
-        return string_info
+        return {**string_info, 'evidence': evidence}
 
-    def _is_date_column(self, series: pd.Series) -> bool:
-        """Check if column contains dates."""
+    def _is_date_column(self,
+                        series: pd.Series,
+                        evidence: Optional[Dict[str, float]] = None,
+                        deadline: Optional[float] = None) -> bool:
+        """
+        Check if column contains dates, recording the sampled date share in ``evidence``.
+
+        Values over ``max_parse_length`` characters, values without a digit
+        (dateutil reads ``March`` or ``Monday`` as a date in the current month
+        or week, which no DATE column would load), and values with a word
+        dateutil does not know (``_may_be_date``) are not parsed and count as
+        non-dates. Each distinct sampled value is parsed once.
+        Raises ``_BudgetExceeded`` once ``deadline`` (a ``time.thread_time()``
+        value) has passed.
+        """
         sample_size = min(100, len(series))  # Sample up to 100 values
-        sample = series.sample(sample_size) if len(series) > sample_size else series
+        # Fixed seed keeps results reproducible across runs and worker layouts
+        sample = (
+            series.sample(sample_size, random_state=DATE_SAMPLE_SEED)
+            if len(series) > sample_size else series
+        )
 
         date_count = 0
-        for value in sample:
-            if self._is_date_value(str(value)):
-                date_count += 1
+        for value, count in sample.astype(str).value_counts(sort=False).items():
+            _check_budget(deadline)
+            if len(value) <= self.max_parse_length and _may_be_date(value) and self._is_date_value(value):
+                date_count += count
 
         # Consider it a date column if >80% of sampled values are dates
-        return date_count / len(sample) > 0.8
+        ratio = date_count / len(sample)
+        if evidence is not None:
+            evidence['date'] = round(ratio, 3)
+        return ratio > DATE_THRESHOLD
+
+    def _is_json_column(self,
+                        series: pd.Series,
+                        evidence: Optional[Dict[str, float]] = None,
+                        deadline: Optional[float] = None) -> bool:
+        """
+        Check if column holds JSON objects or arrays, recording the parsed share in ``evidence``.
+
+        Only text that opens with ``{`` or ``[`` is considered, and only a
+        bounded sample of it is parsed; values over ``JSON_MAX_PARSE_BYTES``
+        count as JSON when they also close with the matching bracket.
+        """
+        opens = _json_opening_mask(series)
+        if opens is None:
+            return False
+        opening_share = float(opens.mean())
+        if opening_share < JSON_THRESHOLD:
+            return False
+
+        candidates = series[opens]
+        sample = (
+            candidates.sample(JSON_SAMPLE_SIZE, random_state=DATE_SAMPLE_SEED)
+            if len(candidates) > JSON_SAMPLE_SIZE else candidates
+        )
+        json_count = 0
+        for value in sample:
+            _check_budget(deadline)
+            json_count += _is_json_value(value)
+
+        ratio = opening_share * json_count / len(sample)
+        if evidence is not None:
+            evidence['json'] = round(ratio, 3)
+        return ratio > JSON_THRESHOLD
 
     def _is_date_value(self, value: str) -> bool:
         """Check if a single value is a date."""
-        try:
-            # Try parsing with dateutil
-            date_parse(value, fuzzy=False)
-            return True
-        except (ValueError, TypeError):
-            return False
+        return _parses_as_date(value)
 
     def _is_boolean_column(self, series: pd.Series) -> bool:
         """Check if column contains boolean values."""
-        # Convert to string and check for boolean representations
-        str_series = series.astype(str).str.lower()
-        boolean_values = {'true', 'false', '1', '0', 'yes', 'no', 'y', 'n'}
+        # Numeric dtypes can be answered without a string copy: only the
+        # integers 0/1 stringify to boolean tokens ('1.0' never does).
+        if pd.api.types.is_bool_dtype(series):
+            return True
+        if pd.api.types.is_integer_dtype(series):
+            return bool(series.isin([0, 1]).mean() > 0.9)
+        if pd.api.types.is_float_dtype(series):
+            return False
 
-        # Check if all non-null values are boolean-like
-        non_null_str = str_series.dropna()
-        if len(non_null_str) == 0:
+        # Count each distinct value once instead of lower-casing a copy of
+        # every row; categoricals already hold their value counts.
+        counts = series.value_counts(sort=False)
+        total = int(counts.sum())
+        if total == 0:
             return False
 
-        boolean_count = 0
-        for value in non_null_str:
-            if value in boolean_values:
-                boolean_count += 1
+        tokens = counts.index.astype(str).str.lower()
+        boolean_count = int(counts.to_numpy()[tokens.isin(BOOLEAN_TOKENS)].sum())
 
         # Consider boolean if >90% are boolean-like
-        return boolean_count / len(non_null_str) > 0.9
+        return boolean_count / total > 0.9
 
-    def _analyze_numeric(self, series: pd.Series) -> Dict[str, Any]:
-        """Analyze if column is numeric and determine precision/scale."""
+    def _analyze_numeric(self,
+                         series: pd.Series,
+                         evidence: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        """
+        Analyze if column is numeric and determine precision/scale.
+
+        Text over ``max_parse_length`` characters is not converted and
+        counts as non-numeric.
+        """
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Reject repetitive text from its distinct values alone
+            ratio = _categorical_numeric_share(series, self.max_parse_length)
+            if ratio < NUMERIC_THRESHOLD:
+                if evidence is not None:
+                    evidence['numeric'] = round(ratio, 3)
+                return None
+        long_values = _long_value_mask(series, self.max_parse_length)
+        candidates = series[~long_values] if long_values is not None and long_values.any() else series
         # Try to convert to numeric
         try:
-            numeric_series = pd.to_numeric(series, errors='coerce')
+            numeric_series = pd.to_numeric(candidates, errors='coerce')
             numeric_series = numeric_series.dropna()
 
-            if len(numeric_series) / len(series) < 0.8:
+            ratio = len(numeric_series) / len(series)
+            if evidence is not None:
+                evidence['numeric'] = round(ratio, 3)
+            if ratio < NUMERIC_THRESHOLD:
                 # Less than 80% numeric - not a numeric column
                 logger.debug("Column rejected for numeric inference (<80%% numeric)")
                 return None
 
             # Check if integers or floats
-            is_integer = all(numeric_series == numeric_series.astype(int))
+            is_integer = (
+                pd.api.types.is_integer_dtype(numeric_series)
+                or bool((numeric_series == numeric_series.astype(int)).all())
+            )
 
             if is_integer:
                 # Integer column
@@ -173,6 +575,7 @@ class TypeInferrer:
 
                 precision = max_digits_before + max_digits_after
                 scale = max_digits_after
+                observed = {'precision': min(precision, MAX_NUMERIC_PRECISION), 'scale': min(scale, 37)}
 
                 # Add padding
                 precision = min(precision + 2, 38)  # Snowflake max precision
@@ -187,28 +590,241 @@ class TypeInferrer:
                     'inferred_type': 'float',
                     'snowflake_type': f'NUMBER({precision}, {scale})',
                     'parameters': {'precision': precision, 'scale': scale},
-                    'confidence': 0.95
+                    'confidence': 0.95,
+                    'observed': observed
                 }
 
         except (ValueError, TypeError):
             return None
 
     def _analyze_string(self, series: pd.Series) -> Dict[str, Any]:
-        """Analyze string column and determine max length."""
-        str_series = series.astype(str)
-        max_length = str_series.str.len().max()
+        """
+        Analyze string column and determine its character and UTF-8 byte lengths.
 
-        # Add padding for future growth (20% or at least 10 chars)
-        padded_length = int(max_length * 1.2) + 10
+        ``max_length`` counts characters and ``max_bytes`` UTF-8 bytes; each
+        dialect declares its columns in one of the two. ``length_histogram``
+        counts values per power-of-two byte length: entry ``k`` holds values
+        of ``2 ** (k - 1)`` to ``2 ** k - 1`` bytes, entry 0 empty ones.
+        """
+        chars, byte_lengths, counts = _text_lengths(series)
+        exact = self.full_scan or len(series) >= EXACT_LENGTH_MIN_ROWS
+        max_length = _with_headroom(chars, exact)
+        max_bytes = _with_headroom(byte_lengths, exact)
+        _, buckets = np.frexp(byte_lengths.astype(np.float64))
+        histogram = np.bincount(buckets, weights=counts).astype(np.int64).tolist()
         logger.debug(
-            "Detected string column with max length %s -> padded length %s",
+            "Detected string column with max length %s chars / %s bytes -> sized %s / %s",
+            int(chars.max()),
+            int(byte_lengths.max()),
             max_length,
-            padded_length
+            max_bytes
         )
 
         return {
             'inferred_type': 'string',
-            'snowflake_type': f'VARCHAR({padded_length})',
-            'parameters': {'max_length': padded_length},
-            'confidence': 0.9
+            'snowflake_type': f'VARCHAR({max_length})',
+            'parameters': {'max_length': max_length, 'max_bytes': max_bytes},
+            'confidence': 0.9,
+            'length_histogram': histogram,
+            'observed': {'max_length': int(chars.max()), 'max_bytes': int(byte_lengths.max())}
         }
+
+
+_DIGIT = re.compile(r'\d')
+_WORD = re.compile(r'[^\W\d_]+')
+# Words dateutil accepts with fuzzy=False; any other word makes it fail
+_DATE_WORDS = frozenset(
+    word.lower()
+    for group in (parserinfo.JUMP, parserinfo.WEEKDAYS, parserinfo.MONTHS, parserinfo.HMS,
+                  parserinfo.AMPM, parserinfo.UTCZONE, parserinfo.PERTAIN)
+    for entry in group
+    for word in ((entry,) if isinstance(entry, str) else entry)
+)
+
+
+def _may_be_date(value: str) -> bool:
+    """Cheap screen for ``_parses_as_date``: a digit, and only words dateutil knows."""
+    if not _DIGIT.search(value):
+        return False
+    return all(
+        word.lower() in _DATE_WORDS or (len(word) <= 5 and word.isascii() and word.isupper())
+        for word in _WORD.findall(value)
+    )
+
+
+@functools.lru_cache(maxsize=DATE_PARSE_CACHE_SIZE)
+def _parses_as_date(value: str) -> bool:
+    try:
+        date_parse(value, fuzzy=False)
+        return True
+    except (ValueError, TypeError, OverflowError):
+        return False
+
+
+def format_budget_exceeded(type_info: Dict[str, Dict[str, Any]]) -> str:
+    """Render the columns typed as string after running out of inference time as SQL comments."""
+    columns = [str(col) for col, info in type_info.items() if info.get('budget_exceeded')]
+    if not columns:
+        return ""
+    return ("-- Typed as string after exceeding the per-column inference time budget: "
+            + ", ".join(columns))
+
+
+def _json_opening_mask(series: pd.Series) -> Optional[np.ndarray]:
+    """Which values open like a JSON object or array; None for non-text columns."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        categories = series.cat.categories
+        if pd.api.types.infer_dtype(categories, skipna=True) != 'string':
+            return None
+        opens = np.asarray(categories.str.match(JSON_OPENING), dtype=bool)
+        return opens[series.cat.codes.to_numpy()]
+    if not (isinstance(series.dtype, pd.StringDtype) or pd.api.types.is_object_dtype(series.dtype)):
+        return None
+    try:
+        opens = series.str.match(JSON_OPENING)
+    except AttributeError:
+        return None  # object column without any text, e.g. Excel times
+    return opens.fillna(False).to_numpy(dtype=bool)
+
+
+def _long_value_mask(series: pd.Series, max_length: int) -> Optional[np.ndarray]:
+    """Which values are longer than ``max_length`` characters; None for non-text columns."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        categories = series.cat.categories
+        if pd.api.types.infer_dtype(categories, skipna=True) != 'string':
+            return None
+        long_values = np.asarray(categories.str.len() > max_length, dtype=bool)
+        return long_values[series.cat.codes.to_numpy()]
+    if not (isinstance(series.dtype, pd.StringDtype) or pd.api.types.is_object_dtype(series.dtype)):
+        return None
+    try:
+        lengths = series.str.len()
+    except AttributeError:
+        return None  # object column without any text
+    return (lengths > max_length).fillna(False).to_numpy(dtype=bool)
+
+
+def _categorical_numeric_share(series: pd.Series, max_length: int) -> float:
+    """Share of a categorical's values that convert to numbers, testing each category once."""
+    categories = series.cat.categories
+    numeric = pd.to_numeric(pd.Series(categories), errors='coerce').notna().to_numpy(copy=True)
+    if pd.api.types.infer_dtype(categories, skipna=True) == 'string':
+        numeric &= np.asarray(categories.str.len() <= max_length, dtype=bool)
+    counts = np.bincount(series.cat.codes.to_numpy(), minlength=len(categories))
+    return float(counts[numeric].sum()) / len(series)
+
+
+def _check_budget(deadline: Optional[float]) -> None:
+    if deadline is not None and time.thread_time() > deadline:
+        raise _BudgetExceeded()
+
+
+def _is_json_value(value: str) -> bool:
+    text = value.strip()
+    if len(text) > JSON_MAX_PARSE_BYTES or len(text.encode('utf-8')) > JSON_MAX_PARSE_BYTES:
+        # Too large to parse within budget: trust matching outer brackets
+        return (text[0], text[-1]) in (('{', '}'), ('[', ']'))
+    try:
+        return isinstance(json.loads(text), (dict, list))
+    except ValueError:
+        return False
+
+
+def _text_lengths(series: pd.Series) -> Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]:
+    """
+    Character and UTF-8 byte length of the values, and how often each occurs.
+
+    Categoricals are measured once per used category, weighted by their
+    counts; other columns once per row (counts None). Text columns are not
+    copied; other values are measured as ``str()``.
+    """
+    counts = None
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        counts = np.bincount(series.cat.codes.to_numpy(), minlength=len(series.cat.categories))
+        values = series.cat.categories[counts > 0].astype(str)
+        counts = counts[counts > 0]
+    elif isinstance(series.dtype, pd.StringDtype) or (
+        pd.api.types.is_object_dtype(series.dtype)
+        and pd.api.types.infer_dtype(series, skipna=True) == 'string'
+    ):
+        values = series
+    else:
+        values = series.astype(str)
+    chars = np.asarray(values.str.len(), dtype=np.int64)
+    return chars, _utf8_lengths(values.to_numpy(dtype=object), chars), counts
+
+
+def _utf8_lengths(values: np.ndarray, chars: np.ndarray) -> np.ndarray:
+    """
+    UTF-8 byte length of each string, with one join and encode per block of values.
+
+    ASCII blocks are their character lengths. Otherwise every byte that is
+    not a continuation byte (``10xxxxxx``) starts a character, so the byte
+    offset of each value's first character follows from the character
+    lengths alone, without encoding values one by one.
+    """
+    byte_lengths = chars.copy()
+    ends = np.cumsum(chars)
+    start = 0
+    while start < len(values):
+        base = int(ends[start - 1]) if start else 0
+        stop = max(int(np.searchsorted(ends, base + BYTE_LENGTH_BLOCK_CHARS, side='right')), start + 1)
+        text = ''.join(values[start:stop])
+        if not text.isascii():
+            encoded = np.frombuffer(text.encode('utf-8', 'surrogatepass'), dtype=np.uint8)
+            char_starts = np.append(np.flatnonzero((encoded & 0xC0) != 0x80), len(encoded))
+            bounds = np.concatenate(([0], ends[start:stop] - base))
+            byte_lengths[start:stop] = np.diff(char_starts[bounds])
+        start = stop
+    return byte_lengths
+
+
+def _with_headroom(lengths: np.ndarray, exact: bool = False) -> int:
+    """
+    Longest length plus ``STRING_LENGTH_HEADROOM``.
+
+    With ``exact`` (enough rows seen to trust it) a single shared length is
+    kept as is.
+    """
+    longest = int(lengths.max())
+    if exact and int(lengths.min()) == longest:
+        return max(longest, 1)
+    return max(longest + math.ceil(longest * STRING_LENGTH_HEADROOM), 1)
+
+
+def _text_length(inferred_type: str, params: Dict[str, Any]) -> int:
+    """Characters needed to hold a value of the given type as text."""
+    if inferred_type == 'string':
+        return params.get('max_length', 1)
+    if inferred_type == 'date':
+        return DATE_TEXT_LENGTH
+    if inferred_type == 'json':
+        return FALLBACK_PARAMETERS['string']['max_length']
+    scale = params.get('scale', 0)
+    return params.get('precision', 1) + (1 if scale else 0)
+
+
+def _add_histograms(left: List[int], right: List[int]) -> List[int]:
+    width = max(len(left), len(right))
+    return [
+        (left[i] if i < len(left) else 0) + (right[i] if i < len(right) else 0)
+        for i in range(width)
+    ]
+
+
+def _text_bytes(inferred_type: str, params: Dict[str, Any]) -> Optional[int]:
+    """UTF-8 bytes needed to hold a value of the given type as text; None when unknown."""
+    if inferred_type == 'string':
+        return params.get('max_bytes')
+    # Numbers and dates render as ASCII
+    return _text_length(inferred_type, params)
+
+
+def _snowflake_type(inferred_type: str, params: Dict[str, Any]) -> str:
+    if inferred_type == 'date':
+        return 'DATE'
+    if inferred_type == 'json':
+        return 'VARIANT'
+    if inferred_type in ('integer', 'float'):
+        return f"NUMBER({params['precision']}, {params.get('scale', 0)})"
+    return f"VARCHAR({params['max_length']})"